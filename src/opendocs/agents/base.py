@@ -8,13 +8,18 @@ across the Planner → Executor → Critic pipeline.
 
 from __future__ import annotations
 
+import time
 import uuid
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from functools import cached_property
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from ..core.knowledge_graph import KnowledgeGraph
 from ..core.models import DocumentModel
@@ -64,7 +69,7 @@ class ToolCall(BaseModel):
     """
 
     id: str = Field(default_factory=lambda: uuid.uuid4().hex[:12])
-    tool_name: str  # e.g. "diagram.render", "repo.search"
+    tool_name: str = ""  # e.g. "diagram.render", "repo.search"
     parameters: dict[str, Any] = Field(default_factory=dict)
     expected_output_type: str = ""  # e.g. "svg", "json", "markdown"
     status: ToolCallStatus = ToolCallStatus.PENDING
@@ -73,22 +78,55 @@ class ToolCall(BaseModel):
     evidence_pointers: list[str] = Field(default_factory=list)  # IDs
 
 
+# ---------------------------------------------------------------------------
+# Component records
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True, frozen=True)
+class Component:
+    """A discovered repo component (service, broker, IaC resource, ...).
+
+    Slots keep per-record memory a fraction of an equivalent dict and
+    make field access a C-level slot read instead of a hash lookup —
+    the specialized agents may hold thousands of these in a batch run.
+    Frozen so template instances can be shared without copying.
+    """
+
+    type: str  # e.g. "broker", "docker", "terraform-file"
+    tech: str  # e.g. "kafka", "terraform"; "" when not applicable
+    name: str
+    source: str | None = None  # originating path, if file-derived
+
+
 # ---------------------------------------------------------------------------
 # Plan models
 # ---------------------------------------------------------------------------
 
 
 class PlanStep(BaseModel):
-    """One step in an agent's execution plan."""
+    """One step in an agent's execution plan.
 
-    step_number: int
-    description: str
-    agent_role: AgentRole
+    Field defaults are deliberately LLM-friendly so a raw plan dict from
+    the model can be validated directly (see the planner's TypeAdapter).
+    """
+
+    step_number: int = 0
+    description: str = ""
+    agent_role: AgentRole = AgentRole.EXECUTOR
     tool_calls: list[ToolCall] = Field(default_factory=list)
     depends_on: list[int] = Field(default_factory=list)  # step_numbers
     expected_output: str = ""
     completed: bool = False
 
+    @field_validator("agent_role", mode="before")
+    @classmethod
+    def _coerce_role(cls, value: Any) -> Any:
+        """Map unknown role strings from the LLM to the generic executor."""
+        if isinstance(value, str) and value not in AgentRole._value2member_map_:
+            return AgentRole.EXECUTOR
+        return value
+
 
 class AgentPlan(BaseModel):
     """A structured, JSON-serialisable execution plan.
@@ -122,7 +160,13 @@ class AgentPlan(BaseModel):
 
 
 class AgentResult(BaseModel):
-    """The output of a single agent execution."""
+    """The output of a single agent execution.
+
+    ``artifacts`` may hold live ``BaseModel`` values (e.g. the planner's
+    ``AgentPlan``) or lists of :class:`Component` records; they stay
+    unserialized in-process and are dumped only at the serialization
+    boundary via :meth:`to_json_artifacts`.
+    """
 
     agent_role: AgentRole
     success: bool = True
@@ -133,6 +177,18 @@ class AgentResult(BaseModel):
     duration_ms: float = 0.0
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    def to_json_artifacts(self) -> dict[str, Any]:
+        """JSON-ready view of ``artifacts`` for disk/API boundaries."""
+        out: dict[str, Any] = {}
+        for key, value in self.artifacts.items():
+            if isinstance(value, BaseModel):
+                out[key] = value.model_dump(mode="json")
+            elif isinstance(value, list) and value and is_dataclass(value[0]):
+                out[key] = [asdict(item) for item in value]
+            else:
+                out[key] = value
+        return out
+
 
 # ---------------------------------------------------------------------------
 # Repo profile — lightweight repo summary fed to agents
@@ -168,7 +224,87 @@ class RepoProfile(BaseModel):
 
     def has_signal(self, signal_type: str) -> bool:
         """Check if a specific signal was detected."""
-        return any(s.signal_type == signal_type for s in self.signals)
+        return signal_type in self.signal_types
+
+    @cached_property
+    def signal_types(self) -> frozenset[str]:
+        """Detected signal types as a frozenset, built once per profile.
+
+        Every agent's discovery pass does membership tests against this;
+        frozenset makes the cached value safely shareable across the
+        concurrently-running sub-agents.
+        """
+        return frozenset(s.signal_type for s in self.signals)
+
+    @cached_property
+    def signals_joined(self) -> str:
+        """Comma-joined signal types, cached across re-plans on the same profile."""
+        return ", ".join([s.signal_type for s in self.signals])
+
+    @cached_property
+    def basename_index(self) -> dict[str, list[str]]:
+        """Paths grouped by basename, built lazily in one tree pass.
+
+        Agents probing for exact filenames (``Chart.yaml``, ...) get an
+        O(1) lookup instead of each rescanning the whole tree.
+        """
+        index: dict[str, list[str]] = {}
+        for path in self.file_tree:
+            index.setdefault(path.rpartition("/")[2], []).append(path)
+        return index
+
+    @cached_property
+    def suffix_index(self) -> dict[str, list[str]]:
+        """Paths grouped by final extension (dot included), built lazily."""
+        index: dict[str, list[str]] = {}
+        for path in self.file_tree:
+            base = path.rpartition("/")[2]
+            dot = base.rfind(".")
+            if dot >= 0:
+                index.setdefault(base[dot:], []).append(path)
+        return index
+
+
+# ---------------------------------------------------------------------------
+# Wire-format messages (msgspec) — fast path for LLM JSON responses
+# ---------------------------------------------------------------------------
+#
+# ``msgspec.json.decode(raw, type=AgentPlanMsg)`` validates and parses the
+# LLM reply in a single C-side pass, replacing the stdlib-json parse +
+# Pydantic validation + dict allocation chain. msgspec is optional — when
+# it is missing, callers fall back to ``chat_json`` + dict handling.
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
+
+if _HAS_MSGSPEC:
+
+    class ToolCallMsg(msgspec.Struct, frozen=True):
+        """Wire-format twin of :class:`ToolCall` for LLM plan responses."""
+
+        tool_name: str = ""
+        parameters: dict[str, Any] = {}
+
+    class PlanStepMsg(msgspec.Struct, frozen=True):
+        """Wire-format twin of :class:`PlanStep` for LLM plan responses."""
+
+        step_number: int = 0
+        description: str = ""
+        agent_role: str = "executor"
+        tool_calls: list[ToolCallMsg] = []
+        expected_output: str = ""
+
+    class AgentPlanMsg(msgspec.Struct, frozen=True):
+        """The JSON shape the Planner asks the LLM to emit."""
+
+        goal: str = ""
+        reasoning: str = ""
+        steps: list[PlanStepMsg] = []
 
 
 # ---------------------------------------------------------------------------
@@ -230,3 +366,36 @@ class AgentBase(ABC):
     def _make_result(self, **kwargs: Any) -> AgentResult:
         """Convenience factory for building an AgentResult with this agent's role."""
         return AgentResult(agent_role=self.role, **kwargs)
+
+    @asynccontextmanager
+    async def _timed_result(self) -> AsyncIterator[SimpleNamespace]:
+        """Collect a run's artifacts and time it uniformly.
+
+        Yields a mutable holder whose ``artifacts`` / ``metadata`` /
+        ``evidence_ids`` the run body fills in; on exit ``holder.result``
+        is the finished :class:`AgentResult` with ``duration_ms`` set.
+        An exception inside the block becomes a failed result instead of
+        propagating — previously a bare raise inside ``run()`` bypassed
+        duration accounting entirely.
+        """
+        t0 = time.perf_counter()
+        holder = SimpleNamespace(artifacts={}, metadata={}, evidence_ids=[], result=None)
+        try:
+            yield holder
+        except Exception as exc:
+            holder.result = self._make_result(
+                success=False,
+                artifacts=holder.artifacts,
+                evidence_ids=holder.evidence_ids,
+                errors=[f"{type(exc).__name__}: {exc}"],
+                duration_ms=(time.perf_counter() - t0) * 1000,
+                metadata=holder.metadata,
+            )
+        else:
+            holder.result = self._make_result(
+                success=True,
+                artifacts=holder.artifacts,
+                evidence_ids=holder.evidence_ids,
+                duration_ms=(time.perf_counter() - t0) * 1000,
+                metadata=holder.metadata,
+            )
@@ -13,6 +13,11 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from .base import _HAS_MSGSPEC
+
+if _HAS_MSGSPEC:
+    import msgspec
+
 # ---------------------------------------------------------------------------
 # Evidence pointer
 # ---------------------------------------------------------------------------
@@ -65,6 +70,24 @@ class EvidencePointer(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+# Optional msgspec wire twin — decoded straight from tool/LLM JSON output
+# without a Pydantic validation pass (see ``base`` for the import guard).
+if _HAS_MSGSPEC:
+
+    class EvidencePointerMsg(msgspec.Struct, frozen=True):
+        """Wire-format twin of :class:`EvidencePointer` for JSON payloads."""
+
+        evidence_type: str = ""
+        source_path: str = ""
+        section: str = ""
+        snippet: str = ""
+        line_start: Optional[int] = None
+        line_end: Optional[int] = None
+        commit_sha: str = ""
+        url: str = ""
+        confidence: float = 1.0
+
+
 # ---------------------------------------------------------------------------
 # Claim model (generated assertion + evidence links)
 # ---------------------------------------------------------------------------
@@ -3,6 +3,12 @@
 The Executor receives a plan step and dispatches tool calls to the
 appropriate MCP tool adapters. It collects results and evidence
 pointers, and returns them to the orchestrator.
+
+Dispatch is deliberately in-process: adapters are awaited directly and
+results stay native Python dicts, so a tool call costs no serialization
+or transport at all. Keep it that way — any socket hop (even a Unix
+domain socket) would add framing, a kernel round trip, and a JSON
+encode/decode to every repo.read/repo.search/repo.diff call.
 """
 
 from __future__ import annotations
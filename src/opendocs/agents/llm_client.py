@@ -10,7 +10,20 @@ Provides a thin wrapper around the multi-provider LLM system with:
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import hashlib
+import io
+import itertools
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Sequence, TextIO, TypeVar
+
+from pydantic import BaseModel
 
 from ..llm.providers import (
     DEFAULT_PROVIDER,
@@ -18,6 +31,122 @@ from ..llm.providers import (
     get_async_provider,
 )
 
+# ---------------------------------------------------------------------------
+# JSON serialization — orjson fast path
+# ---------------------------------------------------------------------------
+#
+# orjson encodes and decodes C-side, several times faster than stdlib
+# json on the large Markdown/Mermaid artifact strings, and serializes
+# dataclasses — including the slotted Component records — without an
+# intermediate asdict pass. Like msgspec it is optional; stdlib json is
+# the fallback.
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def _json_default(obj: Any) -> Any:
+    """Dump live model/dataclass values at the serialization boundary."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if _HAS_ORJSON:
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string (orjson fast path)."""
+        return orjson.dumps(obj, default=_json_default).decode()
+
+    def json_loads(raw: str | bytes) -> Any:
+        """Parse a JSON document (orjson fast path)."""
+        return orjson.loads(raw)
+
+    def json_dump_bytes(obj: Any) -> bytes:
+        """Serialize straight to UTF-8 bytes (orjson fast path).
+
+        For HTTP request bodies — orjson emits bytes natively, so the
+        socket write skips the str→bytes encode that ``json_dumps``
+        would force.
+        """
+        return orjson.dumps(obj, default=_json_default)
+
+else:
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string (stdlib fallback)."""
+        return json.dumps(obj, default=_json_default)
+
+    def json_loads(raw: str | bytes) -> Any:
+        """Parse a JSON document (stdlib fallback)."""
+        return json.loads(raw)
+
+    def json_dump_bytes(obj: Any) -> bytes:
+        """Serialize straight to UTF-8 bytes (stdlib fallback)."""
+        return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# On-disk response cache
+# ---------------------------------------------------------------------------
+
+
+class ResponseCache:
+    """Tiny on-disk cache for LLM JSON responses.
+
+    Two runs with identical (system, user, model) prompts produce the
+    same deterministic-temperature reply, so repeat runs (CI re-runs,
+    retries after transient failures) can skip the model call entirely.
+    Entries expire after ``ttl_seconds``. Callers handling sensitive
+    repos (STRICT privacy mode) should not pass a cache at all — data
+    that never leaves the process must not persist.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str | None = None,
+        *,
+        ttl_seconds: int = 86400,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(tempfile.gettempdir()) / "opendocs-llm-cache"
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(system: str, user: str, model: str) -> str:
+        """Stable digest of the normalized prompt triple."""
+        h = hashlib.blake2b(digest_size=20)
+        h.update(system.encode())
+        h.update(b"\x00")
+        h.update(user.encode())
+        h.update(b"\x00")
+        h.update(model.encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached response, or None on miss/expiry."""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            return json_loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, data: dict[str, Any]) -> None:
+        """Persist a response; cache failures are never fatal."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.json"
+            path.write_text(json_dumps(data), encoding="utf-8")
+        except (OSError, TypeError, ValueError):
+            pass
+
 # ---------------------------------------------------------------------------
 # Singleton provider
 # ---------------------------------------------------------------------------
@@ -50,6 +179,109 @@ def reset_client() -> None:
     _provider = None
 
 
+# ---------------------------------------------------------------------------
+# Prompt construction
+# ---------------------------------------------------------------------------
+
+# KG entity names included in agent prompts; trimmed further when an
+# agent discovered nothing, since the entities then carry most of the
+# prompt's weight without a component list to anchor them.
+MAX_KG_ENTITIES = 15
+MAX_KG_ENTITIES_SPARSE = 10
+
+# Components listed per prompt. Past the first few dozen entries extra
+# items add tokens — and therefore latency and cost — but no model
+# signal, so a repo with thousands of Terraform files still produces a
+# bounded prompt.
+MAX_PROMPT_COMPONENTS = 50
+
+
+def capped_desc(
+    items: Sequence[Any],
+    render: Callable[[Any], str],
+    *,
+    limit: int = MAX_PROMPT_COMPONENTS,
+    sep: str = "\n",
+    overflow: str = "- ... and {n} more",
+) -> str:
+    """Render at most ``limit`` items for a prompt, noting any overflow."""
+    shown = [render(item) for item in itertools.islice(items, limit)]
+    extra = len(items) - len(shown)
+    if extra > 0:
+        shown.append(overflow.format(n=extra))
+    return sep.join(shown)
+
+
+def compact_user_prompt(parts: Iterable[tuple[str, str]], closing: str = "") -> str:
+    """Join non-empty ``Label: value`` lines into a user prompt.
+
+    Empty and ``"N/A"`` values are dropped so prompts spend no tokens on
+    blank sections — per-call latency and cost scale roughly linearly
+    with prompt length. Multi-line values (e.g. a bullet list of
+    components) are placed on their own block under the label.
+    """
+    lines = []
+    for label, value in parts:
+        if not value or value == "N/A":
+            continue
+        lines.append(f"{label}:\n{value}" if "\n" in value else f"{label}: {value}")
+    if closing:
+        lines.append("")
+        lines.append(closing)
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Outbound concurrency cap
+# ---------------------------------------------------------------------------
+#
+# With the specialized agents (and their internal builders) running
+# concurrently, many completions can fire at once per repo — and a batch
+# run multiplies that. A single process-wide semaphore bounds in-flight
+# provider calls so bursts don't turn into 429 retry storms; genuine
+# rate-limit errors that still slip through are retried with exponential
+# backoff, honouring Retry-After when the provider exposes it.
+
+_LLM_SEM = asyncio.Semaphore(int(os.getenv("OPENDOCS_LLM_CONCURRENCY", "8")))
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BASE_DELAY = 1.0
+
+_T = TypeVar("_T")
+
+
+def _is_rate_limit(exc: Exception) -> bool:
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    text = str(exc)
+    return "429" in text or "rate limit" in text.lower()
+
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+async def _call_with_limit(call: Callable[[], Awaitable[_T]]) -> _T:
+    """Run one provider call under the global cap, retrying rate limits."""
+    delay = _RATE_LIMIT_BASE_DELAY
+    for attempt in range(_RATE_LIMIT_RETRIES + 1):
+        async with _LLM_SEM:
+            try:
+                return await call()
+            except Exception as exc:
+                if attempt >= _RATE_LIMIT_RETRIES or not _is_rate_limit(exc):
+                    raise
+                wait = _retry_after_seconds(exc)
+        await asyncio.sleep(wait if wait is not None else delay)
+        delay *= 2
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
 # ---------------------------------------------------------------------------
 # High-level helpers
 # ---------------------------------------------------------------------------
@@ -68,7 +300,95 @@ async def chat_text(
 ) -> str:
     """Return a plain-text completion."""
     client = get_client(api_key, provider=provider, model=model, base_url=base_url)
-    return await client.chat(system, user)
+    return await _call_with_limit(lambda: client.chat(system, user))
+
+
+# In-memory LRU tier for chat_text_cached: serves repeat prompts within
+# one process without touching disk, capped so batch runs over many
+# repos cannot grow it unbounded.
+_TEXT_MEM: OrderedDict[str, str] = OrderedDict()
+_TEXT_MEM_MAX = 256
+
+
+def _remember_text(key: str, text: str) -> None:
+    _TEXT_MEM[key] = text
+    _TEXT_MEM.move_to_end(key)
+    while len(_TEXT_MEM) > _TEXT_MEM_MAX:
+        _TEXT_MEM.popitem(last=False)
+
+
+async def chat_text_cached(
+    *,
+    system: str,
+    user: str,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.3,
+    max_tokens: int = 2048,
+    api_key: str | None = None,
+    provider: str = DEFAULT_PROVIDER,
+    base_url: str | None = None,
+    cache: ResponseCache | None = None,
+    sink: TextIO | None = None,
+) -> str:
+    """``chat_text`` with prompt-keyed caching.
+
+    Identical ``(system, user, model)`` prompts — re-runs over the same
+    repo, CI retries, agents sharing a prompt — skip the network
+    round-trip entirely. Lookups go through a small in-process LRU
+    first, then the optional on-disk ``cache``. The in-memory tier
+    never persists anything, so it is safe under STRICT privacy; only
+    pass ``cache`` when persistence is acceptable.
+
+    When ``sink`` is given, the reply is streamed through
+    :func:`chat_stream` and each chunk is written to the sink as it
+    arrives, so a downstream writer (file, next pipeline stage) starts
+    before the model finishes; cache hits write the stored text in one
+    go.
+    """
+    key = ResponseCache.make_key(system, user, model)
+    hit = _TEXT_MEM.get(key)
+    if hit is not None:
+        _TEXT_MEM.move_to_end(key)
+        if sink is not None:
+            sink.write(hit)
+        return hit
+    if cache is not None:
+        disk = cache.get(key)
+        if disk is not None and "text" in disk:
+            _remember_text(key, disk["text"])
+            if sink is not None:
+                sink.write(disk["text"])
+            return disk["text"]
+    if sink is None:
+        text = await chat_text(
+            system=system,
+            user=user,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            api_key=api_key,
+            provider=provider,
+            base_url=base_url,
+        )
+    else:
+        buf = io.StringIO()
+        async for chunk in chat_stream(
+            system=system,
+            user=user,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            api_key=api_key,
+            provider=provider,
+            base_url=base_url,
+        ):
+            buf.write(chunk)
+            sink.write(chunk)
+        text = buf.getvalue()
+    if cache is not None:
+        cache.set(key, {"text": text})
+    _remember_text(key, text)
+    return text
 
 
 async def chat_json(
@@ -81,6 +401,7 @@ async def chat_json(
     api_key: str | None = None,
     provider: str = DEFAULT_PROVIDER,
     base_url: str | None = None,
+    cache: ResponseCache | None = None,
 ) -> dict[str, Any]:
     """Return a parsed JSON dict from the model.
 
@@ -89,6 +410,97 @@ async def chat_json(
     - Anthropic: guided via system prompt
     - Gemini: ``response_mime_type``
     - Ollama: ``response_format`` where supported
+
+    When ``cache`` is given, identical prompts are served from disk
+    without hitting the model.
     """
+    if cache is not None:
+        key = ResponseCache.make_key(system, user, model)
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
     client = get_client(api_key, provider=provider, model=model, base_url=base_url)
-    return await client.chat_json(system, user)
+    data = await _call_with_limit(lambda: client.chat_json(system, user))
+    if cache is not None:
+        cache.set(key, data)
+    return data
+
+
+async def chat_stream(
+    *,
+    system: str,
+    user: str,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.2,
+    max_tokens: int = 4096,
+    api_key: str | None = None,
+    provider: str = DEFAULT_PROVIDER,
+    base_url: str | None = None,
+) -> AsyncIterator[str]:
+    """Stream a completion as text chunks.
+
+    Providers without native streaming yield the full reply as one chunk.
+    """
+    client = get_client(api_key, provider=provider, model=model, base_url=base_url)
+    # The cap is held for the whole stream — the connection stays open
+    # until the model finishes.
+    async with _LLM_SEM:
+        async for chunk in client.chat_stream(system, user):
+            yield chunk
+
+
+_StructT = TypeVar("_StructT")
+
+
+def _strip_code_fences(raw: str) -> str:
+    """Strip ```json ... ``` wrappers some models add around JSON replies."""
+    text = raw.strip()
+    if text.startswith("```"):
+        lines = text.splitlines()
+        if lines[-1].strip() == "```":
+            text = "\n".join(lines[1:-1])
+        else:
+            text = "\n".join(lines[1:])
+        text = text.strip()
+    return text
+
+
+async def chat_struct(
+    struct_type: type[_StructT],
+    *,
+    system: str,
+    user: str,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.2,
+    max_tokens: int = 4096,
+    api_key: str | None = None,
+    provider: str = DEFAULT_PROVIDER,
+    base_url: str | None = None,
+    cache: ResponseCache | None = None,
+) -> _StructT:
+    """Decode the model's JSON reply directly into a ``msgspec.Struct``.
+
+    Unlike ``chat_json`` (stdlib parse → dict → Pydantic validation),
+    this performs a single C-side decode+validate pass via
+    ``msgspec.json.decode``. Requires the optional ``msgspec`` package.
+    """
+    import msgspec
+
+    if cache is not None:
+        key = ResponseCache.make_key(system, user, model)
+        hit = cache.get(key)
+        if hit is not None and "raw" in hit:
+            return msgspec.json.decode(hit["raw"].encode(), type=struct_type)
+
+    client = get_client(api_key, provider=provider, model=model, base_url=base_url)
+    raw = await _call_with_limit(
+        lambda: client.chat(
+            system + "\n\nRespond with valid JSON only. No markdown, no commentary.",
+            user,
+        )
+    )
+    text = _strip_code_fences(raw)
+    result = msgspec.json.decode(text.encode(), type=struct_type)
+    if cache is not None:
+        cache.set(key, {"raw": text})
+    return result
@@ -14,6 +14,8 @@ the deterministic baseline — it never overwrites existing pipeline output.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import time
 from pathlib import Path
 from typing import Any
@@ -22,10 +24,17 @@ from rich.console import Console
 
 from ..core.knowledge_graph import KnowledgeGraph
 from ..core.models import DocumentModel
-from .base import AgentPlan, AgentResult, AgentRole, PlanStep, RepoProfile
+from .base import AgentPlan, AgentResult, AgentRole, Component, PlanStep, RepoProfile
 from .critic import CriticAgent
 from .evidence import EvidenceRegistry
 from .executor import ExecutorAgent
+from .llm_client import (
+    MAX_KG_ENTITIES,
+    capped_desc,
+    chat_json,
+    compact_user_prompt,
+    json_dumps,
+)
 from .planner import PlannerAgent
 from .privacy import PrivacyGuard, PrivacyMode
 
@@ -53,6 +62,84 @@ _SUB_AGENT_CLASSES: dict[AgentRole, type] = {
     AgentRole.INFRA: InfraAgent,
 }
 
+# Upper bound on sub-agent LLM calls in flight at once.
+_MAX_CONCURRENT_SUB_AGENTS = 8
+
+
+# ---------------------------------------------------------------------------
+# Batched section generation
+# ---------------------------------------------------------------------------
+
+# Per-role instruction for the batched multi-section call. Keys of the
+# returned envelope are the role values, which is what each agent looks
+# up in ``precomputed_sections``.
+_SECTION_INSTRUCTIONS: dict[AgentRole, str] = {
+    AgentRole.MICROSERVICES: (
+        "an architecture overview for the discovered services: service "
+        "descriptions, communication patterns, deployment topology, scaling"
+    ),
+    AgentRole.EVENT_DRIVEN: (
+        "an event architecture section: message brokers, event schemas, "
+        "consumer groups, retry/DLQ policies"
+    ),
+    AgentRole.ML: (
+        "an ML architecture section: training pipeline, inference serving, "
+        "data flow, experiment tracking"
+    ),
+    AgentRole.DATA_ENGINEERING: (
+        "a data pipeline section: data sources, transformations, lineage, "
+        "partitioning, SLAs, monitoring"
+    ),
+    AgentRole.INFRA: (
+        "an infrastructure section: resource inventory, deployment topology, "
+        "networking, scaling, operational runbooks"
+    ),
+}
+
+
+async def build_all_sections_llm(
+    *,
+    repo_profile: RepoProfile,
+    knowledge_graph: KnowledgeGraph,
+    components_by_agent: dict[AgentRole, list[Component]],
+    model: str = "gpt-4o-mini",
+) -> dict[str, str]:
+    """Generate every requested agent section in one JSON LLM call.
+
+    The specialized agents' section prompts share most of their weight —
+    repo context, KG entities, "write a Markdown section about X". Asking
+    the model for a JSON envelope keyed by agent role cuts the round-trips
+    from one per agent to one total and amortizes the shared context
+    tokens across all sections. Agents whose key is missing from the
+    result fall back to their individual calls.
+    """
+    roles = [role for role in _SECTION_INSTRUCTIONS if role in components_by_agent]
+    entities = ", ".join(e.name for e in knowledge_graph.entities[:MAX_KG_ENTITIES])
+    parts = [
+        ("Repository", repo_profile.repo_name),
+        ("Description", repo_profile.description[:300]),
+        ("KG entities", entities),
+    ]
+    for role in roles:
+        comp_desc = capped_desc(
+            components_by_agent[role], lambda c: f"- {c.name} ({c.tech}, {c.type})"
+        )
+        parts.append((f"Components for '{role.value}'", comp_desc))
+
+    spec = "\n".join(f'- "{role.value}": {_SECTION_INSTRUCTIONS[role]}' for role in roles)
+    data = await chat_json(
+        system=(
+            "You are a senior technical documentation specialist. Return a "
+            "JSON object with exactly these keys, each holding one Markdown "
+            "section with ## headers, specific to the listed components:\n" + spec
+        ),
+        user=compact_user_prompt(parts, closing="Write all sections now."),
+        model=model,
+        max_tokens=4096,
+    )
+    wanted = {role.value for role in roles}
+    return {key: value for key, value in data.items() if key in wanted and isinstance(value, str) and value}
+
 
 # ---------------------------------------------------------------------------
 # Orchestrator result
@@ -89,6 +176,18 @@ class OrchestrationResult:
             return False
         return self.critic_result.success
 
+    def save_artifacts(self, path: Path | str) -> Path:
+        """Persist the enhanced artifacts as JSON.
+
+        Live ``BaseModel`` / ``Component`` values in ``enhanced_artifacts``
+        are dumped here, at the serialization boundary, via the
+        orjson-backed ``json_dumps`` — the artifact dicts carry large
+        Markdown/Mermaid strings where stdlib json encoding dominates.
+        """
+        path = Path(path)
+        path.write_text(json_dumps(self.enhanced_artifacts), encoding="utf-8")
+        return path
+
     def summary(self) -> dict[str, Any]:
         return {
             "approved": self.approved,
@@ -127,6 +226,7 @@ class AgentOrchestrator:
         privacy_mode: PrivacyMode = PrivacyMode.STANDARD,
         max_retries: int = 2,
         output_dir: Path | str = ".",
+        llm_cache_ttl_seconds: int | None = None,
     ) -> None:
         self.model = model
         self.max_retries = max_retries
@@ -136,8 +236,12 @@ class AgentOrchestrator:
         self._evidence = EvidenceRegistry()
         self._privacy = PrivacyGuard(mode=privacy_mode)
 
-        # Core agents
-        self._planner = PlannerAgent(model=model)
+        # Core agents. STRICT privacy forbids persisting prompts/responses,
+        # so the on-disk LLM response cache is only enabled below it.
+        self._planner = PlannerAgent(
+            model=model,
+            cache_ttl_seconds=llm_cache_ttl_seconds if privacy_mode != PrivacyMode.STRICT else None,
+        )
         self._executor = ExecutorAgent(
             model=model,
             privacy_guard=self._privacy,
@@ -151,6 +255,13 @@ class AgentOrchestrator:
         # Sub-agent cache (instantiated on demand)
         self._sub_agents: dict[AgentRole, Any] = {}
 
+        # Bounds concurrent sub-agent (and therefore LLM) calls in flight.
+        self._sub_agent_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SUB_AGENTS)
+
+        # Plan cache keyed on (safe_profile, prior-results digest) — skips a
+        # redundant planner LLM call when a retry sees identical inputs.
+        self._plan_cache: dict[str, AgentPlan] = {}
+
     async def run(
         self,
         *,
@@ -174,27 +285,95 @@ class AgentOrchestrator:
             console.print(f"[bold cyan]Agent loop iteration {attempt}[/bold cyan]")
 
             # ── 1. PLAN ──────────────────────────────────────────────
-            console.print("  [dim]Planning...[/dim]")
-            planner_result = await self._planner.run(
-                repo_profile=safe_profile,
-                knowledge_graph=knowledge_graph,
-                document=document,
-                prior_results=all_step_results if attempt > 1 else None,
-                use_llm=use_llm,
-            )
-            if not planner_result.success:
-                console.print("[red]  Planner failed[/red]")
-                break
+            # The planner LLM call dominates pipeline cost; if a retry sees
+            # the exact same effective inputs, reuse the previous plan.
+            plan_key = hashlib.blake2b(
+                f"{safe_profile.model_dump_json()}|{len(all_step_results)}".encode()
+            ).hexdigest()
+            cached_plan = self._plan_cache.get(plan_key)
+            if cached_plan is not None:
+                current_plan = cached_plan
+                console.print("  [dim]Reusing cached plan (inputs unchanged)[/dim]")
+            else:
+                console.print("  [dim]Planning...[/dim]")
+                planner_result = await self._planner.run(
+                    repo_profile=safe_profile,
+                    knowledge_graph=knowledge_graph,
+                    document=document,
+                    prior_results=all_step_results if attempt > 1 else None,
+                    use_llm=use_llm,
+                )
+                if not planner_result.success:
+                    console.print("[red]  Planner failed[/red]")
+                    break
 
-            current_plan = AgentPlan(**planner_result.artifacts["plan"])
+                plan_artifact = planner_result.artifacts["plan"]
+                current_plan = (
+                    plan_artifact if isinstance(plan_artifact, AgentPlan) else AgentPlan(**plan_artifact)
+                )
+                self._plan_cache[plan_key] = current_plan
             console.print(f"  Plan: {current_plan.total_steps} steps, goal: {current_plan.goal}")
 
             # ── 2. EXECUTE ───────────────────────────────────────────
+            # Consecutive specialized sub-agent steps that don't depend on
+            # each other run concurrently — wall clock drops from the sum
+            # of their LLM latencies to the max.
             step_results: list[AgentResult] = []
-            for step in current_plan.steps:
-                if step.agent_role == AgentRole.CRITIC:
-                    continue  # Critic runs after all execution steps
-
+            exec_steps = [s for s in current_plan.steps if s.agent_role != AgentRole.CRITIC]
+            i = 0
+            while i < len(exec_steps):
+                group = self._independent_sub_agent_group(exec_steps, i)
+                if len(group) > 1:
+                    # One batched LLM call covers every section in the
+                    # group; each agent reads its section from the dict
+                    # and skips its own round-trip. On any failure the
+                    # agents simply make their individual calls.
+                    precomputed: dict[str, str] | None = None
+                    if use_llm:
+                        try:
+                            components_by_agent = {
+                                step.agent_role: self._get_sub_agent(step.agent_role).discover_components(safe_profile)
+                                for step in group
+                            }
+                            precomputed = await build_all_sections_llm(
+                                repo_profile=safe_profile,
+                                knowledge_graph=knowledge_graph,
+                                components_by_agent=components_by_agent,
+                                model=self.model,
+                            )
+                        except Exception:
+                            precomputed = None
+                    for step in group:
+                        console.print(f"  [dim]Step {step.step_number}: {step.description} (concurrent)[/dim]")
+                    results = await asyncio.gather(
+                        *(
+                            self._execute_step_bounded(
+                                step=step,
+                                repo_profile=safe_profile,
+                                knowledge_graph=knowledge_graph,
+                                document=document,
+                                plan=current_plan,
+                                prior_results=step_results,
+                                use_llm=use_llm,
+                                precomputed_sections=precomputed,
+                            )
+                            for step in group
+                        ),
+                        return_exceptions=True,
+                    )
+                    for step, result in zip(group, results):
+                        if isinstance(result, BaseException):
+                            result = AgentResult(
+                                agent_role=step.agent_role,
+                                success=False,
+                                errors=[str(result)],
+                            )
+                        step_results.append(result)
+                        step.completed = result.success
+                    i += len(group)
+                    continue
+
+                step = exec_steps[i]
                 console.print(f"  [dim]Step {step.step_number}: {step.description}[/dim]")
 
                 result = await self._execute_step(
@@ -208,6 +387,7 @@ class AgentOrchestrator:
                 )
                 step_results.append(result)
                 step.completed = result.success
+                i += 1
 
             all_step_results.extend(step_results)
 
@@ -228,6 +408,10 @@ class AgentOrchestrator:
                 break
             else:
                 console.print(f"[yellow]  ✗ Critic rejected: {verdict.get('replan_reason', '?')}[/yellow]")
+                # The rejection changes the planner's effective inputs —
+                # drop the cached plan so the retry genuinely re-plans.
+                if verdict.get("replan_reason"):
+                    self._plan_cache.pop(plan_key, None)
                 if attempt > self.max_retries:
                     console.print("[red]  Max retries reached[/red]")
                     break
@@ -250,6 +434,29 @@ class AgentOrchestrator:
 
     # -- Internal -----------------------------------------------------------
 
+    @staticmethod
+    def _independent_sub_agent_group(exec_steps: list[PlanStep], start: int) -> list[PlanStep]:
+        """Collect the run of specialized steps at ``start`` that can run concurrently.
+
+        Steps qualify while they target a specialized sub-agent and none of
+        them depends on another step inside the group.
+        """
+        group: list[PlanStep] = []
+        group_numbers: set[int] = set()
+        for step in exec_steps[start:]:
+            if step.agent_role not in _SUB_AGENT_CLASSES:
+                break
+            if group_numbers & set(step.depends_on):
+                break
+            group.append(step)
+            group_numbers.add(step.step_number)
+        return group
+
+    async def _execute_step_bounded(self, **kwargs: Any) -> AgentResult:
+        """Run ``_execute_step`` under the shared concurrency semaphore."""
+        async with self._sub_agent_semaphore:
+            return await self._execute_step(**kwargs)
+
     async def _execute_step(
         self,
         *,
@@ -260,6 +467,7 @@ class AgentOrchestrator:
         plan: AgentPlan,
         prior_results: list[AgentResult],
         use_llm: bool = True,
+        precomputed_sections: dict[str, str] | None = None,
     ) -> AgentResult:
         """Route a plan step to the appropriate agent."""
 
@@ -273,6 +481,7 @@ class AgentOrchestrator:
                 plan=plan,
                 prior_results=prior_results,
                 use_llm=use_llm,
+                precomputed_sections=precomputed_sections,
             )
 
         # Otherwise, use the generic executor
@@ -9,11 +9,16 @@ sub-agents to activate based on detected repo signals.
 from __future__ import annotations
 
 import time
-from typing import Any
+import uuid
+from functools import lru_cache
+from typing import Any, AsyncIterator
+
+from pydantic import TypeAdapter
 
 from ..core.knowledge_graph import KnowledgeGraph
 from ..core.models import DocumentModel
 from .base import (
+    _HAS_MSGSPEC,
     AgentBase,
     AgentPlan,
     AgentResult,
@@ -22,7 +27,14 @@ from .base import (
     RepoProfile,
     ToolCall,
 )
-from .llm_client import chat_json
+from .llm_client import ResponseCache, chat_json, chat_stream, chat_struct
+
+if _HAS_MSGSPEC:
+    from .base import AgentPlanMsg
+
+# Built once at import — validates a raw LLM steps array in a single
+# pydantic-core (Rust) pass rather than per-field Python dict lookups.
+_PLAN_STEPS_ADAPTER: TypeAdapter[list[PlanStep]] = TypeAdapter(list[PlanStep])
 
 # ---------------------------------------------------------------------------
 # Signal → sub-agent routing table
@@ -54,6 +66,150 @@ _SIGNAL_TO_AGENT: dict[str, AgentRole] = {
     "warehouse": AgentRole.DATA_ENGINEERING,
 }
 
+# Inverted routing table: role → set of signals, for one-pass detection by
+# set intersection. _ROLE_ORDER fixes the (value-sorted) output order once
+# at import so _detect_sub_agents needs no per-call sort.
+_AGENT_TO_SIGNALS: dict[AgentRole, frozenset[str]] = {
+    role: frozenset(sig for sig, r in _SIGNAL_TO_AGENT.items() if r is role)
+    for role in set(_SIGNAL_TO_AGENT.values())
+}
+_ROLE_ORDER: tuple[AgentRole, ...] = tuple(sorted(_AGENT_TO_SIGNALS, key=lambda r: r.value))
+
+# Branchless role parsing: a dict probe with an executor default replaces
+# the per-step try/except around AgentRole(...).
+_ROLE_BY_VALUE: dict[str, AgentRole] = {r.value: r for r in AgentRole}
+
+
+# ---------------------------------------------------------------------------
+# Static system prompt prefix
+# ---------------------------------------------------------------------------
+#
+# Kept byte-identical across runs (all roles enumerated, no per-repo text)
+# so providers with prefix-based prompt caching (OpenAI automatic caching,
+# Anthropic prompt caching) can reuse the KV cache between planner calls.
+# Per-repo context (activated sub-agents, signals, file tree) goes in the
+# user message instead.
+
+_PLANNER_SYSTEM_PREFIX = (
+    "You are a documentation planning agent. You produce JSON execution plans "
+    "for generating enhanced documentation from a GitHub repository.\n\n"
+    "Available tools: repo.search, repo.read, repo.diff, repo.summarize, "
+    "diagram.render, chart.generate, docx.refine, pptx.refine.\n"
+    "Specialized sub-agent roles: microservices, event_driven, ml, "
+    "data_engineering, infra.\n\n"
+    "IMPORTANT RULES:\n"
+    "1. You MUST use the specialized sub-agent roles for steps they can handle.\n"
+    '   - Use "microservices" role for Docker, K8s, service architecture steps.\n'
+    '   - Use "ml" role for ML models, training, inference steps.\n'
+    '   - Use "infra" role for Terraform, Helm, cloud infra steps.\n'
+    '   - Use "event_driven" role for Kafka, SQS, message queue steps.\n'
+    '   - Use "data_engineering" role for Airflow, dbt, Spark, pipeline steps.\n'
+    '2. Only use "executor" role for generic steps not covered by a specialized agent.\n'
+    '3. Always end with a "critic" step.\n'
+    "4. Each step should produce a concrete documentation artifact.\n"
+    "5. Only assign sub-agent roles that are listed as activated in the user message.\n\n"
+    "Return JSON with keys: goal (string), reasoning (string), "
+    "steps (array of objects with: step_number, description, agent_role "
+    "[one of: microservices, event_driven, ml, data_engineering, infra, "
+    "executor, critic], "
+    "tool_calls (array of {tool_name, parameters}), expected_output)."
+)
+
+
+# ---------------------------------------------------------------------------
+# Deterministic plan templates
+# ---------------------------------------------------------------------------
+#
+# The fallback plan is mostly boilerplate; the constant steps are built once
+# at import (or memoized per activated-agent combination) and deep-copied
+# into each plan so the orchestrator can still mutate ``completed`` flags.
+
+_SEARCH_STEP_TEMPLATE = PlanStep(
+    step_number=1,
+    description="Search repo for architecture-relevant files",
+    agent_role=AgentRole.EXECUTOR,
+    tool_calls=[
+        ToolCall(
+            tool_name="repo.search",
+            parameters={
+                "query": "docker|kubernetes|terraform|setup|config",
+                "max_results": 50,
+            },
+            expected_output_type="json",
+        ),
+    ],
+    expected_output="List of architecture-relevant file paths",
+)
+
+
+@lru_cache(maxsize=128)
+def _sub_agent_step_templates(role_values: tuple[str, ...]) -> tuple[PlanStep, ...]:
+    """Memoized sub-agent step templates for one activated-agent combination."""
+    return tuple(
+        PlanStep(
+            step_number=3 + idx,
+            description=f"Run {value} sub-agent for domain-specific analysis",
+            agent_role=AgentRole(value),
+            tool_calls=[],  # sub-agents generate their own tool calls
+            depends_on=[1],
+            expected_output=f"Domain diagrams + sections from {value}",
+        )
+        for idx, value in enumerate(role_values)
+    )
+
+
+def _scan_step_objects(buffer: str) -> list[str]:
+    """Return the JSON source of each *complete* object in the ``steps`` array.
+
+    Minimal incremental scanner for partially-received LLM output: finds
+    the ``"steps"`` array and walks it with brace/string tracking, so
+    complete step objects can be parsed while the tail is still streaming.
+    """
+    start = buffer.find('"steps"')
+    if start == -1:
+        return []
+    start = buffer.find("[", start)
+    if start == -1:
+        return []
+
+    objects: list[str] = []
+    depth = 0
+    in_string = False
+    escaped = False
+    obj_start = -1
+    for i in range(start + 1, len(buffer)):
+        ch = buffer[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch == "{":
+            if depth == 0:
+                obj_start = i
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0 and obj_start >= 0:
+                objects.append(buffer[obj_start : i + 1])
+                obj_start = -1
+        elif ch == "]" and depth == 0:
+            break  # end of the steps array
+    return objects
+
+
+def _fresh_step(template: PlanStep) -> PlanStep:
+    """Deep-copy a step template, regenerating tool-call IDs."""
+    step = template.model_copy(deep=True)
+    for tc in step.tool_calls:
+        tc.id = uuid.uuid4().hex[:12]
+    return step
+
 
 class PlannerAgent(AgentBase):
     """Analyses repo signals and KG to produce an execution plan.
@@ -65,8 +221,17 @@ class PlannerAgent(AgentBase):
     4. What evidence to gather first.
     """
 
-    def __init__(self, model: str = "gpt-4o-mini") -> None:
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        *,
+        cache_ttl_seconds: int | None = None,
+    ) -> None:
         super().__init__(role=AgentRole.PLANNER, model=model)
+        # Optional on-disk response cache: identical repo fingerprints get
+        # identical plans without re-paying the LLM call. Left off unless a
+        # TTL is given; STRICT privacy mode must never enable it.
+        self._response_cache = ResponseCache(ttl_seconds=cache_ttl_seconds) if cache_ttl_seconds else None
 
     async def run(
         self,
@@ -109,9 +274,11 @@ class PlannerAgent(AgentBase):
             )
 
         duration = (time.perf_counter() - t0) * 1000
+        # The live model goes into artifacts as-is; serialization happens
+        # lazily at the boundary via AgentResult.to_json_artifacts().
         return self._make_result(
             success=True,
-            artifacts={"plan": built_plan.model_dump()},
+            artifacts={"plan": built_plan},
             duration_ms=duration,
             metadata={
                 "activated_agents": [a.value for a in activated_agents],
@@ -123,54 +290,30 @@ class PlannerAgent(AgentBase):
 
     def _detect_sub_agents(self, profile: RepoProfile) -> list[AgentRole]:
         """Map repo signals to specialized sub-agents."""
-        agents: set[AgentRole] = set()
-        for signal in profile.signals:
-            role = _SIGNAL_TO_AGENT.get(signal.signal_type)
-            if role:
-                agents.add(role)
-        return sorted(agents, key=lambda r: r.value)
+        sig_set = profile.signal_types
+        return [role for role in _ROLE_ORDER if _AGENT_TO_SIGNALS[role] & sig_set]
 
-    async def _build_plan_llm(
+    def _plan_prompts(
         self,
         *,
         repo_profile: RepoProfile,
         knowledge_graph: KnowledgeGraph,
         activated_agents: list[AgentRole],
-    ) -> AgentPlan:
-        """LLM-powered plan construction."""
-        entities_str = ", ".join(e.name for e in knowledge_graph.entities[:25])
-        relations_str = ", ".join(f"{r.source_id}->{r.target_id}" for r in knowledge_graph.relations[:20])
-        signals_str = ", ".join(s.signal_type for s in repo_profile.signals) or "none"
-        agents_str = ", ".join(a.value for a in activated_agents) or "none"
-        _mermaid_spec = knowledge_graph.to_mermaid(max_entities=30)
-
-        system = (
-            "You are a documentation planning agent. You produce JSON execution plans "
-            "for generating enhanced documentation from a GitHub repository.\n\n"
-            "Available tools: repo.search, repo.read, repo.diff, repo.summarize, "
-            "diagram.render, chart.generate, docx.refine, pptx.refine.\n"
-            "Available specialized sub-agents: " + agents_str + "\n\n"
-            "IMPORTANT RULES:\n"
-            "1. You MUST use the specialized sub-agent roles for steps they can handle.\n"
-            '   - Use "microservices" role for Docker, K8s, service architecture steps.\n'
-            '   - Use "ml" role for ML models, training, inference steps.\n'
-            '   - Use "infra" role for Terraform, Helm, cloud infra steps.\n'
-            '   - Use "event_driven" role for Kafka, SQS, message queue steps.\n'
-            '   - Use "data_engineering" role for Airflow, dbt, Spark, pipeline steps.\n'
-            '2. Only use "executor" role for generic steps not covered by a specialized agent.\n'
-            '3. Always end with a "critic" step.\n'
-            "4. Each step should produce a concrete documentation artifact.\n\n"
-            "Return JSON with keys: goal (string), reasoning (string), "
-            "steps (array of objects with: step_number, description, agent_role "
-            "[one of: " + agents_str + ", executor, critic], "
-            "tool_calls (array of {tool_name, parameters}), expected_output)."
-        )
+    ) -> tuple[str, str]:
+        """Build the (system, user) prompt pair for plan generation."""
+        # Materialized-list joins: str.join over a list runs at C speed,
+        # unlike the generator variant which round-trips per element.
+        entities_str = ", ".join([e.name for e in knowledge_graph.entities[:25]])
+        relations_str = ", ".join([f"{r.source_id}->{r.target_id}" for r in knowledge_graph.relations[:20]])
+        signals_str = repo_profile.signals_joined or "none"
+        agents_str = ", ".join([a.value for a in activated_agents]) or "none"
 
         user = (
             f"Repository: {repo_profile.repo_name}\n"
             f"URL: {repo_profile.repo_url}\n"
             f"Description: {repo_profile.description[:300]}\n"
             f"Language: {repo_profile.primary_language}\n"
+            f"Activated sub-agents: {agents_str}\n"
             f"Signals detected: {signals_str}\n"
             f"KG entities: {entities_str}\n"
             f"KG relations: {relations_str}\n"
@@ -179,41 +322,104 @@ class PlannerAgent(AgentBase):
             f"Create an optimal documentation enhancement plan. "
             f"Always end with a critic validation step."
         )
+        return _PLANNER_SYSTEM_PREFIX, user
 
-        data = await chat_json(
-            system=system,
+    async def stream_plan_llm(
+        self,
+        *,
+        repo_profile: RepoProfile,
+        knowledge_graph: KnowledgeGraph,
+        activated_agents: list[AgentRole] | None = None,
+    ) -> AsyncIterator[PlanStep]:
+        """Yield ``PlanStep``s incrementally as the LLM streams its plan.
+
+        Callers can start dispatching step 1's tool calls while later
+        steps are still being generated, instead of waiting for the full
+        4096-token JSON blob. Providers without native streaming fall
+        back to a single chunk, which degrades to batch behaviour.
+        """
+        if activated_agents is None:
+            activated_agents = self._detect_sub_agents(repo_profile)
+        system, user = self._plan_prompts(
+            repo_profile=repo_profile,
+            knowledge_graph=knowledge_graph,
+            activated_agents=activated_agents,
+        )
+
+        buffer: list[str] = []
+        emitted = 0
+        async for chunk in chat_stream(
+            system=system + "\n\nRespond with valid JSON only. No markdown, no commentary.",
             user=user,
             model=self.model,
             max_tokens=4096,
+        ):
+            buffer.append(chunk)
+            for src in _scan_step_objects("".join(buffer))[emitted:]:
+                step = PlanStep.model_validate_json(src)
+                emitted += 1
+                if not step.step_number:
+                    step.step_number = emitted
+                yield step
+
+    async def _build_plan_llm(
+        self,
+        *,
+        repo_profile: RepoProfile,
+        knowledge_graph: KnowledgeGraph,
+        activated_agents: list[AgentRole],
+    ) -> AgentPlan:
+        """LLM-powered plan construction."""
+        system, user = self._plan_prompts(
+            repo_profile=repo_profile,
+            knowledge_graph=knowledge_graph,
+            activated_agents=activated_agents,
         )
 
-        # Parse LLM response into AgentPlan
+        # Fast path: msgspec decodes+validates the reply in one C-side pass.
+        # Fallback: chat_json (stdlib parse → dict) when msgspec is absent.
         steps: list[PlanStep] = []
-        for raw_step in data.get("steps", []):
-            role_str = raw_step.get("agent_role", "executor")
-            try:
-                role = AgentRole(role_str)
-            except ValueError:
-                role = AgentRole.EXECUTOR
-
-            tool_calls = []
-            for raw_tc in raw_step.get("tool_calls", []):
-                tool_calls.append(
-                    ToolCall(
-                        tool_name=raw_tc.get("tool_name", ""),
-                        parameters=raw_tc.get("parameters", {}),
+        if _HAS_MSGSPEC:
+            msg = await chat_struct(
+                AgentPlanMsg,
+                system=system,
+                user=user,
+                model=self.model,
+                max_tokens=4096,
+                cache=self._response_cache,
+            )
+            goal = msg.goal
+            reasoning = msg.reasoning
+            for raw_step in msg.steps:
+                role = _ROLE_BY_VALUE.get(raw_step.agent_role, AgentRole.EXECUTOR)
+                steps.append(
+                    PlanStep(
+                        step_number=raw_step.step_number or len(steps) + 1,
+                        description=raw_step.description,
+                        agent_role=role,
+                        tool_calls=[
+                            ToolCall(tool_name=tc.tool_name, parameters=tc.parameters)
+                            for tc in raw_step.tool_calls
+                        ],
+                        expected_output=raw_step.expected_output,
                     )
                 )
-
-            steps.append(
-                PlanStep(
-                    step_number=raw_step.get("step_number", len(steps) + 1),
-                    description=raw_step.get("description", ""),
-                    agent_role=role,
-                    tool_calls=tool_calls,
-                    expected_output=raw_step.get("expected_output", ""),
-                )
+        else:
+            data = await chat_json(
+                system=system,
+                user=user,
+                model=self.model,
+                max_tokens=4096,
+                cache=self._response_cache,
             )
+            goal = data.get("goal", "")
+            reasoning = data.get("reasoning", "")
+            # Validate the raw step dicts in one pydantic-core pass instead
+            # of per-field .get() walking in Python.
+            steps = _PLAN_STEPS_ADAPTER.validate_python(data.get("steps", []))
+            for idx, step in enumerate(steps):
+                if not step.step_number:
+                    step.step_number = idx + 1
 
         # Ensure we have a critic step at the end
         if not steps or steps[-1].agent_role != AgentRole.CRITIC:
@@ -227,13 +433,13 @@ class PlannerAgent(AgentBase):
             )
 
         return AgentPlan(
-            goal=data.get("goal", f"Enhanced docs for {repo_profile.repo_name}"),
+            goal=goal or f"Enhanced docs for {repo_profile.repo_name}",
             steps=steps,
             metadata={
                 "repo": repo_profile.repo_name,
                 "entity_count": len(knowledge_graph.entities),
                 "activated_agents": [a.value for a in activated_agents],
-                "llm_reasoning": data.get("reasoning", ""),
+                "llm_reasoning": reasoning,
             },
         )
 
@@ -245,40 +451,22 @@ class PlannerAgent(AgentBase):
         activated_agents: list[AgentRole],
     ) -> AgentPlan:
         """Deterministic fallback plan construction."""
-        steps: list[PlanStep] = []
-        step_num = 0
 
-        # Step 1: Gather evidence from repo
-        step_num += 1
-        steps.append(
-            PlanStep(
-                step_number=step_num,
-                description="Search repo for architecture-relevant files",
-                agent_role=AgentRole.EXECUTOR,
-                tool_calls=[
-                    ToolCall(
-                        tool_name="repo.search",
-                        parameters={
-                            "query": "docker|kubernetes|terraform|setup|config",
-                            "max_results": 50,
-                        },
-                        expected_output_type="json",
-                    ),
-                ],
-                expected_output="List of architecture-relevant file paths",
-            )
-        )
+        # Step 1: Gather evidence from repo (constant template)
+        steps: list[PlanStep] = [_fresh_step(_SEARCH_STEP_TEMPLATE)]
 
-        # Step 2: Generate KG-based architecture diagram
-        step_num += 1
+        # Step 2: Generate KG-based architecture diagram.
+        # These steps are built from inputs we control, so model_construct
+        # skips the (redundant) pydantic validation pass; the LLM path in
+        # _build_plan_llm stays the single validation boundary.
         mermaid_spec = knowledge_graph.to_mermaid(max_entities=30)
         steps.append(
-            PlanStep(
-                step_number=step_num,
+            PlanStep.model_construct(
+                step_number=2,
                 description="Render architecture diagram from knowledge graph",
                 agent_role=AgentRole.EXECUTOR,
                 tool_calls=[
-                    ToolCall(
+                    ToolCall.model_construct(
                         tool_name="diagram.render",
                         parameters={
                             "type": "mermaid",
@@ -293,29 +481,20 @@ class PlannerAgent(AgentBase):
             )
         )
 
-        # Step 3: Activate each specialized sub-agent
-        for agent_role in activated_agents:
-            step_num += 1
-            steps.append(
-                PlanStep(
-                    step_number=step_num,
-                    description=f"Run {agent_role.value} sub-agent for domain-specific analysis",
-                    agent_role=agent_role,
-                    tool_calls=[],  # sub-agents generate their own tool calls
-                    depends_on=[1],
-                    expected_output=f"Domain diagrams + sections from {agent_role.value}",
-                )
-            )
+        # Step 3: Activate each specialized sub-agent (memoized templates)
+        steps.extend(
+            _fresh_step(t) for t in _sub_agent_step_templates(tuple(a.value for a in activated_agents))
+        )
 
         # Step 4: Refine documents with enhanced content
-        step_num += 1
+        step_num = len(steps) + 1
         steps.append(
-            PlanStep(
+            PlanStep.model_construct(
                 step_number=step_num,
                 description="Refine Word document with agent-generated content",
                 agent_role=AgentRole.EXECUTOR,
                 tool_calls=[
-                    ToolCall(
+                    ToolCall.model_construct(
                         tool_name="docx.refine",
                         parameters={
                             "instructions": "Incorporate architecture diagrams and domain-specific sections",
@@ -324,7 +503,9 @@ class PlannerAgent(AgentBase):
                         expected_output_type="docx",
                     ),
                 ],
-                depends_on=[s.step_number for s in steps[1:]],
+                # Steps are numbered contiguously, so a range covers
+                # "every prior step but the search" without walking them.
+                depends_on=list(range(2, step_num)),
                 expected_output="Enhanced Word document",
             )
         )
@@ -332,7 +513,7 @@ class PlannerAgent(AgentBase):
         # Step 5: Critic validation
         step_num += 1
         steps.append(
-            PlanStep(
+            PlanStep.model_construct(
                 step_number=step_num,
                 description="Validate all artifacts against evidence pointers",
                 agent_role=AgentRole.CRITIC,
@@ -342,7 +523,7 @@ class PlannerAgent(AgentBase):
             )
         )
 
-        return AgentPlan(
+        return AgentPlan.model_construct(
             goal=f"Generate enhanced documentation for {repo_profile.repo_name}",
             steps=steps,
             metadata={
@@ -72,10 +72,17 @@ class PrivacyGuard:
         if self.mode == PrivacyMode.PERMISSIVE:
             return profile
 
-        # In STRICT mode, strip file tree to just top-level dirs
+        # In STRICT mode, strip file tree to just top-level dirs. Hot path
+        # for monorepos (file_tree can be 10k+ entries): slice on find()
+        # instead of split() to avoid a list per path, and use a dict for
+        # ordered-unique so no sort pass is needed.
         file_tree = profile.file_tree
         if self.mode == PrivacyMode.STRICT:
-            top_dirs = sorted({p.split("/")[0] for p in file_tree if "/" in p})
+            top_dirs: dict[str, None] = {}
+            for p in file_tree:
+                idx = p.find("/")
+                if idx > 0:
+                    top_dirs[p[:idx]] = None
             file_tree = [f"{d}/" for d in top_dirs]
 
         return RepoProfile(
@@ -133,14 +140,32 @@ class PrivacyGuard:
         if self.mode != PrivacyMode.STRICT:
             return context
 
-        def _strip(obj: Any) -> Any:
-            if isinstance(obj, dict):
-                return {k: "[redacted]" if k in banned_keys else _strip(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [_strip(item) for item in obj]
-            return obj
-
-        return _strip(context)  # type: ignore[return-value]
+        # Iterative walk with an explicit stack: deep agent payloads would
+        # otherwise pay a Python frame per nesting level. Containers are
+        # shallow-copied as they're reached; scalars are shared untouched.
+        root = dict(context)
+        stack: list[Any] = [root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key in banned_keys:
+                        node[key] = "[redacted]"
+                    elif isinstance(value, dict):
+                        node[key] = value = dict(value)
+                        stack.append(value)
+                    elif isinstance(value, list):
+                        node[key] = value = list(value)
+                        stack.append(value)
+            else:  # list
+                for i, value in enumerate(node):
+                    if isinstance(value, dict):
+                        node[i] = value = dict(value)
+                        stack.append(value)
+                    elif isinstance(value, list):
+                        node[i] = value = list(value)
+                        stack.append(value)
+        return root
 
     # -- Convenience --------------------------------------------------------
 
@@ -12,16 +12,86 @@ Sub-agents:
 - **InfraAgent**: Terraform / Helm / K8s / Pulumi resource graphs.
 """
 
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from ...core.knowledge_graph import KnowledgeGraph
+from ...core.models import DocumentModel
+from ..base import AgentResult, RepoProfile
 from .data_engineering_agent import DataEngineeringAgent
 from .event_driven_agent import EventDrivenAgent
 from .infra_agent import InfraAgent
 from .microservices_agent import MicroservicesAgent
 from .ml_agent import MLAgent
 
+_ALL_AGENT_CLASSES = (
+    MicroservicesAgent,
+    EventDrivenAgent,
+    MLAgent,
+    DataEngineeringAgent,
+    InfraAgent,
+)
+
+
+async def run_all_specialized(
+    *,
+    repo_profile: RepoProfile,
+    knowledge_graph: KnowledgeGraph,
+    document: DocumentModel | None = None,
+    use_llm: bool = True,
+    model: str = "gpt-4o-mini",
+    timeout_seconds: float | None = None,
+    **kwargs: Any,
+) -> list[AgentResult]:
+    """Run every specialized sub-agent concurrently and collect results.
+
+    Each agent's wall time is dominated by a single LLM round-trip, so
+    gathering them drops the phase from the sum of latencies to the max.
+    ``timeout_seconds`` bounds each individual agent so one slow provider
+    cannot stall the batch; a timed-out or failed agent yields a failed
+    :class:`AgentResult` instead of raising.
+    """
+    agents = [cls(model=model) for cls in _ALL_AGENT_CLASSES]
+
+    async def _bounded(agent: Any) -> AgentResult:
+        coro = agent.run(
+            repo_profile=repo_profile,
+            knowledge_graph=knowledge_graph,
+            document=document,
+            use_llm=use_llm,
+            **kwargs,
+        )
+        if timeout_seconds is not None:
+            return await asyncio.wait_for(coro, timeout=timeout_seconds)
+        return await coro
+
+    outcomes = await asyncio.gather(
+        *(_bounded(agent) for agent in agents),
+        return_exceptions=True,
+    )
+
+    results: list[AgentResult] = []
+    for agent, outcome in zip(agents, outcomes):
+        if isinstance(outcome, BaseException):
+            results.append(
+                AgentResult(
+                    agent_role=agent.role,
+                    success=False,
+                    errors=[f"{type(outcome).__name__}: {outcome}"],
+                )
+            )
+        else:
+            results.append(outcome)
+    return results
+
+
 __all__ = [
     "MicroservicesAgent",
     "EventDrivenAgent",
     "MLAgent",
     "DataEngineeringAgent",
     "InfraAgent",
+    "run_all_specialized",
 ]
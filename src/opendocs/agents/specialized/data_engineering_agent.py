@@ -6,13 +6,67 @@ data flow diagrams + documentation.
 
 from __future__ import annotations
 
-import time
+import io
+import re
 from typing import Any
 
 from ...core.knowledge_graph import KnowledgeGraph
 from ...core.models import DocumentModel
-from ..base import AgentBase, AgentPlan, AgentResult, AgentRole, RepoProfile
-from ..llm_client import chat_text
+from ..base import AgentBase, AgentPlan, AgentResult, AgentRole, Component, RepoProfile
+from ..llm_client import (
+    MAX_KG_ENTITIES,
+    MAX_KG_ENTITIES_SPARSE,
+    capped_desc,
+    chat_text_cached,
+    compact_user_prompt,
+)
+
+# Signal → component templates and a precompiled DAG-file matcher, so
+# _detect_components is a dict probe per signal plus one regex pass over
+# the file tree instead of chained substring/endswith checks. The
+# templates are frozen Components, shared without copying.
+_DE_SIGNAL_COMPONENTS: dict[str, Component] = {
+    "airflow": Component("orchestrator", "airflow", "Apache Airflow"),
+    "dbt": Component("transform", "dbt", "dbt Models"),
+    "spark": Component("compute", "spark", "Apache Spark"),
+    "warehouse": Component("storage", "warehouse", "Data Warehouse"),
+}
+_DAG_RE = re.compile(r"dags/.*\.py$")
+
+# Precomputed Mermaid fragments — the lineage diagram is assembled from
+# these constants so the hot path does no f-string formatting at all.
+_LINEAGE_PREFIX = (
+    "graph LR\n"
+    '    Sources["Data Sources"]\n'
+    '    Landing["Landing Zone"]\n'
+    "    Sources --> Landing"
+)
+_TRANSFORM_EDGE = '    Transform["dbt Transform"]\n    Landing --> Transform'
+_COMPUTE_EDGES = {
+    prev: f'    Spark["Spark Processing"]\n    {prev} --> Spark' for prev in ("Transform", "Landing")
+}
+_WAREHOUSE_EDGES = {
+    prev: (
+        f'    Warehouse["Data Warehouse"]\n'
+        f"    {prev} --> Warehouse\n"
+        '    Warehouse --> Analytics["Analytics / BI"]'
+    )
+    for prev in ("Spark", "Transform", "Landing")
+}
+
+_DATA_SECTION_FOOTER = (
+    "\n### Data Lineage\n\n"
+    "TODO: Document data sources, transformation logic, partitioning strategy, and SLAs."
+)
+
+# Static system prompt — kept byte-identical across runs so provider-side
+# prefix caching can reuse it; per-repo context lives in the user message.
+_DATA_SECTION_SYSTEM = (
+    "You are a data engineering documentation specialist. Write a "
+    "detailed Markdown section about the data pipeline. Include "
+    "data sources, transformations, lineage, partitioning, SLAs, "
+    "and monitoring. Use ## headers. Be specific to detected components."
+)
 
 
 class DataEngineeringAgent(AgentBase):
@@ -41,153 +95,110 @@ class DataEngineeringAgent(AgentBase):
         plan: AgentPlan | None = None,
         prior_results: list[AgentResult] | None = None,
         use_llm: bool = True,
+        precomputed_sections: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> AgentResult:
-        t0 = time.perf_counter()
-        artifacts: dict[str, Any] = {}
-
-        # 1. Detect data engineering components
-        components = self._detect_components(repo_profile)
-
-        # 2. Generate data lineage diagram
-        mermaid_spec = self._build_lineage_diagram(components)
-        artifacts["data_lineage_mermaid"] = mermaid_spec
-
-        # 3. Produce data pipeline section (LLM or template)
-        if use_llm:
-            try:
-                section_md = await self._build_data_section_llm(
-                    components=components,
-                    repo_profile=repo_profile,
-                    knowledge_graph=knowledge_graph,
-                )
-            except Exception:
-                section_md = self._build_data_section(
-                    components=components,
-                    repo_name=repo_profile.repo_name,
-                )
-        else:
-            section_md = self._build_data_section(
-                components=components,
-                repo_name=repo_profile.repo_name,
-            )
-        artifacts["data_pipeline_md"] = section_md
-        artifacts["data_components"] = components
-
-        duration = (time.perf_counter() - t0) * 1000
-        return self._make_result(
-            success=True,
-            artifacts=artifacts,
-            duration_ms=duration,
-            metadata={"component_count": len(components)},
-        )
+        async with self._timed_result() as r:
+            # 1. Detect data engineering components
+            components = self._detect_components(repo_profile)
+
+            # 2. Generate data lineage diagram
+            mermaid_spec = self._build_lineage_diagram(components)
+            r.artifacts["data_lineage_mermaid"] = mermaid_spec
+
+            # 3. Produce data pipeline section (batched, LLM, or template)
+            section_md = (precomputed_sections or {}).get(self.role.value)
+            if section_md is None:
+                if use_llm:
+                    try:
+                        section_md = await self._build_data_section_llm(
+                            components=components,
+                            repo_profile=repo_profile,
+                            knowledge_graph=knowledge_graph,
+                        )
+                    except Exception:
+                        section_md = self._build_data_section(
+                            components=components,
+                            repo_name=repo_profile.repo_name,
+                        )
+                else:
+                    section_md = self._build_data_section(
+                        components=components,
+                        repo_name=repo_profile.repo_name,
+                    )
+            r.artifacts["data_pipeline_md"] = section_md
+            r.artifacts["data_components"] = components
+            r.metadata["component_count"] = len(components)
+        return r.result
+
+    def discover_components(self, profile: RepoProfile) -> list[Component]:
+        """Discovery entry point for the orchestrator's batched-section call."""
+        return self._detect_components(profile)
 
     # -- Internal -----------------------------------------------------------
 
-    def _detect_components(self, profile: RepoProfile) -> list[dict[str, Any]]:
+    def _detect_components(self, profile: RepoProfile) -> list[Component]:
         """Detect data engineering components from signals and file tree.
 
         TODO: Parse actual DAG files, dbt_project.yml, Spark configs.
         """
-        components: list[dict[str, Any]] = []
-        signal_types = {s.signal_type for s in profile.signals}
-
-        if "airflow" in signal_types:
-            components.append(
-                {
-                    "type": "orchestrator",
-                    "tech": "airflow",
-                    "name": "Apache Airflow",
-                }
-            )
-        if "dbt" in signal_types:
-            components.append(
-                {
-                    "type": "transform",
-                    "tech": "dbt",
-                    "name": "dbt Models",
-                }
-            )
-        if "spark" in signal_types:
-            components.append(
-                {
-                    "type": "compute",
-                    "tech": "spark",
-                    "name": "Apache Spark",
-                }
-            )
-        if "warehouse" in signal_types:
-            components.append(
-                {
-                    "type": "storage",
-                    "tech": "warehouse",
-                    "name": "Data Warehouse",
-                }
-            )
-
-        # Detect from file tree
-        for path in profile.file_tree:
-            if "dags/" in path and path.endswith(".py"):
-                components.append(
-                    {
-                        "type": "dag",
-                        "tech": "airflow",
-                        "name": f"DAG: {path.split('/')[-1]}",
-                        "source": path,
-                    }
-                )
+        signal_types = profile.signal_types
+        components: list[Component] = [
+            template for sig, template in _DE_SIGNAL_COMPONENTS.items() if sig in signal_types
+        ]
 
-        return components
+        # Detect DAG files from the file tree in a single regex pass
+        dag_search = _DAG_RE.search
+        components.extend(
+            Component("dag", "airflow", f"DAG: {path.rsplit('/', 1)[-1]}", path)
+            for path in profile.file_tree
+            if dag_search(path)
+        )
 
-    def _build_lineage_diagram(self, components: list[dict[str, Any]]) -> str:
-        """Generate a Mermaid data lineage diagram."""
-        lines = ["graph LR"]
-        lines.append('    Sources["Data Sources"]')
-        lines.append('    Landing["Landing Zone"]')
-        lines.append("    Sources --> Landing")
+        return components
 
-        has_transform = any(c["type"] == "transform" for c in components)
-        has_compute = any(c["type"] == "compute" for c in components)
-        has_warehouse = any(c["type"] == "storage" for c in components)
+    def _build_lineage_diagram(self, components: list[Component]) -> str:
+        """Generate a Mermaid data lineage diagram from precomputed fragments."""
+        has_transform = any(c.type == "transform" for c in components)
+        has_compute = any(c.type == "compute" for c in components)
+        has_warehouse = any(c.type == "storage" for c in components)
 
+        parts = [_LINEAGE_PREFIX]
         if has_transform:
-            lines.append('    Transform["dbt Transform"]')
-            lines.append("    Landing --> Transform")
+            parts.append(_TRANSFORM_EDGE)
         if has_compute:
-            lines.append('    Spark["Spark Processing"]')
-            prev = "Transform" if has_transform else "Landing"
-            lines.append(f"    {prev} --> Spark")
+            parts.append(_COMPUTE_EDGES["Transform" if has_transform else "Landing"])
         if has_warehouse:
             prev = "Spark" if has_compute else ("Transform" if has_transform else "Landing")
-            lines.append('    Warehouse["Data Warehouse"]')
-            lines.append(f"    {prev} --> Warehouse")
-            lines.append('    Warehouse --> Analytics["Analytics / BI"]')
-
-        return "\n".join(lines)
+            parts.append(_WAREHOUSE_EDGES[prev])
+        return "\n".join(parts)
 
     async def _build_data_section_llm(
         self,
-        components: list[dict[str, Any]],
+        components: list[Component],
         repo_profile: RepoProfile,
         knowledge_graph: KnowledgeGraph,
     ) -> str:
         """Use LLM to generate rich data pipeline documentation."""
-        comp_desc = ", ".join(f"{c['name']} ({c['tech']})" for c in components)
-        entities = ", ".join(e.name for e in knowledge_graph.entities[:15])
-
-        return await chat_text(
-            system=(
-                "You are a data engineering documentation specialist. Write a "
-                "detailed Markdown section about the data pipeline. Include "
-                "data sources, transformations, lineage, partitioning, SLAs, "
-                "and monitoring. Use ## headers. Be specific to detected components."
-            ),
-            user=(
-                f"Repository: {repo_profile.repo_name}\n"
-                f"Description: {repo_profile.description[:300]}\n"
-                f"Data components: {comp_desc}\n"
-                f"KG entities: {entities}\n\n"
-                f"Write detailed data pipeline documentation."
+        comp_desc = capped_desc(
+            components,
+            lambda c: f"{c.name} ({c.tech})",
+            sep=", ",
+            overflow="... and {n} more",
+        )
+        limit = MAX_KG_ENTITIES if components else MAX_KG_ENTITIES_SPARSE
+        entities = ", ".join(e.name for e in knowledge_graph.entities[:limit])
+
+        return await chat_text_cached(
+            system=_DATA_SECTION_SYSTEM,
+            user=compact_user_prompt(
+                [
+                    ("Repository", repo_profile.repo_name),
+                    ("Description", repo_profile.description[:300]),
+                    ("Data components", comp_desc),
+                    ("KG entities", entities),
+                ],
+                closing="Write detailed data pipeline documentation.",
             ),
             model=self.model,
             max_tokens=1500,
@@ -195,23 +206,19 @@ class DataEngineeringAgent(AgentBase):
 
     def _build_data_section(
         self,
-        components: list[dict[str, Any]],
+        components: list[Component],
         repo_name: str,
     ) -> str:
         """Generate Markdown data pipeline section."""
-        lines = [
-            f"## Data Pipeline — {repo_name}",
-            "",
-            f"This repository includes **{len(components)}** data component(s):",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            f"## Data Pipeline — {repo_name}\n\n"
+            f"This repository includes **{len(components)}** data component(s):\n"
+        )
         for comp in components:
-            source = comp.get("source", "")
-            suffix = f" — `{source}`" if source else ""
-            lines.append(f"- **{comp['name']}** ({comp['tech']}, {comp['type']}){suffix}")
-
-        lines.append("")
-        lines.append("### Data Lineage")
-        lines.append("")
-        lines.append("TODO: Document data sources, transformation logic, partitioning strategy, and SLAs.")
-        return "\n".join(lines)
+            suffix = f" — `{comp.source}`" if comp.source else ""
+            w(f"\n- **{comp.name}** ({comp.tech}, {comp.type}){suffix}")
+        w("\n")
+        w(_DATA_SECTION_FOOTER)
+        return buf.getvalue()
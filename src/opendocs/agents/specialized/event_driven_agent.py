@@ -6,13 +6,24 @@ relationships, and generates event flow diagrams.
 
 from __future__ import annotations
 
-import time
+import io
 from typing import Any
 
 from ...core.knowledge_graph import KnowledgeGraph
 from ...core.models import DocumentModel
-from ..base import AgentBase, AgentPlan, AgentResult, AgentRole, RepoProfile
-from ..llm_client import chat_text
+from ..base import AgentBase, AgentPlan, AgentResult, AgentRole, Component, RepoProfile
+from ..llm_client import (
+    MAX_KG_ENTITIES,
+    MAX_KG_ENTITIES_SPARSE,
+    capped_desc,
+    chat_text_cached,
+    compact_user_prompt,
+)
+
+# Mermaid node ids: one C-level translate pass instead of chained
+# str.replace calls. Also maps "/" and "." so path-derived names
+# produce valid ids.
+_MERMAID_SANITIZE = str.maketrans({" ": "_", "-": "_", "/": "_", ".": "_"})
 
 
 class EventDrivenAgent(AgentBase):
@@ -30,6 +41,10 @@ class EventDrivenAgent(AgentBase):
     ``rabbitmq``, ``nats``.
     """
 
+    #: Signals this agent can act on. Components come exclusively from
+    #: these, so a disjoint profile means there is nothing to document.
+    RELEVANT: frozenset[str] = frozenset({"kafka", "sqs", "eventbridge", "rabbitmq", "nats"})
+
     def __init__(self, model: str = "gpt-4o-mini") -> None:
         super().__init__(role=AgentRole.EVENT_DRIVEN, model=model)
 
@@ -42,106 +57,130 @@ class EventDrivenAgent(AgentBase):
         plan: AgentPlan | None = None,
         prior_results: list[AgentResult] | None = None,
         use_llm: bool = True,
+        precomputed_sections: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> AgentResult:
-        t0 = time.perf_counter()
-        artifacts: dict[str, Any] = {}
-
-        # 1. Discover event components
-        components = self._discover_event_components(repo_profile)
-
-        # 2. Generate event flow diagram
-        mermaid_spec = self._build_event_flow_diagram(components)
-        artifacts["event_flow_mermaid"] = mermaid_spec
-
-        # 3. Produce event architecture section (LLM or template)
-        if use_llm:
-            try:
-                section_md = await self._build_event_section_llm(
-                    components=components,
-                    repo_profile=repo_profile,
-                    knowledge_graph=knowledge_graph,
-                )
-            except Exception:
-                section_md = self._build_event_section(
-                    components=components,
-                    repo_name=repo_profile.repo_name,
-                )
-        else:
-            section_md = self._build_event_section(
-                components=components,
-                repo_name=repo_profile.repo_name,
+        # Early exit: no relevant signals means an empty component list,
+        # a trivial diagram, and an LLM call with nothing to describe —
+        # skip the round-trip entirely.
+        if repo_profile.signal_types.isdisjoint(self.RELEVANT):
+            return self._make_result(
+                success=True,
+                artifacts={},
+                duration_ms=0.0,
+                metadata={"skipped": True},
             )
-        artifacts["event_architecture_md"] = section_md
-        artifacts["event_components"] = components
-
-        duration = (time.perf_counter() - t0) * 1000
-        return self._make_result(
-            success=True,
-            artifacts=artifacts,
-            duration_ms=duration,
-            metadata={"component_count": len(components)},
-        )
+
+        async with self._timed_result() as r:
+            # 1. Discover event components
+            components = self._discover_event_components(repo_profile)
+
+            # 2. Generate event flow diagram
+            mermaid_spec = self._build_event_flow_diagram(components)
+            r.artifacts["event_flow_mermaid"] = mermaid_spec
+
+            # 3. Produce event architecture section (batched, LLM, or template)
+            section_md = (precomputed_sections or {}).get(self.role.value)
+            if section_md is None:
+                if use_llm:
+                    try:
+                        section_md = await self._build_event_section_llm(
+                            components=components,
+                            repo_profile=repo_profile,
+                            knowledge_graph=knowledge_graph,
+                        )
+                    except Exception:
+                        section_md = self._build_event_section(
+                            components=components,
+                            repo_name=repo_profile.repo_name,
+                        )
+                else:
+                    section_md = self._build_event_section(
+                        components=components,
+                        repo_name=repo_profile.repo_name,
+                    )
+            r.artifacts["event_architecture_md"] = section_md
+            r.artifacts["event_components"] = components
+            r.metadata["component_count"] = len(components)
+        return r.result
+
+    def discover_components(self, profile: RepoProfile) -> list[Component]:
+        """Discovery entry point for the orchestrator's batched-section call."""
+        return self._discover_event_components(profile)
 
     # -- Internal -----------------------------------------------------------
 
-    def _discover_event_components(self, profile: RepoProfile) -> list[dict[str, Any]]:
+    def _discover_event_components(self, profile: RepoProfile) -> list[Component]:
         """Extract event-driven components from signals and file tree.
 
         TODO: Parse actual config files for topic/queue definitions.
         """
-        components: list[dict[str, Any]] = []
-        signal_types = {s.signal_type for s in profile.signals}
+        components: list[Component] = []
+        signal_types = profile.signal_types
 
         if "kafka" in signal_types:
-            components.append({"type": "broker", "tech": "kafka", "name": "Kafka Cluster"})
+            components.append(Component("broker", "kafka", "Kafka Cluster"))
         if "sqs" in signal_types:
-            components.append({"type": "queue", "tech": "sqs", "name": "SQS Queue"})
+            components.append(Component("queue", "sqs", "SQS Queue"))
         if "eventbridge" in signal_types:
-            components.append({"type": "bus", "tech": "eventbridge", "name": "EventBridge"})
+            components.append(Component("bus", "eventbridge", "EventBridge"))
         if "rabbitmq" in signal_types:
-            components.append({"type": "broker", "tech": "rabbitmq", "name": "RabbitMQ"})
+            components.append(Component("broker", "rabbitmq", "RabbitMQ"))
         if "nats" in signal_types:
-            components.append({"type": "broker", "tech": "nats", "name": "NATS"})
+            components.append(Component("broker", "nats", "NATS"))
 
         return components
 
-    def _build_event_flow_diagram(self, components: list[dict[str, Any]]) -> str:
-        """Generate a Mermaid event flow diagram."""
-        lines = ["graph LR"]
-        lines.append('    Producer["Producer Service"]')
+    def _build_event_flow_diagram(self, components: list[Component]) -> str:
+        """Generate a Mermaid event flow diagram.
 
+        Written through a single ``StringIO`` buffer rather than a
+        line-list + join — one interpolated fragment per component
+        instead of three list appends and their intermediate strings.
+        """
+        buf = io.StringIO()
+        w = buf.write
+        w('graph LR\n    Producer["Producer Service"]')
         for comp in components:
-            safe_name = comp["name"].replace(" ", "_").replace("-", "_")
-            lines.append(f'    {safe_name}["{comp["name"]}"]')
-            lines.append(f"    Producer --> {safe_name}")
-            lines.append(f'    {safe_name} --> Consumer["Consumer Service"]')
-
-        return "\n".join(lines)
+            safe_name = comp.name.translate(_MERMAID_SANITIZE)
+            w(
+                f'\n    {safe_name}["{comp.name}"]'
+                f"\n    Producer --> {safe_name}"
+                f'\n    {safe_name} --> Consumer["Consumer Service"]'
+            )
+        return buf.getvalue()
 
     async def _build_event_section_llm(
         self,
-        components: list[dict[str, Any]],
+        components: list[Component],
         repo_profile: RepoProfile,
         knowledge_graph: KnowledgeGraph,
     ) -> str:
         """Use LLM to generate rich event architecture documentation."""
-        comp_desc = ", ".join(f"{c['name']} ({c['tech']})" for c in components)
-        entities = ", ".join(e.name for e in knowledge_graph.entities[:15])
+        comp_desc = capped_desc(
+            components,
+            lambda c: f"{c.name} ({c.tech})",
+            sep=", ",
+            overflow="... and {n} more",
+        )
+        limit = MAX_KG_ENTITIES if components else MAX_KG_ENTITIES_SPARSE
+        entities = ", ".join(e.name for e in knowledge_graph.entities[:limit])
 
-        return await chat_text(
+        return await chat_text_cached(
             system=(
                 "You are an event-driven architecture specialist. Write a detailed "
                 "Markdown section about the event architecture. Include message "
                 "brokers, event schemas, consumer groups, retry/DLQ policies. "
                 "Use ## headers. Be specific to the detected components."
             ),
-            user=(
-                f"Repository: {repo_profile.repo_name}\n"
-                f"Description: {repo_profile.description[:300]}\n"
-                f"Event components: {comp_desc}\n"
-                f"KG entities: {entities}\n\n"
-                f"Write detailed event architecture documentation."
+            user=compact_user_prompt(
+                [
+                    ("Repository", repo_profile.repo_name),
+                    ("Description", repo_profile.description[:300]),
+                    ("Event components", comp_desc),
+                    ("KG entities", entities),
+                ],
+                closing="Write detailed event architecture documentation.",
             ),
             model=self.model,
             max_tokens=1500,
@@ -149,21 +188,20 @@ class EventDrivenAgent(AgentBase):
 
     def _build_event_section(
         self,
-        components: list[dict[str, Any]],
+        components: list[Component],
         repo_name: str,
     ) -> str:
         """Generate Markdown event architecture section."""
-        lines = [
-            f"## Event Architecture — {repo_name}",
-            "",
-            f"This repository uses **{len(components)}** event component(s):",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            f"## Event Architecture — {repo_name}\n\n"
+            f"This repository uses **{len(components)}** event component(s):\n"
+        )
         for comp in components:
-            lines.append(f"- **{comp['name']}** ({comp['tech']}, {comp['type']})")
-
-        lines.append("")
-        lines.append("### Event Flow")
-        lines.append("")
-        lines.append("TODO: Document event schemas, retry policies, and dead-letter queue configurations.")
-        return "\n".join(lines)
+            w(f"\n- **{comp.name}** ({comp.tech}, {comp.type})")
+        w(
+            "\n\n### Event Flow\n\n"
+            "TODO: Document event schemas, retry policies, and dead-letter queue configurations."
+        )
+        return buf.getvalue()
@@ -6,13 +6,41 @@ and generates infra topology diagrams + documentation.
 
 from __future__ import annotations
 
-import time
+import io
 from typing import Any
 
 from ...core.knowledge_graph import KnowledgeGraph
 from ...core.models import DocumentModel
-from ..base import AgentBase, AgentPlan, AgentResult, AgentRole, RepoProfile
-from ..llm_client import chat_text
+from ..base import AgentBase, AgentPlan, AgentResult, AgentRole, Component, RepoProfile
+from ..llm_client import (
+    MAX_KG_ENTITIES,
+    MAX_KG_ENTITIES_SPARSE,
+    capped_desc,
+    chat_text_cached,
+    compact_user_prompt,
+)
+
+# Per-tech Mermaid fragments for the topology diagram. The blocks never
+# vary between calls, so they live here as constants and the builder
+# only concatenates the ones that apply.
+_DIAGRAM_HEADER = 'graph TB\n    Cloud["Cloud Provider"]'
+_TF_BLOCK = (
+    '\n    TF["Terraform"]'
+    '\n    TF --> VPC["VPC / Network"]'
+    '\n    TF --> Compute["Compute"]'
+    '\n    TF --> Storage["Storage"]'
+    '\n    TF --> DB["Database"]'
+    "\n    Cloud --> TF"
+)
+_HELM_BLOCK = (
+    '\n    Helm["Helm Charts"]'
+    '\n    Helm --> K8s["Kubernetes Cluster"]'
+    '\n    K8s --> Pods["Pods"]'
+    '\n    K8s --> Services["Services"]'
+    "\n    Cloud --> Helm"
+)
+_PULUMI_BLOCK = '\n    Pulumi["Pulumi"]\n    Cloud --> Pulumi'
+_CFN_BLOCK = '\n    CFN["CloudFormation"]\n    Cloud --> CFN'
 
 
 class InfraAgent(AgentBase):
@@ -44,169 +72,124 @@ class InfraAgent(AgentBase):
         plan: AgentPlan | None = None,
         prior_results: list[AgentResult] | None = None,
         use_llm: bool = True,
+        precomputed_sections: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> AgentResult:
-        t0 = time.perf_counter()
-        artifacts: dict[str, Any] = {}
-
-        # 1. Discover infra resources
-        resources = self._discover_resources(repo_profile)
-
-        # 2. Generate resource topology diagram
-        mermaid_spec = self._build_infra_diagram(resources)
-        artifacts["infra_topology_mermaid"] = mermaid_spec
-
-        # 3. Produce infrastructure section (LLM or template)
-        if use_llm:
-            try:
-                section_md = await self._build_infra_section_llm(
-                    resources=resources,
-                    repo_profile=repo_profile,
-                    knowledge_graph=knowledge_graph,
-                )
-            except Exception:
-                section_md = self._build_infra_section(
-                    resources=resources,
-                    repo_name=repo_profile.repo_name,
-                )
-        else:
-            section_md = self._build_infra_section(
-                resources=resources,
-                repo_name=repo_profile.repo_name,
-            )
-        artifacts["infrastructure_md"] = section_md
-        artifacts["infra_resources"] = resources
-
-        duration = (time.perf_counter() - t0) * 1000
-        return self._make_result(
-            success=True,
-            artifacts=artifacts,
-            duration_ms=duration,
-            metadata={"resource_count": len(resources)},
-        )
+        async with self._timed_result() as r:
+            # 1. Discover infra resources
+            resources = self._discover_resources(repo_profile)
+
+            # 2. Generate resource topology diagram
+            mermaid_spec = self._build_infra_diagram(resources)
+            r.artifacts["infra_topology_mermaid"] = mermaid_spec
+
+            # 3. Produce infrastructure section (batched, LLM, or template)
+            section_md = (precomputed_sections or {}).get(self.role.value)
+            if section_md is None:
+                if use_llm:
+                    try:
+                        section_md = await self._build_infra_section_llm(
+                            resources=resources,
+                            repo_profile=repo_profile,
+                            knowledge_graph=knowledge_graph,
+                        )
+                    except Exception:
+                        section_md = self._build_infra_section(
+                            resources=resources,
+                            repo_name=repo_profile.repo_name,
+                        )
+                else:
+                    section_md = self._build_infra_section(
+                        resources=resources,
+                        repo_name=repo_profile.repo_name,
+                    )
+            r.artifacts["infrastructure_md"] = section_md
+            r.artifacts["infra_resources"] = resources
+            r.metadata["resource_count"] = len(resources)
+        return r.result
+
+    def discover_components(self, profile: RepoProfile) -> list[Component]:
+        """Discovery entry point for the orchestrator's batched-section call."""
+        return self._discover_resources(profile)
 
     # -- Internal -----------------------------------------------------------
 
-    def _discover_resources(self, profile: RepoProfile) -> list[dict[str, Any]]:
+    def _discover_resources(self, profile: RepoProfile) -> list[Component]:
         """Discover IaC resources from file tree and signals.
 
         TODO: Parse actual .tf files for resource blocks,
               Helm Chart.yaml for dependencies,
               K8s manifests for resource types.
         """
-        resources: list[dict[str, Any]] = []
-        signal_types = {s.signal_type for s in profile.signals}
+        resources: list[Component] = []
+        signal_types = profile.signal_types
 
         if "terraform" in signal_types:
-            resources.append(
-                {
-                    "type": "iac",
-                    "tech": "terraform",
-                    "name": "Terraform Configuration",
-                }
-            )
+            resources.append(Component("iac", "terraform", "Terraform Configuration"))
         if "helm" in signal_types:
-            resources.append(
-                {
-                    "type": "chart",
-                    "tech": "helm",
-                    "name": "Helm Chart",
-                }
-            )
+            resources.append(Component("chart", "helm", "Helm Chart"))
         if "pulumi" in signal_types:
-            resources.append(
-                {
-                    "type": "iac",
-                    "tech": "pulumi",
-                    "name": "Pulumi Program",
-                }
-            )
+            resources.append(Component("iac", "pulumi", "Pulumi Program"))
         if "cloudformation" in signal_types:
-            resources.append(
-                {
-                    "type": "iac",
-                    "tech": "cloudformation",
-                    "name": "CloudFormation Stack",
-                }
-            )
-
-        # Discover from file tree
-        for path in profile.file_tree:
-            if path.endswith(".tf"):
-                resources.append(
-                    {
-                        "type": "terraform-file",
-                        "tech": "terraform",
-                        "name": path.split("/")[-1],
-                        "source": path,
-                    }
-                )
-            elif path == "Chart.yaml" or path.endswith("/Chart.yaml"):
-                chart_name = path.split("/")[-2] if "/" in path else "chart"
-                resources.append(
-                    {
-                        "type": "helm-chart",
-                        "tech": "helm",
-                        "name": chart_name,
-                        "source": path,
-                    }
-                )
+            resources.append(Component("iac", "cloudformation", "CloudFormation Stack"))
+
+        # Discover from file tree via the profile's lazy indexes: O(k)
+        # lookups on the paths of interest instead of another full scan —
+        # the tree is walked once per profile no matter how many agents
+        # probe it.
+        for path in profile.suffix_index.get(".tf", ()):
+            resources.append(Component("terraform-file", "terraform", path.rpartition("/")[2], path))
+        for path in profile.basename_index.get("Chart.yaml", ()):
+            slash = path.rfind("/")
+            chart_name = path[path.rfind("/", 0, slash) + 1 : slash] if slash >= 0 else "chart"
+            resources.append(Component("helm-chart", "helm", chart_name, path))
 
         return resources
 
-    def _build_infra_diagram(self, resources: list[dict[str, Any]]) -> str:
-        """Generate a Mermaid infrastructure topology diagram."""
-        lines = ["graph TB"]
-        lines.append('    Cloud["Cloud Provider"]')
+    def _build_infra_diagram(self, resources: list[Component]) -> str:
+        """Generate a Mermaid infrastructure topology diagram.
 
-        techs = {r["tech"] for r in resources}
+        Pure concatenation of the applicable module-level fragments — no
+        per-call interpolation or formatting work at all.
+        """
+        techs = {r.tech for r in resources}
+        parts = [_DIAGRAM_HEADER]
         if "terraform" in techs:
-            lines.append('    TF["Terraform"]')
-            lines.append('    TF --> VPC["VPC / Network"]')
-            lines.append('    TF --> Compute["Compute"]')
-            lines.append('    TF --> Storage["Storage"]')
-            lines.append('    TF --> DB["Database"]')
-            lines.append("    Cloud --> TF")
+            parts.append(_TF_BLOCK)
         if "helm" in techs:
-            lines.append('    Helm["Helm Charts"]')
-            lines.append('    Helm --> K8s["Kubernetes Cluster"]')
-            lines.append('    K8s --> Pods["Pods"]')
-            lines.append('    K8s --> Services["Services"]')
-            lines.append("    Cloud --> Helm")
+            parts.append(_HELM_BLOCK)
         if "pulumi" in techs:
-            lines.append('    Pulumi["Pulumi"]')
-            lines.append("    Cloud --> Pulumi")
+            parts.append(_PULUMI_BLOCK)
         if "cloudformation" in techs:
-            lines.append('    CFN["CloudFormation"]')
-            lines.append("    Cloud --> CFN")
-
-        return "\n".join(lines)
+            parts.append(_CFN_BLOCK)
+        return "".join(parts)
 
     async def _build_infra_section_llm(
         self,
-        resources: list[dict[str, Any]],
+        resources: list[Component],
         repo_profile: RepoProfile,
         knowledge_graph: KnowledgeGraph,
     ) -> str:
         """Use LLM to generate rich infrastructure documentation."""
-        res_desc = (
-            "\n".join(f"- {r['name']} ({r['tech']}, {r['type']})" for r in resources) or "No resources discovered"
-        )
-        entities = ", ".join(e.name for e in knowledge_graph.entities[:15])
+        res_desc = capped_desc(resources, lambda r: f"- {r.name} ({r.tech}, {r.type})")
+        limit = MAX_KG_ENTITIES if resources else MAX_KG_ENTITIES_SPARSE
+        entities = ", ".join(e.name for e in knowledge_graph.entities[:limit])
 
-        return await chat_text(
+        return await chat_text_cached(
             system=(
                 "You are a DevOps/SRE documentation specialist. Write a detailed "
                 "Markdown infrastructure section. Include resource inventory, "
                 "deployment topology, networking, scaling, and operational runbooks. "
                 "Use ## headers. Be specific to discovered IaC resources."
             ),
-            user=(
-                f"Repository: {repo_profile.repo_name}\n"
-                f"Description: {repo_profile.description[:300]}\n"
-                f"KG entities: {entities}\n\n"
-                f"Discovered infrastructure resources:\n{res_desc}\n\n"
-                f"Write detailed infrastructure documentation."
+            user=compact_user_prompt(
+                [
+                    ("Repository", repo_profile.repo_name),
+                    ("Description", repo_profile.description[:300]),
+                    ("KG entities", entities),
+                    ("Discovered infrastructure resources", res_desc),
+                ],
+                closing="Write detailed infrastructure documentation.",
             ),
             model=self.model,
             max_tokens=1500,
@@ -214,23 +197,21 @@ class InfraAgent(AgentBase):
 
     def _build_infra_section(
         self,
-        resources: list[dict[str, Any]],
+        resources: list[Component],
         repo_name: str,
     ) -> str:
         """Generate Markdown infrastructure section."""
-        lines = [
-            f"## Infrastructure — {repo_name}",
-            "",
-            f"This repository manages **{len(resources)}** infrastructure resource(s):",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            f"## Infrastructure — {repo_name}\n\n"
+            f"This repository manages **{len(resources)}** infrastructure resource(s):\n"
+        )
         for res in resources:
-            source = res.get("source", "")
-            suffix = f" — `{source}`" if source else ""
-            lines.append(f"- **{res['name']}** ({res['tech']}, {res['type']}){suffix}")
-
-        lines.append("")
-        lines.append("### Deployment")
-        lines.append("")
-        lines.append("TODO: Document deployment prerequisites, environment variables, and rollback procedures.")
-        return "\n".join(lines)
+            suffix = f" — `{res.source}`" if res.source else ""
+            w(f"\n- **{res.name}** ({res.tech}, {res.type}){suffix}")
+        w(
+            "\n\n### Deployment\n\n"
+            "TODO: Document deployment prerequisites, environment variables, and rollback procedures."
+        )
+        return buf.getvalue()
@@ -6,13 +6,24 @@ and generates service dependency diagrams + architecture documentation.
 
 from __future__ import annotations
 
-import time
+import io
 from typing import Any
 
 from ...core.knowledge_graph import KnowledgeGraph
 from ...core.models import DocumentModel
-from ..base import AgentBase, AgentPlan, AgentResult, AgentRole, RepoProfile
-from ..llm_client import chat_text
+from ..base import AgentBase, AgentPlan, AgentResult, AgentRole, Component, RepoProfile
+from ..llm_client import (
+    MAX_KG_ENTITIES,
+    MAX_KG_ENTITIES_SPARSE,
+    capped_desc,
+    chat_text_cached,
+    compact_user_prompt,
+)
+
+# Mermaid node ids: one C-level translate pass instead of chained
+# str.replace calls. Also maps "/" and "." so path-derived names
+# (e.g. a Dockerfile in a nested dir) produce valid ids.
+_MERMAID_SANITIZE = str.maketrans({" ": "_", "-": "_", "/": "_", ".": "_"})
 
 
 class MicroservicesAgent(AgentBase):
@@ -41,119 +52,108 @@ class MicroservicesAgent(AgentBase):
         plan: AgentPlan | None = None,
         prior_results: list[AgentResult] | None = None,
         use_llm: bool = True,
+        precomputed_sections: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> AgentResult:
-        t0 = time.perf_counter()
-        artifacts: dict[str, Any] = {}
-        evidence_ids: list[str] = []
-
-        # 1. Discover services from file tree
-        services = self._discover_services(repo_profile)
-
-        # 2. Generate Mermaid service dependency diagram
-        mermaid_spec = self._build_service_diagram(services)
-        artifacts["service_diagram_mermaid"] = mermaid_spec
-
-        # 3. Produce architecture overview section (LLM or template)
-        if use_llm:
-            try:
-                section_md = await self._build_architecture_section_llm(
-                    services=services,
-                    repo_profile=repo_profile,
-                    knowledge_graph=knowledge_graph,
-                )
-            except Exception:
-                section_md = self._build_architecture_section(
-                    services=services,
-                    repo_name=repo_profile.repo_name,
-                )
-        else:
-            section_md = self._build_architecture_section(
-                services=services,
-                repo_name=repo_profile.repo_name,
-            )
-        artifacts["architecture_section_md"] = section_md
-
-        # 4. Attach metadata
-        artifacts["discovered_services"] = services
-
-        duration = (time.perf_counter() - t0) * 1000
-        return self._make_result(
-            success=True,
-            artifacts=artifacts,
-            evidence_ids=evidence_ids,
-            duration_ms=duration,
-            metadata={"service_count": len(services)},
-        )
+        async with self._timed_result() as r:
+            # 1. Discover services from file tree
+            services = self._discover_services(repo_profile)
+
+            # 2. Generate Mermaid service dependency diagram
+            mermaid_spec = self._build_service_diagram(services)
+            r.artifacts["service_diagram_mermaid"] = mermaid_spec
+
+            # 3. Produce architecture overview section (batched, LLM, or template)
+            section_md = (precomputed_sections or {}).get(self.role.value)
+            if section_md is None:
+                if use_llm:
+                    try:
+                        section_md = await self._build_architecture_section_llm(
+                            services=services,
+                            repo_profile=repo_profile,
+                            knowledge_graph=knowledge_graph,
+                        )
+                    except Exception:
+                        section_md = self._build_architecture_section(
+                            services=services,
+                            repo_name=repo_profile.repo_name,
+                        )
+                else:
+                    section_md = self._build_architecture_section(
+                        services=services,
+                        repo_name=repo_profile.repo_name,
+                    )
+            r.artifacts["architecture_section_md"] = section_md
+
+            # 4. Attach metadata
+            r.artifacts["discovered_services"] = services
+            r.metadata["service_count"] = len(services)
+        return r.result
+
+    def discover_components(self, profile: RepoProfile) -> list[Component]:
+        """Discovery entry point for the orchestrator's batched-section call."""
+        return self._discover_services(profile)
 
     # -- Internal -----------------------------------------------------------
 
-    def _discover_services(self, profile: RepoProfile) -> list[dict[str, Any]]:
+    def _discover_services(self, profile: RepoProfile) -> list[Component]:
         """Extract service definitions from file tree + signals.
 
         TODO: Parse actual docker-compose.yml / K8s manifests via
               ``repo.read`` tool. Currently uses heuristics from the
               file tree.
         """
-        services: list[dict[str, Any]] = []
+        # Single pass: split each path once with rfind, then test the
+        # precomputed basename — avoids re-walking the full path per
+        # predicate and re-splitting on every match.
+        services: list[Component] = []
         for path in profile.file_tree:
+            slash = path.rfind("/")
+            base = path[slash + 1 :]
             if "docker-compose" in path:
-                services.append(
-                    {
-                        "name": "docker-compose",
-                        "source": path,
-                        "type": "compose",
-                    }
-                )
-            elif path.endswith(("deployment.yaml", "deployment.yml")):
-                name = path.split("/")[-2] if "/" in path else "unknown"
-                services.append(
-                    {
-                        "name": name,
-                        "source": path,
-                        "type": "k8s-deployment",
-                    }
-                )
-            elif path.endswith("Dockerfile"):
-                name = path.split("/")[-2] if "/" in path else "app"
-                services.append(
-                    {
-                        "name": name,
-                        "source": path,
-                        "type": "docker",
-                    }
-                )
+                services.append(Component("compose", "docker", "docker-compose", path))
+            elif base.endswith(("deployment.yaml", "deployment.yml")):
+                name = path[path.rfind("/", 0, slash) + 1 : slash] if slash >= 0 else "unknown"
+                services.append(Component("k8s-deployment", "kubernetes", name, path))
+            elif base.endswith("Dockerfile"):
+                name = path[path.rfind("/", 0, slash) + 1 : slash] if slash >= 0 else "app"
+                services.append(Component("docker", "docker", name, path))
         return services
 
-    def _build_service_diagram(self, services: list[dict[str, Any]]) -> str:
-        """Generate a Mermaid service dependency diagram."""
-        lines = ["graph LR"]
+    def _build_service_diagram(self, services: list[Component]) -> str:
+        """Generate a Mermaid service dependency diagram.
+
+        Writes straight to a ``StringIO`` buffer and sanitizes each
+        service name once, reusing the list for the edge pass instead of
+        re-sanitizing every name a second time.
+        """
+        buf = io.StringIO()
+        w = buf.write
+        w("graph LR")
+        names: list[str] = []
         for svc in services:
-            safe_name = svc["name"].replace("-", "_").replace(" ", "_")
-            lines.append(f'    {safe_name}["{svc["name"]}"]')
+            safe_name = svc.name.translate(_MERMAID_SANITIZE)
+            names.append(safe_name)
+            w(f'\n    {safe_name}["{svc.name}"]')
 
         # Add default edges between services (placeholder)
-        if len(services) > 1:
-            names = [s["name"].replace("-", "_").replace(" ", "_") for s in services]
-            for i in range(len(names) - 1):
-                lines.append(f"    {names[i]} --> {names[i + 1]}")
+        for i in range(len(names) - 1):
+            w(f"\n    {names[i]} --> {names[i + 1]}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     async def _build_architecture_section_llm(
         self,
-        services: list[dict[str, Any]],
+        services: list[Component],
         repo_profile: RepoProfile,
         knowledge_graph: KnowledgeGraph,
     ) -> str:
         """Use LLM to generate a rich architecture overview."""
-        svc_desc = (
-            "\n".join(f"- {s['name']} ({s['type']}) from {s.get('source', 'N/A')}" for s in services)
-            or "No services discovered"
-        )
-        entities = ", ".join(e.name for e in knowledge_graph.entities[:15])
+        svc_desc = capped_desc(services, lambda s: f"- {s.name} ({s.type}) from {s.source or 'N/A'}")
+        limit = MAX_KG_ENTITIES if services else MAX_KG_ENTITIES_SPARSE
+        entities = ", ".join(e.name for e in knowledge_graph.entities[:limit])
 
-        return await chat_text(
+        return await chat_text_cached(
             system=(
                 "You are a senior technical writer. Write a detailed Markdown "
                 "architecture overview section for a microservices repository. "
@@ -162,12 +162,14 @@ class MicroservicesAgent(AgentBase):
                 "Use ## headers. Be specific to the discovered services. "
                 "Do NOT invent services that aren't listed."
             ),
-            user=(
-                f"Repository: {repo_profile.repo_name}\n"
-                f"Description: {repo_profile.description[:300]}\n"
-                f"KG entities: {entities}\n\n"
-                f"Discovered services:\n{svc_desc}\n\n"
-                f"Write a detailed architecture overview section."
+            user=compact_user_prompt(
+                [
+                    ("Repository", repo_profile.repo_name),
+                    ("Description", repo_profile.description[:300]),
+                    ("KG entities", entities),
+                    ("Discovered services", svc_desc),
+                ],
+                closing="Write a detailed architecture overview section.",
             ),
             model=self.model,
             max_tokens=1500,
@@ -175,21 +177,20 @@ class MicroservicesAgent(AgentBase):
 
     def _build_architecture_section(
         self,
-        services: list[dict[str, Any]],
+        services: list[Component],
         repo_name: str,
     ) -> str:
         """Generate Markdown architecture overview section."""
-        lines = [
-            f"## Architecture Overview — {repo_name}",
-            "",
-            f"This repository contains **{len(services)}** service(s):",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            f"## Architecture Overview — {repo_name}\n\n"
+            f"This repository contains **{len(services)}** service(s):\n"
+        )
         for svc in services:
-            lines.append(f"- **{svc['name']}** ({svc['type']}) — `{svc['source']}`")
-
-        lines.append("")
-        lines.append("### Service Communication")
-        lines.append("")
-        lines.append("TODO: Document inter-service communication patterns (REST, gRPC, message queues).")
-        return "\n".join(lines)
+            w(f"\n- **{svc.name}** ({svc.type}) — `{svc.source}`")
+        w(
+            "\n\n### Service Communication\n\n"
+            "TODO: Document inter-service communication patterns (REST, gRPC, message queues)."
+        )
+        return buf.getvalue()
@@ -6,12 +6,19 @@ training pipeline diagrams, and inference endpoint docs.
 
 from __future__ import annotations
 
-import time
+import asyncio
+import io
 from typing import Any
 
 from ...core.knowledge_graph import KnowledgeGraph
 from ...core.models import DocumentModel
-from ..base import AgentBase, AgentPlan, AgentResult, AgentRole, RepoProfile
+from ..base import AgentBase, AgentPlan, AgentResult, AgentRole, Component, RepoProfile
+from ..llm_client import MAX_KG_ENTITIES, capped_desc, chat_text_cached, compact_user_prompt
+
+# Mermaid node ids: one C-level translate pass instead of chained
+# str.replace calls. Also maps "/" and "." so path-derived names
+# produce valid ids.
+_MERMAID_SANITIZE = str.maketrans({" ": "_", "-": "_", "/": "_", ".": "_"})
 
 
 class MLAgent(AgentBase):
@@ -29,6 +36,12 @@ class MLAgent(AgentBase):
     ``huggingface``, ``vector-db``, ``rag``.
     """
 
+    #: Signals this agent can act on. Components come exclusively from
+    #: these, so a disjoint profile means there is nothing to document.
+    RELEVANT: frozenset[str] = frozenset(
+        {"ml-training", "pytorch", "tensorflow", "huggingface", "vector-db", "rag"}
+    )
+
     def __init__(self, model: str = "gpt-4o-mini") -> None:
         super().__init__(role=AgentRole.ML, model=model)
 
@@ -41,125 +54,216 @@ class MLAgent(AgentBase):
         plan: AgentPlan | None = None,
         prior_results: list[AgentResult] | None = None,
         use_llm: bool = True,
+        precomputed_sections: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> AgentResult:
-        t0 = time.perf_counter()
-        artifacts: dict[str, Any] = {}
+        # Early exit: no relevant signals means empty components and two
+        # LLM calls with nothing to describe — skip them entirely.
+        if repo_profile.signal_types.isdisjoint(self.RELEVANT):
+            return self._make_result(
+                success=True,
+                artifacts={},
+                duration_ms=0.0,
+                metadata={"skipped": True},
+            )
 
-        # 1. Detect ML components
-        components = self._detect_ml_components(repo_profile)
+        async with self._timed_result() as r:
+            # 1. Detect ML components
+            components = self._detect_ml_components(repo_profile)
 
-        # 2. Generate pipeline diagram
-        mermaid_spec = self._build_pipeline_diagram(components)
-        artifacts["ml_pipeline_mermaid"] = mermaid_spec
+            # 2. Generate pipeline diagram
+            mermaid_spec = self._build_pipeline_diagram(components)
+            r.artifacts["ml_pipeline_mermaid"] = mermaid_spec
 
-        # 3. Generate model card (LLM or template)
-        if use_llm:
-            try:
-                model_card = await self._build_model_card_llm(
-                    components=components,
-                    repo_profile=repo_profile,
-                    knowledge_graph=knowledge_graph,
+            # 3+4. Generate model card and ML architecture section.
+            # The two LLM calls share no state, so they are launched together
+            # and their round-trips overlap; each falls back to its template
+            # independently on failure. The shared context fragment is built
+            # once and forms an identical user-prompt prefix for both calls,
+            # so provider-side prompt caching can reuse it. A batched section
+            # from the orchestrator replaces the architecture call only — the
+            # model card keeps its dedicated prompt.
+            pre_section = (precomputed_sections or {}).get(self.role.value)
+            if use_llm:
+                context = compact_user_prompt(
+                    [
+                        ("Repository", repo_profile.repo_name),
+                        ("Description", repo_profile.description[:300]),
+                        (
+                            "KG entities",
+                            ", ".join(e.name for e in knowledge_graph.entities[:MAX_KG_ENTITIES]),
+                        ),
+                    ]
                 )
-            except Exception:
+                context = f"{context}\n\n" if context else ""
+                if pre_section is not None:
+                    section_md = pre_section
+                    try:
+                        model_card = await self._build_model_card_llm(
+                            components=components, context=context
+                        )
+                    except Exception:
+                        model_card = self._build_model_card(
+                            components=components,
+                            repo_name=repo_profile.repo_name,
+                        )
+                else:
+                    model_card, section_md = await asyncio.gather(
+                        self._build_model_card_llm(components=components, context=context),
+                        self._build_ml_section_llm(components=components, context=context),
+                        return_exceptions=True,
+                    )
+                    if isinstance(model_card, BaseException):
+                        model_card = self._build_model_card(
+                            components=components,
+                            repo_name=repo_profile.repo_name,
+                        )
+                    if isinstance(section_md, BaseException):
+                        section_md = self._build_ml_section(
+                            components=components,
+                            repo_name=repo_profile.repo_name,
+                        )
+            else:
                 model_card = self._build_model_card(
                     components=components,
                     repo_name=repo_profile.repo_name,
                 )
-        else:
-            model_card = self._build_model_card(
-                components=components,
-                repo_name=repo_profile.repo_name,
-            )
-        artifacts["model_card_md"] = model_card
-
-        # 4. Generate ML architecture section (LLM or template)
-        if use_llm:
-            try:
-                section_md = await self._build_ml_section_llm(
-                    components=components,
-                    repo_profile=repo_profile,
-                    knowledge_graph=knowledge_graph,
-                )
-            except Exception:
-                section_md = self._build_ml_section(
+                section_md = pre_section or self._build_ml_section(
                     components=components,
                     repo_name=repo_profile.repo_name,
                 )
-        else:
-            section_md = self._build_ml_section(
-                components=components,
-                repo_name=repo_profile.repo_name,
-            )
-        artifacts["ml_architecture_md"] = section_md
-        artifacts["ml_components"] = components
-
-        duration = (time.perf_counter() - t0) * 1000
-        return self._make_result(
-            success=True,
-            artifacts=artifacts,
-            duration_ms=duration,
-            metadata={"component_count": len(components)},
-        )
+            r.artifacts["model_card_md"] = model_card
+            r.artifacts["ml_architecture_md"] = section_md
+            r.artifacts["ml_components"] = components
+            r.metadata["component_count"] = len(components)
+        return r.result
+
+    def discover_components(self, profile: RepoProfile) -> list[Component]:
+        """Discovery entry point for the orchestrator's batched-section call."""
+        return self._detect_ml_components(profile)
 
     # -- Internal -----------------------------------------------------------
 
-    def _detect_ml_components(self, profile: RepoProfile) -> list[dict[str, Any]]:
+    def _detect_ml_components(self, profile: RepoProfile) -> list[Component]:
         """Detect ML components from signals and file tree.
 
         TODO: Parse requirements.txt / pyproject.toml for ML libraries.
               Scan Python files for training loops, model definitions.
         """
-        components: list[dict[str, Any]] = []
-        signal_types = {s.signal_type for s in profile.signals}
+        components: list[Component] = []
+        signal_types = profile.signal_types
 
         if "pytorch" in signal_types:
-            components.append({"type": "framework", "tech": "pytorch", "name": "PyTorch"})
+            components.append(Component("framework", "pytorch", "PyTorch"))
         if "tensorflow" in signal_types:
-            components.append({"type": "framework", "tech": "tensorflow", "name": "TensorFlow"})
+            components.append(Component("framework", "tensorflow", "TensorFlow"))
         if "huggingface" in signal_types:
-            components.append({"type": "hub", "tech": "huggingface", "name": "HuggingFace"})
+            components.append(Component("hub", "huggingface", "HuggingFace"))
         if "vector-db" in signal_types:
-            components.append({"type": "store", "tech": "vector-db", "name": "Vector Database"})
+            components.append(Component("store", "vector-db", "Vector Database"))
         if "rag" in signal_types:
-            components.append({"type": "pipeline", "tech": "rag", "name": "RAG Pipeline"})
+            components.append(Component("pipeline", "rag", "RAG Pipeline"))
         if "ml-training" in signal_types:
-            components.append({"type": "pipeline", "tech": "training", "name": "Training Pipeline"})
+            components.append(Component("pipeline", "training", "Training Pipeline"))
 
         return components
 
-    def _build_pipeline_diagram(self, components: list[dict[str, Any]]) -> str:
-        """Generate a Mermaid ML pipeline diagram."""
-        lines = ["graph LR"]
-        lines.append('    Data["Data Sources"]')
-        lines.append('    Preprocessing["Preprocessing"]')
-        lines.append("    Data --> Preprocessing")
+    def _build_pipeline_diagram(self, components: list[Component]) -> str:
+        """Generate a Mermaid ML pipeline diagram.
+
+        Written through a single ``StringIO`` buffer — one fragment per
+        component instead of several list appends per branch.
+        """
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            "graph LR"
+            '\n    Data["Data Sources"]'
+            '\n    Preprocessing["Preprocessing"]'
+            "\n    Data --> Preprocessing"
+        )
 
         for comp in components:
-            safe = comp["name"].replace(" ", "_").replace("-", "_")
-            if comp["type"] == "framework":
-                lines.append(f'    {safe}["{comp["name"]}"]')
-                lines.append(f"    Preprocessing --> {safe}")
-                lines.append(f'    {safe} --> Model["Trained Model"]')
-            elif comp["type"] == "pipeline" and comp["tech"] == "rag":
-                lines.append('    Embeddings["Embeddings"]')
-                lines.append('    VectorDB["Vector Store"]')
-                lines.append('    Retrieval["Retrieval"]')
-                lines.append('    LLM["LLM"]')
-                lines.append("    Embeddings --> VectorDB")
-                lines.append("    VectorDB --> Retrieval")
-                lines.append("    Retrieval --> LLM")
-
-        lines.append('    Model --> Inference["Inference API"]')
-        return "\n".join(lines)
+            if comp.type == "framework":
+                safe = comp.name.translate(_MERMAID_SANITIZE)
+                w(
+                    f'\n    {safe}["{comp.name}"]'
+                    f"\n    Preprocessing --> {safe}"
+                    f'\n    {safe} --> Model["Trained Model"]'
+                )
+            elif comp.type == "pipeline" and comp.tech == "rag":
+                w(
+                    '\n    Embeddings["Embeddings"]'
+                    '\n    VectorDB["Vector Store"]'
+                    '\n    Retrieval["Retrieval"]'
+                    '\n    LLM["LLM"]'
+                    "\n    Embeddings --> VectorDB"
+                    "\n    VectorDB --> Retrieval"
+                    "\n    Retrieval --> LLM"
+                )
+
+        w('\n    Model --> Inference["Inference API"]')
+        return buf.getvalue()
+
+    async def _build_model_card_llm(
+        self,
+        components: list[Component],
+        context: str,
+    ) -> str:
+        """Use LLM to generate a rich model card.
+
+        ``context`` is the repo/KG fragment prebuilt in :meth:`run` and
+        shared with :meth:`_build_ml_section_llm` as a common prefix.
+        """
+        comp_desc = (
+            capped_desc(components, lambda c: f"- {c.name} ({c.tech}, {c.type})")
+            or "No components detected"
+        )
+        return await chat_text_cached(
+            system=(
+                "You are an ML documentation specialist. Write a HuggingFace-style "
+                "model card in Markdown. Include model details, intended use, "
+                "training data, evaluation, and ethical considerations. "
+                "Use ## headers. Be specific to the detected components."
+            ),
+            user=f"{context}Detected ML components:\n{comp_desc}\n\nWrite the model card.",
+            model=self.model,
+            max_tokens=1500,
+        )
+
+    async def _build_ml_section_llm(
+        self,
+        components: list[Component],
+        context: str,
+    ) -> str:
+        """Use LLM to generate a rich ML architecture section.
+
+        ``context`` is the repo/KG fragment prebuilt in :meth:`run` and
+        shared with :meth:`_build_model_card_llm` as a common prefix.
+        """
+        comp_desc = (
+            capped_desc(components, lambda c: f"- {c.name} ({c.tech}, {c.type})")
+            or "No components detected"
+        )
+        return await chat_text_cached(
+            system=(
+                "You are an ML platform documentation specialist. Write a detailed "
+                "Markdown ML architecture section. Include training pipeline, "
+                "inference serving, data flow, and experiment tracking. "
+                "Use ## headers. Be specific to the detected components."
+            ),
+            user=f"{context}Detected ML components:\n{comp_desc}\n\nWrite the ML architecture section.",
+            model=self.model,
+            max_tokens=1500,
+        )
 
     def _build_model_card(
         self,
-        components: list[dict[str, Any]],
+        components: list[Component],
         repo_name: str,
     ) -> str:
         """Generate a model card stub (HuggingFace-style)."""
-        techs = ", ".join(c["tech"] for c in components) or "N/A"
+        techs = ", ".join(c.tech for c in components) or "N/A"
         return f"""# Model Card: {repo_name}
 
 ## Model Details
@@ -182,21 +286,20 @@ TODO: Document bias, fairness, and safety considerations.
 
     def _build_ml_section(
         self,
-        components: list[dict[str, Any]],
+        components: list[Component],
         repo_name: str,
     ) -> str:
         """Generate Markdown ML architecture section."""
-        lines = [
-            f"## ML Architecture — {repo_name}",
-            "",
-            f"This repository includes **{len(components)}** ML component(s):",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            f"## ML Architecture — {repo_name}\n\n"
+            f"This repository includes **{len(components)}** ML component(s):\n"
+        )
         for comp in components:
-            lines.append(f"- **{comp['name']}** ({comp['tech']}, {comp['type']})")
-
-        lines.append("")
-        lines.append("### Pipeline Overview")
-        lines.append("")
-        lines.append("TODO: Document data flow, model training, and inference serving.")
-        return "\n".join(lines)
+            w(f"\n- **{comp.name}** ({comp.tech}, {comp.type})")
+        w(
+            "\n\n### Pipeline Overview\n\n"
+            "TODO: Document data flow, model training, and inference serving."
+        )
+        return buf.getvalue()
@@ -13,16 +13,56 @@ figma_tools    — figma.create_frame, figma.add_nodes
 image_tools    — image.generate (icon/illustration via DALL-E / SD)
 doc_tools      — docx.refine, pptx.refine
 publish_tools  — confluence.publish
+
+Import policy
+-------------
+This package is imported by everything that touches ``TOOL_REGISTRY``,
+including CLI paths that never render anything. Heavy backend libraries
+(matplotlib, python-docx, python-pptx, openai, httpx, ...) must
+therefore be imported lazily inside the ``execute`` method that needs
+them — never at module level — and any constructed client cached on the
+tool instance for reuse. For the same reason the adapter classes below
+are exposed through a PEP 562 ``__getattr__``: importing this package
+for the registry alone loads only ``contracts``, and each adapter module
+is materialized the first time its class is actually referenced.
 """
 
-from .chart_tools import ChartGenerateTool
+import importlib
+from typing import Any
+
 from .contracts import TOOL_REGISTRY, ToolContract, ToolParameter
-from .diagram_tools import DiagramRenderTool
-from .doc_tools import DocxRefineTool, PptxRefineTool
-from .figma_tools import FigmaAddNodesTool, FigmaCreateFrameTool
-from .image_tools import ImageGenerateTool
-from .publish_tools import ConfluencePublishTool
-from .repo_tools import RepoDiffTool, RepoReadTool, RepoSearchTool, RepoSummarizeTool
+
+# Adapter class name -> defining submodule. Resolved on first access.
+_LAZY = {
+    "RepoSearchTool": "repo_tools",
+    "RepoReadTool": "repo_tools",
+    "RepoReadBatchTool": "repo_tools",
+    "RepoDiffTool": "repo_tools",
+    "RepoSummarizeTool": "repo_tools",
+    "DiagramRenderTool": "diagram_tools",
+    "ChartGenerateTool": "chart_tools",
+    "FigmaCreateFrameTool": "figma_tools",
+    "FigmaAddNodesTool": "figma_tools",
+    "ImageGenerateTool": "image_tools",
+    "DocxRefineTool": "doc_tools",
+    "PptxRefineTool": "doc_tools",
+    "ConfluencePublishTool": "publish_tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    # Cache so the next access bypasses __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     "ToolContract",
@@ -30,6 +70,7 @@ __all__ = [
     "TOOL_REGISTRY",
     "RepoSearchTool",
     "RepoReadTool",
+    "RepoReadBatchTool",
     "RepoDiffTool",
     "RepoSummarizeTool",
     "DiagramRenderTool",
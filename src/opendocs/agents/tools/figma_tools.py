@@ -6,9 +6,18 @@ programmatically from knowledge graph data.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 
+def _batched(items: list[Any], size: int) -> list[list[Any]]:
+    """Split a list into successive chunks of at most ``size`` items.
+
+    Local stand-in for ``itertools.batched``, which arrives in 3.12.
+    """
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
 class FigmaCreateFrameTool:
     """Create a new Figma frame with specified layout.
 
@@ -18,14 +27,46 @@ class FigmaCreateFrameTool:
     def __init__(self, api_token: str = "") -> None:
         self.api_token = api_token
         self._base_url = "https://api.figma.com/v1"
+        self._client: Any = None
+
+    def _get_client(self) -> Any:
+        """Lazily build the shared HTTP client.
+
+        One client per tool instance keeps a pooled TCP+TLS session
+        across the many REST calls of a publish run instead of paying a
+        fresh handshake per request. httpx is imported here, per the
+        package import policy.
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                headers={
+                    "X-Figma-Token": self.api_token,
+                    # Bodies go out pre-serialized via
+                    # llm_client.json_dump_bytes as content=...
+                    "Content-Type": "application/json",
+                },
+                timeout=30,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Release the pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
         _layout: dict[str, Any] = params["layout"]
         name: str = params["name"]
         _file_key: str = params.get("file_key", "")
 
-        # TODO: POST to Figma API to create frame
-        # TODO: headers = {"X-Figma-Token": self.api_token}
+        # TODO: POST via the shared client:
+        #       await self._get_client().post(
+        #           ..., content=llm_client.json_dump_bytes(body))
+        #       and parse with llm_client.json_loads(resp.content)
         # TODO: parse response for frame_id and figma_url
         return {
             "frame_id": "",  # TODO: from API response
@@ -43,17 +84,74 @@ class FigmaAddNodesTool:
     def __init__(self, api_token: str = "") -> None:
         self.api_token = api_token
         self._base_url = "https://api.figma.com/v1"
+        self._client: Any = None
+
+    def _get_client(self) -> Any:
+        """Lazily build the shared HTTP client.
+
+        One client per tool instance keeps a pooled TCP+TLS session
+        across the many REST calls of a publish run instead of paying a
+        fresh handshake per request. httpx is imported here, per the
+        package import policy.
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                headers={
+                    "X-Figma-Token": self.api_token,
+                    # Bodies go out pre-serialized via
+                    # llm_client.json_dump_bytes as content=...
+                    "Content-Type": "application/json",
+                },
+                timeout=30,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Release the pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    #: Nodes per plugin-bridge request — amortizes the HTTP round-trip
+    #: across many small node writes.
+    _NODE_BATCH_SIZE = 64
+    #: Batches in flight at once, kept under Figma's rate limits.
+    _MAX_CONCURRENT_BATCHES = 4
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
         frame_id: str = params["frame_id"]
-        _nodes: list[dict[str, Any]] = params["nodes"]
+        nodes: list[dict[str, Any]] = params["nodes"]
 
-        # TODO: batch-create nodes via Figma plugin API or REST
-        # TODO: each node spec: {type, position, content, style}
-        # TODO: supported types: "box", "arrow", "text", "image"
-        # TODO: return node_ids for later reference
+        sem = asyncio.Semaphore(self._MAX_CONCURRENT_BATCHES)
+
+        async def post(chunk: list[dict[str, Any]]) -> list[str]:
+            async with sem:
+                return await self._post_node_batch(frame_id, chunk)
+
+        # gather preserves argument order, so node_ids line up with the
+        # order the node specs were given in.
+        batches = await asyncio.gather(*(post(c) for c in _batched(nodes, self._NODE_BATCH_SIZE)))
+        node_ids: list[str] = []
+        for ids in batches:
+            node_ids.extend(ids)
         return {
             "frame_id": frame_id,
-            "node_ids": [],  # TODO: list of created node IDs
+            "node_ids": node_ids,
             "figma_url": "",
         }
+
+    async def _post_node_batch(self, frame_id: str, chunk: list[dict[str, Any]]) -> list[str]:
+        """Create one batch of nodes and return their IDs.
+
+        TODO: POST the plugin-bridge bulk endpoint via the shared
+              client: self._get_client().post(
+                  f"/plugin/{frame_id}/nodes",
+                  content=llm_client.json_dump_bytes({"nodes": chunk}))
+              and parse IDs from llm_client.json_loads(resp.content)
+        TODO: each node spec: {type, position, content, style}
+        TODO: supported types: "box", "arrow", "text", "image"
+        """
+        return []
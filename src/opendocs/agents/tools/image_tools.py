@@ -9,6 +9,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+from .chart_tools import _content_key
+
 
 class ImageGenerateTool:
     """Generate icons/illustrations via AI image generation APIs.
@@ -26,6 +28,35 @@ class ImageGenerateTool:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.provider = provider
+        # Provider SDK client, built lazily on first generate — the
+        # openai import stays out of the registry import path.
+        self._client: Any = None
+        # (styled_prompt, size, provider) -> result dict. Repeats within
+        # one run return without even the stat() the file cache costs;
+        # FIFO-capped so icon-set regenerations can't grow it unbounded.
+        self._result_cache: dict[tuple[str, str, str], dict[str, Any]] = {}
+
+    _RESULT_CACHE_MAX = 1024
+
+    def _get_client(self) -> Any:
+        """Lazily build the shared provider client.
+
+        One AsyncOpenAI per tool instance keeps the underlying HTTP
+        pool, TLS context, and the SDK's rate-limit state alive across
+        generate calls instead of rebuilding them per image. openai is
+        imported here, per the package import policy.
+        """
+        if self._client is None:
+            import openai
+
+            self._client = openai.AsyncOpenAI(api_key=self.api_key)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Release the pooled connections."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
         prompt: str = params["prompt"]
@@ -35,26 +66,53 @@ class ImageGenerateTool:
         # Prepend style guidance to the prompt
         styled_prompt = f"{style} style: {prompt}"
 
+        cache_key = (styled_prompt, size, self.provider)
+        hit = self._result_cache.get(cache_key)
+        if hit is not None and Path(hit["local_path"]).exists():
+            return hit
+
+        local_path = self.output_dir / f"img_{_content_key(styled_prompt, size, self.provider)}.png"
+        if local_path.exists():
+            # Same prompt/size/provider already generated — skip the
+            # API call and the image download entirely.
+            result = {
+                "prompt": styled_prompt,
+                "size": size,
+                "image_url": "",
+                "local_path": str(local_path),
+                "cached": True,
+            }
+            self._remember(cache_key, result)
+            return result
+
         if self.provider == "openai":
-            return await self._generate_openai(styled_prompt, size)
+            result = await self._generate_openai(styled_prompt, size, local_path)
+            if "error" not in result and result["local_path"]:
+                self._remember(cache_key, result)
+            return result
         # TODO: add support for Stable Diffusion, Midjourney, etc.
         return {"error": f"Unsupported provider: {self.provider}"}
 
-    async def _generate_openai(self, prompt: str, size: str) -> dict[str, Any]:
+    def _remember(self, key: tuple[str, str, str], result: dict[str, Any]) -> None:
+        """Memoize a result, evicting the oldest entry past the cap."""
+        if len(self._result_cache) >= self._RESULT_CACHE_MAX:
+            self._result_cache.pop(next(iter(self._result_cache)))
+        self._result_cache[key] = result
+
+    async def _generate_openai(self, prompt: str, size: str, local_path: Path) -> dict[str, Any]:
         """Generate image via OpenAI DALL-E API."""
-        # TODO: import openai
-        # TODO: client = openai.AsyncOpenAI(api_key=self.api_key)
-        # TODO: response = await client.images.generate(
+        # TODO: response = await self._get_client().images.generate(
         #     model="dall-e-3",
         #     prompt=prompt,
         #     size=size,
         #     n=1,
         # )
         # TODO: download image from response.data[0].url
-        # TODO: save to output_dir / f"img_{uuid}.png"
+        # TODO: save to `local_path` (content-addressed, so a repeat
+        #       request short-circuits in execute)
         return {
             "prompt": prompt,
             "size": size,
             "image_url": "",  # TODO: from API response
-            "local_path": "",  # TODO: saved file path
+            "local_path": "",  # TODO: str(local_path) once saving lands
         }
@@ -6,6 +6,7 @@ creating or updating pages as needed.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 
@@ -26,25 +27,133 @@ class ConfluencePublishTool:
         self.username = username
         self.api_token = api_token
         self._api_url = f"{self.base_url}/wiki/rest/api/content"
+        self._client: Any = None
+        # (space_key, title) -> page_id, kept for the life of the tool
+        # instance so re-publishes of the same tree skip the existence
+        # lookup for pages we already know about.
+        self._exists_cache: dict[tuple[str, str], str] = {}
+
+    def _get_client(self) -> Any:
+        """Lazily build the shared HTTP client.
+
+        A publish run walks the whole page tree with one REST call per
+        page; a single client reuses the pooled TCP+TLS session and
+        carries the basic-auth credentials, set once. httpx is imported
+        here, per the package import policy.
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url=self._api_url,
+                auth=(self.username, self.api_token),
+                # Bodies are pre-serialized with json_dump_bytes and
+                # passed as content=..., so the type is fixed up front.
+                headers={"Content-Type": "application/json"},
+                timeout=30,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Release the pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    #: Confluence calls in flight at once per publish run — enough to
+    #: overlap network latency without tripping Atlassian rate limits.
+    _MAX_CONCURRENT_PAGES = 8
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        _page_tree: dict[str, Any] = params["page_tree_model"]
+        page_tree: dict[str, Any] = params["page_tree_model"]
         space_key: str = params["space_key"]
         parent_page_id: str = params.get("parent_page_id", "")
 
         # TODO: validate page_tree structure
         #   Expected: {title, body, children: [{title, body, children}]}
-        # TODO: for each page in tree (depth-first):
-        #   1. Check if page exists (GET by title + space)
-        #   2. If exists → update (PUT with version increment)
-        #   3. If not → create (POST with parent ID)
-        # TODO: handle rate limiting / pagination
-        # TODO: return root page URL
+        counts = {"created": 0, "updated": 0}
+        root_page_id = ""
+        if page_tree:
+            sem = asyncio.Semaphore(self._MAX_CONCURRENT_PAGES)
+            root_page_id = await self._publish_subtree(
+                page_tree, parent_page_id, space_key, sem, counts
+            )
         return {
             "space_key": space_key,
             "parent_page_id": parent_page_id,
             "page_url": "",  # TODO: root page URL
-            "page_id": "",  # TODO: root page ID
-            "pages_created": 0,  # TODO: count
-            "pages_updated": 0,  # TODO: count
+            "page_id": root_page_id,
+            "pages_created": counts["created"],
+            "pages_updated": counts["updated"],
         }
+
+    async def _publish_subtree(
+        self,
+        page: dict[str, Any],
+        parent_id: str,
+        space_key: str,
+        sem: asyncio.Semaphore,
+        counts: dict[str, int],
+    ) -> str:
+        """Publish one page, then fan its children out concurrently.
+
+        Siblings depend only on their parent's ID, so each level is
+        published with ``asyncio.gather`` under the shared semaphore —
+        the per-call Confluence latency overlaps across in-flight
+        siblings instead of accumulating along a serial DFS. The
+        semaphore is held only for the page's own REST call, never
+        while waiting on children, so deep trees cannot deadlock.
+        """
+        async with sem:
+            page_id = await self._create_or_update(page, parent_id, space_key, counts)
+        children = page.get("children", [])
+        if children:
+            await asyncio.gather(
+                *(self._publish_subtree(child, page_id, space_key, sem, counts) for child in children)
+            )
+        return page_id
+
+    async def _create_or_update(
+        self,
+        page: dict[str, Any],
+        parent_id: str,
+        space_key: str,
+        counts: dict[str, int],
+    ) -> str:
+        """Create or update a single page and return its ID.
+
+        TODO: via self._get_client():
+          1. Check if page exists (self._get_page_by_title)
+          2. If exists → update (PUT with version increment) and bump
+             counts["updated"]
+          3. If not → create (POST with parent ID) and bump
+             counts["created"]
+          4. Serialize bodies with content=llm_client.json_dump_bytes(
+             body) and parse replies with llm_client.json_loads(
+             resp.content) — page bodies can be large and the orjson
+             path skips the str→bytes encode on the socket write
+          5. Stamp self._exists_cache[(space_key, page["title"])] with
+             the resulting ID so later publishes skip the lookup
+          6. Handle rate limiting / pagination
+        """
+        return ""
+
+    async def _get_page_by_title(self, space_key: str, title: str) -> str:
+        """Resolve an existing page's ID, or "" if it does not exist.
+
+        Hits the instance cache first — within one publish each
+        (space, title) pair occurs at most once, but across re-publishes
+        the same titles recur, and every cache hit saves a CQL search
+        round-trip.
+        """
+        key = (space_key, title)
+        page_id = self._exists_cache.get(key)
+        if page_id is not None:
+            return page_id
+        # TODO: GET content/search?cql=space="{space_key}" and
+        #       title="{title}" via self._get_client(); take the first
+        #       result's ID (or "" on no match)
+        page_id = ""
+        if page_id:
+            self._exists_cache[key] = page_id
+        return page_id
@@ -10,7 +10,6 @@ from rich.console import Console
 from .core.models import OutputFormat
 from .core.template_vars import load_template_vars
 from .generators.themes import list_themes
-from .pipeline import Pipeline
 
 console = Console()
 
@@ -40,6 +39,33 @@ FORMAT_MAP = {
     "all": OutputFormat.ALL,
 }
 
+# Computed once at import — the choice lists are referenced by several
+# command decorators, and list_themes() reads theme definitions, so the
+# per-decorator calls did that work once per command.
+_THEME_NAMES = tuple(t.name for t in list_themes())
+_FORMAT_CHOICES = (
+    "word",
+    "pdf",
+    "pptx",
+    "blog",
+    "jira",
+    "changelog",
+    "latex",
+    "onepager",
+    "social",
+    "faq",
+    "architecture",
+    "all",
+)
+
+# Notebook detection is a pure suffix test; doing it inline keeps the
+# notebook parser (and its imports) off the common URL path.
+_NB_SUFFIX = ".ipynb"
+
+
+def _looks_like_notebook(source: str) -> bool:
+    return "://" not in source and source.lower().endswith(_NB_SUFFIX)
+
 
 @click.group()
 @click.version_option(version="0.9.0", prog_name="opendocs")
@@ -54,23 +80,7 @@ def main():
     "-f",
     "--format",
     "fmt",
-    type=click.Choice(
-        [
-            "word",
-            "pdf",
-            "pptx",
-            "blog",
-            "jira",
-            "changelog",
-            "latex",
-            "onepager",
-            "social",
-            "faq",
-            "architecture",
-            "all",
-        ],
-        case_sensitive=False,
-    ),
+    type=click.Choice(_FORMAT_CHOICES, case_sensitive=False),
     default="all",
     help="Output format (default: all).",
 )
@@ -97,7 +107,7 @@ def main():
 @click.option(
     "--theme",
     "theme_name",
-    type=click.Choice([t.name for t in list_themes()], case_sensitive=False),
+    type=click.Choice(_THEME_NAMES, case_sensitive=False),
     default="corporate",
     help="Color theme for generated documents.",
 )
@@ -269,9 +279,7 @@ def generate(
     )
 
     # Auto-detect notebooks
-    from .core.notebook_parser import is_notebook
-
-    if is_notebook(source) and not local:
+    if _looks_like_notebook(source) and not local:
         local = True  # Notebooks are always local files
 
     # Resolve formats
@@ -294,7 +302,12 @@ def generate(
     else:
         formats = [chosen]
 
-    # Run pipeline — folder path or single file/URL
+    # Run pipeline — folder path or single file/URL. Imported here, not
+    # at module top: the pipeline pulls in every generator backend
+    # (docx, pptx, reportlab), which dominates cold-start for commands
+    # that never generate.
+    from .pipeline import Pipeline
+
     pipeline = Pipeline(github_token=token)
     source_path = Path(source)
 
@@ -422,10 +435,8 @@ def themes():
     table.add_column("Body Font")
 
     for t in list_themes():
-        p = t.colors.primary
-        a = t.colors.accent
-        p_hex = f"#{p[0]:02X}{p[1]:02X}{p[2]:02X}"
-        a_hex = f"#{a[0]:02X}{a[1]:02X}{a[2]:02X}"
+        p_hex = t.colors.primary_hex
+        a_hex = t.colors.accent_hex
         table.add_row(
             t.name,
             f"[{p_hex}]██ {p_hex}[/]",
@@ -446,12 +457,14 @@ def inspect(source: str, local: bool, token: str | None):
     from rich.tree import Tree
 
     from .core.fetcher import ReadmeFetcher
-    from .core.notebook_parser import NotebookParser, is_notebook
     from .core.parser import ReadmeParser
 
-    if is_notebook(source):
+    if _looks_like_notebook(source):
+        from .core.notebook_parser import NotebookParser
+
+        name = Path(source).stem
         parser = NotebookParser()
-        doc = parser.parse(source, repo_name=Path(source).stem)
+        doc = parser.parse(source, repo_name=name)
     else:
         fetcher = ReadmeFetcher(github_token=token)
         if local:
@@ -515,30 +528,14 @@ def inspect(source: str, local: bool, token: str | None):
     "-f",
     "--format",
     "fmt",
-    type=click.Choice(
-        [
-            "word",
-            "pdf",
-            "pptx",
-            "blog",
-            "jira",
-            "changelog",
-            "latex",
-            "onepager",
-            "social",
-            "faq",
-            "architecture",
-            "all",
-        ],
-        case_sensitive=False,
-    ),
+    type=click.Choice(_FORMAT_CHOICES, case_sensitive=False),
     default="all",
     help="Output format (default: all).",
 )
 @click.option(
     "--theme",
     "theme_name",
-    type=click.Choice([t.name for t in list_themes()], case_sensitive=False),
+    type=click.Choice(_THEME_NAMES, case_sensitive=False),
     default="corporate",
     help="Color theme for generated documents.",
 )
@@ -595,10 +592,18 @@ def watch(
 
     from .core.watcher import FileWatcher
 
-    # Parse patterns
+    # Parse patterns, compiling them once up front — every watch cycle
+    # matches against the compiled spec instead of re-globbing per pattern.
     pattern_list = None
+    pattern_spec = None
     if patterns:
         pattern_list = [p.strip() for p in patterns.split(",") if p.strip()]
+        try:
+            import pathspec
+        except ImportError:
+            pass  # fall back to per-pattern globbing in the watcher
+        else:
+            pattern_spec = pathspec.PathSpec.from_lines("gitwildmatch", pattern_list)
 
     # Parse formats
     fmt_list = None
@@ -610,6 +615,7 @@ def watch(
         output_dir=output_dir,
         interval=interval,
         patterns=pattern_list,
+        pattern_spec=pattern_spec,
         auto_pr=auto_pr,
         branch_name=branch_name,
         formats=fmt_list,
@@ -643,23 +649,7 @@ def _add_section_tree(parent, section):
     "-f",
     "--format",
     "fmt",
-    type=click.Choice(
-        [
-            "word",
-            "pdf",
-            "pptx",
-            "blog",
-            "jira",
-            "changelog",
-            "latex",
-            "onepager",
-            "social",
-            "faq",
-            "architecture",
-            "all",
-        ],
-        case_sensitive=False,
-    ),
+    type=click.Choice(_FORMAT_CHOICES, case_sensitive=False),
     default="all",
     help="Output format (default: all).",
 )
@@ -674,7 +664,7 @@ def _add_section_tree(parent, section):
 @click.option(
     "--theme",
     "theme_name",
-    type=click.Choice([t.name for t in list_themes()], case_sensitive=False),
+    type=click.Choice(_THEME_NAMES, case_sensitive=False),
     default="corporate",
     help="Color theme for generated documents.",
 )
@@ -800,6 +790,8 @@ def codebase(
     else:
         formats = [chosen]
 
+    from .pipeline import Pipeline
+
     pipeline = Pipeline()
 
     # When using SLM provider with basic mode, auto-switch to LLM mode.
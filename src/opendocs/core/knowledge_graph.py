@@ -11,12 +11,13 @@ The KG sits between the parser and generators:
 
 from __future__ import annotations
 
+import heapq
 import random
 from collections import Counter, defaultdict
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 # ---------------------------------------------------------------------------
 # Entity types
@@ -70,6 +71,39 @@ class RelationType(str, Enum):
     SIMILAR_TO = "similar_to"
 
 
+# Display labels used by to_mermaid, precomputed once per process so the
+# export loop does dict lookups instead of re-running the same string
+# transforms for every entity and relation.
+_TYPE_LABEL = {et: et.value.replace("_", " ").title() for et in EntityType}
+_REL_LABEL = {rt: rt.value.replace("_", " ") for rt in RelationType}
+
+# Translation tables for Mermaid sanitization -- one pass per string
+# instead of chained replace() calls, each of which copies the string.
+_ID_TRANS = str.maketrans({"-": "_", " ": "_"})
+_QUOTE_TRANS = str.maketrans({'"': "'"})
+
+# Architectural subgraph ordering for to_mermaid (most important first)
+_MERMAID_TYPE_ORDER = (
+    EntityType.PROJECT,
+    EntityType.COMPONENT,
+    EntityType.FEATURE,
+    EntityType.FRAMEWORK,
+    EntityType.TECHNOLOGY,
+    EntityType.LANGUAGE,
+    EntityType.CLOUD_SERVICE,
+    EntityType.PLATFORM,
+    EntityType.DATABASE,
+    EntityType.API_ENDPOINT,
+    EntityType.PROTOCOL,
+    EntityType.CONFIGURATION,
+    EntityType.METRIC,
+    EntityType.HARDWARE,
+    EntityType.PERSON_ORG,
+    EntityType.LICENSE_TYPE,
+    EntityType.PREREQUISITE,
+)
+
+
 # ---------------------------------------------------------------------------
 # Core KG models
 # ---------------------------------------------------------------------------
@@ -78,6 +112,8 @@ class RelationType(str, Enum):
 class Entity(BaseModel):
     """A semantic entity extracted from the README."""
 
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     id: str
     name: str
     entity_type: EntityType
@@ -108,6 +144,8 @@ class Entity(BaseModel):
 class Relation(BaseModel):
     """A directed relationship between two entities."""
 
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     source_id: str
     target_id: str
     relation_type: RelationType
@@ -137,6 +175,8 @@ class KnowledgeGraph(BaseModel):
     tech stack, APIs, metrics, and dependencies.
     """
 
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     entities: list[Entity] = Field(default_factory=list)
     relations: list[Relation] = Field(default_factory=list)
     summary: str = ""
@@ -152,48 +192,104 @@ class KnowledgeGraph(BaseModel):
     llm_faq: list[dict[str, str]] = Field(default_factory=list)  # [{q:, a:}]
     llm_sections: dict[str, str] = Field(default_factory=dict)  # title -> rewritten prose
 
+    # -- Lookup indices ---------------------------------------------------
+    # Maintained by add_entity/add_relation so lookups and dedup checks
+    # are O(1) instead of rescanning the lists; graphs with thousands of
+    # entities made merge() quadratic otherwise. Rebuilt after
+    # validation so deserialized graphs index their pre-loaded lists.
+
+    _by_id: dict[str, Entity] = PrivateAttr(default_factory=dict)
+    _rel_keys: set[str] = PrivateAttr(default_factory=set)
+    _out: dict[str, list[Relation]] = PrivateAttr(default_factory=dict)
+    _in: dict[str, list[Relation]] = PrivateAttr(default_factory=dict)
+    _by_type: dict[EntityType, list[Entity]] = PrivateAttr(default_factory=dict)
+    _method_counts: Counter = PrivateAttr(default_factory=Counter)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._by_id = {e.id: e for e in self.entities}
+        self._rel_keys = {r.key for r in self.relations}
+        self._out = {}
+        self._in = {}
+        for r in self.relations:
+            self._out.setdefault(r.source_id, []).append(r)
+            self._in.setdefault(r.target_id, []).append(r)
+        self._by_type = {}
+        self._method_counts = Counter()
+        for e in self.entities:
+            self._by_type.setdefault(e.entity_type, []).append(e)
+            self._method_counts[e.extraction_method] += 1
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> KnowledgeGraph:
+        """Build a graph from a dict this process produced (a prior model_dump()).
+
+        Skips per-field validation via model_construct, which roughly
+        halves load time on large graphs. Enum fields are coerced
+        explicitly because model_construct does not coerce. Never feed
+        this untrusted input -- use model_validate for that.
+        """
+        entities = [
+            Entity.model_construct(**{**e, "entity_type": EntityType(e["entity_type"])})
+            for e in data.get("entities", [])
+        ]
+        relations = [
+            Relation.model_construct(**{**r, "relation_type": RelationType(r["relation_type"])})
+            for r in data.get("relations", [])
+        ]
+        extra = {k: v for k, v in data.items() if k not in ("entities", "relations")}
+        return cls.model_construct(entities=entities, relations=relations, **extra)
+
     # -- Query helpers ---------------------------------------------------
 
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Find an entity by ID."""
-        for e in self.entities:
-            if e.id == entity_id:
-                return e
-        return None
+        return self._by_id.get(entity_id)
 
     def entities_of_type(self, entity_type: EntityType) -> list[Entity]:
         """Return all entities of a given type."""
-        return [e for e in self.entities if e.entity_type == entity_type]
+        return list(self._by_type.get(entity_type, ()))
 
     def relations_from(self, entity_id: str) -> list[Relation]:
         """Return all relations originating from an entity."""
-        return [r for r in self.relations if r.source_id == entity_id]
+        return list(self._out.get(entity_id, ()))
 
     def relations_to(self, entity_id: str) -> list[Relation]:
         """Return all relations pointing to an entity."""
-        return [r for r in self.relations if r.target_id == entity_id]
+        return list(self._in.get(entity_id, ()))
 
     def neighbors(self, entity_id: str) -> list[Entity]:
         """Return all entities connected to a given entity."""
-        connected_ids = set()
-        for r in self.relations:
-            if r.source_id == entity_id:
-                connected_ids.add(r.target_id)
-            elif r.target_id == entity_id:
-                connected_ids.add(r.source_id)
-        return [e for e in self.entities if e.id in connected_ids]
+        seen: set[str] = set()
+        result: list[Entity] = []
+        for r in self._out.get(entity_id, ()):
+            if r.target_id not in seen:
+                seen.add(r.target_id)
+                ent = self._by_id.get(r.target_id)
+                if ent is not None:
+                    result.append(ent)
+        for r in self._in.get(entity_id, ()):
+            if r.source_id not in seen:
+                seen.add(r.source_id)
+                ent = self._by_id.get(r.source_id)
+                if ent is not None:
+                    result.append(ent)
+        return result
 
     def add_entity(self, entity: Entity) -> None:
         """Add entity if not already present (by ID)."""
-        existing_ids = {e.id for e in self.entities}
-        if entity.id not in existing_ids:
+        if entity.id not in self._by_id:
+            self._by_id[entity.id] = entity
             self.entities.append(entity)
+            self._by_type.setdefault(entity.entity_type, []).append(entity)
+            self._method_counts[entity.extraction_method] += 1
 
     def add_relation(self, relation: Relation) -> None:
         """Add relation if not duplicate."""
-        existing_keys = {r.key for r in self.relations}
-        if relation.key not in existing_keys:
+        if relation.key not in self._rel_keys:
+            self._rel_keys.add(relation.key)
             self.relations.append(relation)
+            self._out.setdefault(relation.source_id, []).append(relation)
+            self._in.setdefault(relation.target_id, []).append(relation)
 
     def merge(self, other: KnowledgeGraph) -> None:
         """Merge another KG into this one (deduplicating)."""
@@ -216,75 +312,45 @@ class KnowledgeGraph(BaseModel):
         """
         entities = self.entities
         if max_entities > 0 and len(entities) > max_entities:
-            entities = sorted(entities, key=lambda e: e.confidence, reverse=True)[:max_entities]
+            # O(N log k) top-N selection instead of a full sort
+            entities = heapq.nlargest(max_entities, entities, key=lambda e: e.confidence)
 
-        valid_ids = {e.id for e in entities}
+        # Mermaid-safe node ids, computed once per entity; the keys double
+        # as the set of included ids when filtering relations below.
+        safe_ids = {e.id: e.id.translate(_ID_TRANS) for e in entities}
 
         # Group entities by type
-        groups: dict[str, list[Entity]] = {}
+        groups: dict[EntityType, list[Entity]] = {}
         for e in entities:
-            label = e.entity_type.value.replace("_", " ").title()
-            groups.setdefault(label, []).append(e)
-
-        # Architectural group ordering (most important first)
-        type_order = [
-            "Project",
-            "Component",
-            "Feature",
-            "Framework",
-            "Technology",
-            "Language",
-            "Cloud Service",
-            "Platform",
-            "Database",
-            "Api Endpoint",
-            "Protocol",
-            "Configuration",
-            "Metric",
-            "Hardware",
-            "Person Org",
-            "License",
-            "Prerequisite",
-        ]
+            groups.setdefault(e.entity_type, []).append(e)
+
+        # Architecturally important types first, then anything else in
+        # grouping order (future-proofing against new EntityType members).
+        ordered = [et for et in _MERMAID_TYPE_ORDER if et in groups]
+        ordered += [et for et in groups if et not in _MERMAID_TYPE_ORDER]
 
         lines = ["graph LR"]
 
         # Subgraphs per entity type
-        for type_label in type_order:
-            ents = groups.pop(type_label, [])
-            if not ents:
-                continue
-            safe_sg = type_label.replace(" ", "_")
-            lines.append(f'    subgraph {safe_sg}["{type_label}"]')
-            for e in ents[:8]:  # cap per group for readability
-                safe_id = e.id.replace("-", "_").replace(" ", "_")
-                safe_name = e.name.replace('"', "'")
-                lines.append(f'        {safe_id}["{safe_name}"]')
-            lines.append("    end")
-
-        # Any remaining types
-        for type_label, ents in groups.items():
-            if not ents:
-                continue
-            safe_sg = type_label.replace(" ", "_")
+        for et in ordered:
+            type_label = _TYPE_LABEL[et]
+            safe_sg = type_label.translate(_ID_TRANS)
             lines.append(f'    subgraph {safe_sg}["{type_label}"]')
-            for e in ents[:8]:
-                safe_id = e.id.replace("-", "_").replace(" ", "_")
-                safe_name = e.name.replace('"', "'")
-                lines.append(f'        {safe_id}["{safe_name}"]')
+            for e in groups[et][:8]:  # cap per group for readability
+                safe_name = e.name.translate(_QUOTE_TRANS)
+                lines.append(f'        {safe_ids[e.id]}["{safe_name}"]')
             lines.append("    end")
 
         # Edges — only between included nodes, deduplicate
         seen_edges: set[str] = set()
         for r in self.relations:
-            if r.source_id in valid_ids and r.target_id in valid_ids:
-                src = r.source_id.replace("-", "_").replace(" ", "_")
-                tgt = r.target_id.replace("-", "_").replace(" ", "_")
+            if r.source_id in safe_ids and r.target_id in safe_ids:
+                src = safe_ids[r.source_id]
+                tgt = safe_ids[r.target_id]
                 edge_key = f"{src}->{tgt}"
                 if edge_key not in seen_edges:
                     seen_edges.add(edge_key)
-                    label = r.relation_type.value.replace("_", " ")
-                    lines.append(f"    {src} -->|{label}| {tgt}")
+                    lines.append(f"    {src} -->|{_REL_LABEL[r.relation_type]}| {tgt}")
 
         return "\n".join(lines)
 
@@ -295,13 +361,11 @@ class KnowledgeGraph(BaseModel):
             "total_relations": len(self.relations),
         }
         for et in EntityType:
-            count = len(self.entities_of_type(et))
+            count = len(self._by_type.get(et, ()))
             if count > 0:
                 stats[f"entities_{et.value}"] = count
-        deterministic = sum(1 for e in self.entities if e.extraction_method == "deterministic")
-        llm_count = sum(1 for e in self.entities if e.extraction_method == "llm")
-        stats["deterministic_entities"] = deterministic
-        stats["llm_entities"] = llm_count
+        stats["deterministic_entities"] = self._method_counts["deterministic"]
+        stats["llm_entities"] = self._method_counts["llm"]
         self.extraction_stats = stats
         return stats
 
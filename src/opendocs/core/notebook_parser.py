@@ -14,22 +14,51 @@ from __future__ import annotations
 
 import json
 import re
+from bisect import bisect_left
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+# orjson parses C-side, several times faster than stdlib json — it
+# dominates load time for notebooks carrying base64-embedded images.
+# Optional, like elsewhere in the codebase; stdlib json is the fallback.
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 from .models import (
     BlockquoteBlock,
+    BlockType,
     CodeBlock,
     ContentBlock,
     DocumentMetadata,
     DocumentModel,
-    HeadingBlock,
     ImageBlock,
-    ParagraphBlock,
     Section,
 )
 
+# Compiled once — these run for every output of every code cell
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")  # ANSI colour escapes in tracebacks
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _join(src: str | list[str]) -> str:
+    """Join nbformat ``source``/``data`` content into a single string.
+
+    nbformat allows either a list of lines or one plain string; the
+    blind ``"".join(...)`` used to copy the single-string case
+    character by character.
+    """
+    if isinstance(src, str):
+        return src
+    if len(src) == 1:
+        return src[0]
+    return "".join(src)
+
+
 # ---------------------------------------------------------------------------
 # Output renderers — turn cell outputs into ContentBlocks
 # ---------------------------------------------------------------------------
@@ -37,7 +66,7 @@ from .models import (
 
 def _render_stream_output(output: dict[str, Any]) -> list[ContentBlock]:
     """Render ``stream`` output (stdout / stderr)."""
-    text = "".join(output.get("text", []))
+    text = _join(output.get("text", []))
     if not text.strip():
         return []
     return [CodeBlock(language="text", code=text.rstrip())]
@@ -51,42 +80,38 @@ def _render_execute_result(output: dict[str, Any]) -> list[ContentBlock]:
     # Prefer image output (PNG > SVG > JPEG)
     for mime in ("image/png", "image/svg+xml", "image/jpeg"):
         if mime in data:
-            b64 = data[mime]
-            if isinstance(b64, list):
-                b64 = "".join(b64)
+            b64 = _join(data[mime])
+            # Only strip when needed — strip() walks the whole payload,
+            # and inline images can be megabytes of base64
+            if b64[:1].isspace() or b64[-1:].isspace():
+                b64 = b64.strip()
             # Store as data-URI so generators can inline it
             blocks.append(
                 ImageBlock(
                     alt="Cell output",
-                    src=f"data:{mime};base64,{b64.strip()}",
+                    src=f"data:{mime};base64,{b64}",
                 )
             )
             return blocks
 
     # HTML output (render as blockquote with truncated preview)
     if "text/html" in data:
-        html = data["text/html"]
-        if isinstance(html, list):
-            html = "".join(html)
+        html = _join(data["text/html"])
         # Strip tags for plain-text preview
-        plain = re.sub(r"<[^>]+>", "", html).strip()
+        plain = _HTML_TAG_RE.sub("", html).strip()
         if plain:
             blocks.append(BlockquoteBlock(text=f"[HTML output] {plain[:500]}"))
             return blocks
 
     # LaTeX / math output
     if "text/latex" in data:
-        latex = data["text/latex"]
-        if isinstance(latex, list):
-            latex = "".join(latex)
+        latex = _join(data["text/latex"])
         blocks.append(CodeBlock(language="latex", code=latex.strip()))
         return blocks
 
     # Plain text fallback
     if "text/plain" in data:
-        text = data["text/plain"]
-        if isinstance(text, list):
-            text = "".join(text)
+        text = _join(data["text/plain"])
         if text.strip():
             blocks.append(CodeBlock(language="text", code=text.strip()))
 
@@ -95,11 +120,10 @@ def _render_execute_result(output: dict[str, Any]) -> list[ContentBlock]:
 
 def _render_error_output(output: dict[str, Any]) -> list[ContentBlock]:
     """Render ``error`` output (tracebacks)."""
-    # ANSI escape codes are common in tracebacks — strip them
-    ansi_re = re.compile(r"\x1b\[[0-9;]*m")
+    # ANSI escape codes are common in tracebacks — strip them in one
+    # substitution over the joined text rather than one per line
     traceback_lines = output.get("traceback", [])
-    cleaned = [ansi_re.sub("", line) for line in traceback_lines]
-    text = "\n".join(cleaned)
+    text = _ANSI_RE.sub("", "\n".join(traceback_lines))
     if text.strip():
         return [CodeBlock(language="text", code=f"[Error] {text.strip()}")]
     return []
@@ -133,18 +157,19 @@ class NotebookParser:
         doc = parser.parse("path/to/notebook.ipynb")
     """
 
-    def __init__(self) -> None:
-        # Lazy import — only needed when notebook contains markdown cells
-        self._md_parser = None
+    # Shared across instances — callers typically create one
+    # NotebookParser per notebook, and ReadmeParser construction (the
+    # full markdown pipeline) is too expensive to repeat per file.
+    _shared_md_parser = None
 
     @property
     def md_parser(self):
-        """Lazily create a ReadmeParser for markdown cells."""
-        if self._md_parser is None:
+        """Lazily create the shared ReadmeParser for markdown cells."""
+        if NotebookParser._shared_md_parser is None:
             from .parser import ReadmeParser
 
-            self._md_parser = ReadmeParser()
-        return self._md_parser
+            NotebookParser._shared_md_parser = ReadmeParser()
+        return NotebookParser._shared_md_parser
 
     # ------------------------------------------------------------------
     # Public API
@@ -175,8 +200,11 @@ class NotebookParser:
         if not path.exists():
             raise FileNotFoundError(f"Notebook not found: {path}")
 
-        with open(path, encoding="utf-8") as f:
-            nb = json.load(f)
+        if _HAS_ORJSON:
+            nb = orjson.loads(path.read_bytes())
+        else:
+            with open(path, encoding="utf-8") as f:
+                nb = json.load(f)
 
         return self._parse_notebook(nb, path, repo_name=repo_name, repo_url=repo_url, include_outputs=include_outputs)
 
@@ -190,7 +218,7 @@ class NotebookParser:
         include_outputs: bool = True,
     ) -> DocumentModel:
         """Parse notebook JSON content (as string) into a ``DocumentModel``."""
-        nb = json.loads(content)
+        nb = orjson.loads(content) if _HAS_ORJSON else json.loads(content)
         return self._parse_notebook(
             nb,
             source_path=source_path,
@@ -224,16 +252,20 @@ class NotebookParser:
         cells = nb.get("cells", [])
 
         all_blocks: list[ContentBlock] = []
+        raw_parts: list[str] = []  # raw markdown fallback, built in the same pass
+        mermaid_diagrams: list[str] = []
         cell_count = {"markdown": 0, "code": 0, "output": 0}
 
         for cell in cells:
             cell_type = cell.get("cell_type", "")
-            cell_source = "".join(cell.get("source", []))
+            cell_source = _join(cell.get("source", []))
 
             if cell_type == "markdown":
                 cell_count["markdown"] += 1
                 md_blocks = self._parse_markdown_cell(cell_source)
                 all_blocks.extend(md_blocks)
+                mermaid_diagrams.extend(b.code for b in md_blocks if b.type is BlockType.MERMAID)
+                raw_parts.append(cell_source)
 
             elif cell_type == "code":
                 cell_count["code"] += 1
@@ -243,6 +275,7 @@ class NotebookParser:
                         code=cell_source,
                     )
                     all_blocks.append(code_block)
+                    raw_parts.append(f"```{language}\n{cell_source}\n```")
 
                 # Process outputs
                 if include_outputs:
@@ -263,7 +296,7 @@ class NotebookParser:
         # Derive description
         description = ""
         for b in all_blocks:
-            if isinstance(b, ParagraphBlock):
+            if b.type is BlockType.PARAGRAPH:
                 description = b.text[:300]
                 break
         if not description and kernel_display:
@@ -281,20 +314,6 @@ class NotebookParser:
             generated_at=datetime.now(timezone.utc).isoformat(),
         )
 
-        # Collect mermaid diagrams
-        from .models import MermaidBlock
-
-        mermaid_diagrams = [b.code for b in all_blocks if isinstance(b, MermaidBlock)]
-
-        # Reconstruct raw markdown from markdown cells for fallback use
-        raw_parts: list[str] = []
-        for cell in cells:
-            if cell.get("cell_type") == "markdown":
-                raw_parts.append("".join(cell.get("source", [])))
-            elif cell.get("cell_type") == "code":
-                src = "".join(cell.get("source", []))
-                if src.strip():
-                    raw_parts.append(f"```{language}\n{src}\n```")
         raw_markdown = "\n\n".join(raw_parts)
 
         return DocumentModel(
@@ -319,16 +338,23 @@ class NotebookParser:
         """Group blocks into a hierarchical section tree based on headings."""
         root_sections: list[Section] = []
         section_stack: list[Section] = []
+        # Stack levels are strictly increasing, so the ancestors to keep
+        # for a new heading are found with one bisect instead of popping
+        # (and re-reading .level) once per discarded section.
+        levels: list[int] = []
 
         for block in blocks:
-            if isinstance(block, HeadingBlock):
+            # Dispatch on the BlockType tag the models already carry --
+            # one C-level attribute fetch vs isinstance's MRO walk
+            if block.type is BlockType.HEADING:
                 new_section = Section(
                     title=block.text,
                     level=block.level,
                     blocks=[],
                 )
-                while section_stack and section_stack[-1].level >= block.level:
-                    section_stack.pop()
+                idx = bisect_left(levels, block.level)
+                del section_stack[idx:]
+                del levels[idx:]
 
                 if section_stack:
                     section_stack[-1].subsections.append(new_section)
@@ -336,6 +362,7 @@ class NotebookParser:
                     root_sections.append(new_section)
 
                 section_stack.append(new_section)
+                levels.append(block.level)
             else:
                 if section_stack:
                     section_stack[-1].blocks.append(block)
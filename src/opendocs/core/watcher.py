@@ -5,7 +5,8 @@ key files and automatically regenerates documentation when changes are
 detected.  Can optionally open a pull request with updated outputs.
 
 Modes:
-    - **watch** — continuous file-system polling (no external deps)
+    - **watch** — continuous watching; event-driven via watchdog when it
+      is installed, falling back to file-system polling otherwise
     - **oneshot** — check once and regenerate if changed (for cron jobs)
 
 Usage::
@@ -24,13 +25,31 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import queue
+import shutil
+import signal
 import subprocess
 import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 
+try:
+    from watchdog.events import PatternMatchingEventHandler
+    from watchdog.observers import Observer
+
+    _HAS_WATCHDOG = True
+except ImportError:
+    _HAS_WATCHDOG = False
+
+if TYPE_CHECKING:
+    from pathspec import PathSpec
+
+    from ..pipeline import Pipeline
+    from .template_vars import TemplateVars
+
 log = logging.getLogger(__name__)
 console = Console()
 
@@ -47,6 +66,37 @@ DEFAULT_WATCH_PATTERNS = [
 # State file to track last known hashes
 _STATE_FILENAME = ".opendocs-watch-state.json"
 
+# How long to keep draining file-system events after the first one before
+# regenerating — editors fire several events per save (truncate, write,
+# rename), and one debounced cycle covers the whole burst.
+_DEBOUNCE_SECONDS = 0.5
+
+
+if _HAS_WATCHDOG:
+
+    class _QueueingEventHandler(PatternMatchingEventHandler):
+        """Forward matching modify/create events into a queue.
+
+        watchdog delivers events on its own observer thread; the watch
+        loop consumes them from the queue so regeneration stays on the
+        main thread.
+        """
+
+        def __init__(self, patterns: list[str], events: queue.Queue) -> None:
+            # watchdog fnmatches against the full event path, so bare
+            # names like README.md need a leading wildcard to match.
+            super().__init__(
+                patterns=[p if p.startswith("*") else f"*/{p}" for p in patterns],
+                ignore_directories=True,
+            )
+            self._events = events
+
+        def on_modified(self, event) -> None:
+            self._events.put(event.src_path)
+
+        def on_created(self, event) -> None:
+            self._events.put(event.src_path)
+
 
 # ---------------------------------------------------------------------------
 # Hashing / change detection
@@ -68,8 +118,25 @@ def _hash_file(path: Path) -> str:
 def _discover_watched_files(
     repo_dir: Path,
     patterns: list[str] | None = None,
+    spec: PathSpec | None = None,
 ) -> list[Path]:
-    """Find all files matching watch patterns in the repo directory."""
+    """Find all files matching watch patterns in the repo directory.
+
+    With a compiled ``spec`` the tree is walked once and each relative
+    path is tested against the whole pattern set, instead of one glob
+    pass per pattern.
+    """
+    if spec is not None:
+        return sorted(
+            set(
+                f
+                for f in repo_dir.rglob("*")
+                if ".git" not in f.parts
+                and f.is_file()
+                and spec.match_file(f.relative_to(repo_dir).as_posix())
+            )
+        )
+
     patterns = patterns or DEFAULT_WATCH_PATTERNS
     found: list[Path] = []
 
@@ -114,6 +181,7 @@ def _save_state(repo_dir: Path, state: dict[str, str]) -> None:
 def detect_changes(
     repo_dir: Path,
     patterns: list[str] | None = None,
+    spec: PathSpec | None = None,
 ) -> tuple[list[Path], list[Path], list[Path]]:
     """Detect changed, added, and removed files since last check.
 
@@ -122,7 +190,7 @@ def detect_changes(
     tuple[list[Path], list[Path], list[Path]]
         (changed_files, added_files, removed_files)
     """
-    files = _discover_watched_files(repo_dir, patterns)
+    files = _discover_watched_files(repo_dir, patterns, spec)
     current_state = _compute_state(files)
     previous_state = _load_state(repo_dir)
 
@@ -148,14 +216,22 @@ def detect_changes(
 # ---------------------------------------------------------------------------
 
 
+# Resolved once at import; auto-PR runs a dozen short-lived git commands
+# per cycle and each would otherwise re-walk PATH. CREATE_NO_WINDOW skips
+# console allocation on Windows and is 0 (a no-op) elsewhere.
+_GIT_BIN = shutil.which("git") or "git"
+_GIT_CREATIONFLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+
 def _git_run(repo_dir: Path, *args: str) -> subprocess.CompletedProcess:
     """Run a git command in the repo directory."""
     return subprocess.run(
-        ["git", *args],
+        [_GIT_BIN, *args],
         cwd=str(repo_dir),
         capture_output=True,
         text=True,
         timeout=60,
+        creationflags=_GIT_CREATIONFLAGS,
     )
 
 
@@ -273,6 +349,7 @@ def _create_docs_pr(
 def _regenerate(
     repo_dir: Path,
     changed_files: list[Path],
+    pipeline: Pipeline,
     *,
     output_dir: str = "./output",
     formats: list[str] | None = None,
@@ -281,14 +358,13 @@ def _regenerate(
     api_key: str | None = None,
     model: str = "gpt-4o-mini",
     provider: str = "openai",
-    config_path: str | None = None,
+    template_vars: TemplateVars | None = None,
 ) -> bool:
     """Regenerate documentation for changed files.
 
     Returns True if generation was successful.
     """
     from ..core.models import OutputFormat
-    from ..pipeline import Pipeline
 
     format_map = {
         "word": OutputFormat.WORD,
@@ -309,7 +385,6 @@ def _regenerate(
     if formats:
         out_formats = [format_map[f] for f in formats if f in format_map]
 
-    pipeline = Pipeline()
     success = True
 
     for fpath in changed_files:
@@ -327,6 +402,7 @@ def _regenerate(
                 api_key=api_key,
                 model=model,
                 provider=provider,
+                template_vars=template_vars,
             )
 
             if not any(r.success for r in result.results):
@@ -357,6 +433,10 @@ class FileWatcher:
         Seconds between change-detection checks.
     patterns
         File patterns to watch (default: README.md, CHANGELOG.md, docs/, *.ipynb).
+    pattern_spec
+        Pre-compiled ``pathspec.PathSpec`` for the same patterns; when
+        given, discovery matches against it in a single tree walk
+        instead of re-globbing per pattern each cycle.
     auto_pr
         If True, create a git branch + PR when changes are detected.
     branch_name
@@ -373,8 +453,13 @@ class FileWatcher:
         LLM model name.
     provider
         LLM provider name.
+    template_vars
+        Pre-parsed template variables, passed through to each
+        regeneration; loaded from ``config_path`` when not given.
     config_path
-        Path to template variables config file.
+        Path to template variables config file.  Parsed once at
+        construction (not per cycle); SIGHUP re-parses it for
+        operator-triggered config changes.
     """
 
     def __init__(
@@ -384,6 +469,7 @@ class FileWatcher:
         output_dir: str = "./output",
         interval: int = 30,
         patterns: list[str] | None = None,
+        pattern_spec: PathSpec | None = None,
         auto_pr: bool = False,
         branch_name: str = "docs/auto-update",
         formats: list[str] | None = None,
@@ -392,12 +478,14 @@ class FileWatcher:
         api_key: str | None = None,
         model: str = "gpt-4o-mini",
         provider: str = "openai",
+        template_vars: TemplateVars | None = None,
         config_path: str | None = None,
     ) -> None:
         self.repo_dir = Path(repo_dir).expanduser().resolve()
         self.output_dir = output_dir
         self.interval = interval
         self.patterns = patterns
+        self.pattern_spec = pattern_spec
         self.auto_pr = auto_pr
         self.branch_name = branch_name
         self.formats = formats
@@ -407,6 +495,15 @@ class FileWatcher:
         self.model = model
         self.provider = provider
         self.config_path = config_path
+        if template_vars is None and config_path:
+            from .template_vars import load_template_vars
+
+            template_vars = load_template_vars(config_path)
+        self.template_vars = template_vars
+        # Built on first regeneration and reused for every cycle after —
+        # the pipeline holds the fetcher, parsers, and memoized LLM
+        # helpers, none of which should be rebuilt every 30 seconds.
+        self._pipeline: Pipeline | None = None
 
         if not self.repo_dir.is_dir():
             raise NotADirectoryError(f"Repository directory not found: {self.repo_dir}")
@@ -418,7 +515,7 @@ class FileWatcher:
         """
         console.print(f"[dim]Checking for changes in {self.repo_dir}...[/]")
 
-        changed, added, removed = detect_changes(self.repo_dir, self.patterns)
+        changed, added, removed = detect_changes(self.repo_dir, self.patterns, self.pattern_spec)
 
         if not changed and not added:
             console.print("[dim]No changes detected.[/]")
@@ -439,9 +536,15 @@ class FileWatcher:
         if not out_path.is_absolute():
             out_path = self.repo_dir / out_path
 
+        if self._pipeline is None:
+            from ..pipeline import Pipeline
+
+            self._pipeline = Pipeline()
+
         success = _regenerate(
             self.repo_dir,
             all_changed,
+            self._pipeline,
             output_dir=str(out_path),
             formats=self.formats,
             theme=self.theme,
@@ -449,11 +552,11 @@ class FileWatcher:
             api_key=self.api_key,
             model=self.model,
             provider=self.provider,
-            config_path=self.config_path,
+            template_vars=self.template_vars,
         )
 
         # Update state
-        files = _discover_watched_files(self.repo_dir, self.patterns)
+        files = _discover_watched_files(self.repo_dir, self.patterns, self.pattern_spec)
         _save_state(self.repo_dir, _compute_state(files))
 
         # Auto-PR
@@ -470,16 +573,19 @@ class FileWatcher:
     def watch(self) -> None:
         """Run the continuous watch loop.
 
-        This blocks indefinitely, checking for changes every ``interval``
-        seconds.  Press Ctrl+C to stop.
+        This blocks indefinitely.  With watchdog installed the loop wakes
+        on file-system events (with ``interval`` as a heartbeat fallback);
+        otherwise it polls every ``interval`` seconds.  Press Ctrl+C to
+        stop.
         """
+        mode = "events" if _HAS_WATCHDOG else "polling"
         console.print("\n[bold green]🔍 OpenDocs Watcher[/]")
         console.print(f"   Repository: [bold]{self.repo_dir}[/]")
         console.print(f"   Output:     [bold]{self.output_dir}[/]")
-        console.print(f"   Interval:   [bold]{self.interval}s[/]")
+        console.print(f"   Interval:   [bold]{self.interval}s[/] ({mode})")
         console.print(f"   Auto-PR:    [bold]{'yes' if self.auto_pr else 'no'}[/]")
 
-        watched = _discover_watched_files(self.repo_dir, self.patterns)
+        watched = _discover_watched_files(self.repo_dir, self.patterns, self.pattern_spec)
         console.print(f"   Watching:   [bold]{len(watched)} file(s)[/]")
         for f in watched[:10]:
             console.print(f"     • {f.relative_to(self.repo_dir)}")
@@ -492,10 +598,63 @@ class FileWatcher:
         state = _compute_state(watched)
         _save_state(self.repo_dir, state)
 
+        # Config was parsed once at construction; SIGHUP re-parses it so
+        # operators can change template vars without restarting.
+        if self.config_path and hasattr(signal, "SIGHUP"):
+            try:
+                signal.signal(signal.SIGHUP, self._reload_template_vars)
+            except ValueError:
+                pass  # not on the main thread — skip the reload hook
+
+        try:
+            if _HAS_WATCHDOG:
+                self._watch_events()
+            else:
+                self._watch_polling()
+        except KeyboardInterrupt:
+            console.print("\n[bold yellow]⏹  Watcher stopped.[/]")
+
+    def _reload_template_vars(self, _signum, _frame) -> None:
+        """SIGHUP handler — re-parse the template-vars config file."""
+        from .template_vars import load_template_vars
+
+        try:
+            self.template_vars = load_template_vars(self.config_path)
+            console.print(f"[dim]Reloaded template vars from {self.config_path}[/]")
+        except Exception as exc:
+            console.print(f"[red]Template vars reload failed: {exc}[/]")
+
+    def _watch_events(self) -> None:
+        """Event-driven watch loop (requires watchdog).
+
+        An observer thread pushes matching events into a queue; this loop
+        blocks on the queue, debounces each burst, and re-checks on an
+        ``interval`` heartbeat so a missed event can't wedge the watcher.
+        """
+        events: queue.Queue = queue.Queue()
+        handler = _QueueingEventHandler(self.patterns or DEFAULT_WATCH_PATTERNS, events)
+        observer = Observer()
+        observer.schedule(handler, str(self.repo_dir), recursive=True)
+        observer.start()
+
         cycle = 0
         try:
             while True:
-                time.sleep(self.interval)
+                try:
+                    events.get(timeout=self.interval)
+                except queue.Empty:
+                    pass  # heartbeat — run the hash check anyway
+                else:
+                    # Coalesce the rest of the burst before regenerating.
+                    deadline = time.monotonic() + _DEBOUNCE_SECONDS
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        try:
+                            events.get(timeout=remaining)
+                        except queue.Empty:
+                            break
                 cycle += 1
 
                 try:
@@ -503,6 +662,19 @@ class FileWatcher:
                 except Exception as exc:
                     console.print(f"[red]Error in watch cycle {cycle}: {exc}[/]")
                     log.exception("Watch cycle %d failed", cycle)
+        finally:
+            observer.stop()
+            observer.join()
 
-        except KeyboardInterrupt:
-            console.print("\n[bold yellow]⏹  Watcher stopped.[/]")
+    def _watch_polling(self) -> None:
+        """Polling watch loop — the no-dependency fallback."""
+        cycle = 0
+        while True:
+            time.sleep(self.interval)
+            cycle += 1
+
+            try:
+                self.check_once()
+            except Exception as exc:
+                console.print(f"[red]Error in watch cycle {cycle}: {exc}[/]")
+                log.exception("Watch cycle %d failed", cycle)
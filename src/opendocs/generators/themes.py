@@ -14,6 +14,12 @@ Usage::
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
+
+
+def _rgb_hex(rgb: tuple[int, int, int]) -> str:
+    """Format an RGB tuple as ``#RRGGBB``."""
+    return f"#{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
 
 # ---------------------------------------------------------------------------
 # Theme dataclass
@@ -64,6 +70,30 @@ class ThemeColors:
     slide_title_bg: tuple[int, int, int] = (0, 82, 164)
     slide_accent_bar: tuple[int, int, int] = (255, 153, 0)
 
+    # Hex forms are formatted once per theme instance and then served
+    # from the instance dict — generators emit the same handful of hex
+    # strings per page element. cached_property writes straight into
+    # __dict__, which the frozen dataclass allows.
+    @cached_property
+    def primary_hex(self) -> str:
+        """``#RRGGBB`` form of ``primary``."""
+        return _rgb_hex(self.primary)
+
+    @cached_property
+    def accent_hex(self) -> str:
+        """``#RRGGBB`` form of ``accent``."""
+        return _rgb_hex(self.accent)
+
+    @cached_property
+    def heading_hex(self) -> str:
+        """``#RRGGBB`` form of ``heading``."""
+        return _rgb_hex(self.heading)
+
+    @cached_property
+    def muted_hex(self) -> str:
+        """``#RRGGBB`` form of ``muted``."""
+        return _rgb_hex(self.muted)
+
 
 @dataclass(frozen=True)
 class ThemeFonts:
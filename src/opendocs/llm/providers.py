@@ -36,7 +36,14 @@ import logging
 import os
 import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator
+
+try:
+    import orjson  # Rust SIMD JSON parser — optional fast path
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 logger = logging.getLogger("opendocs.llm.providers")
 
@@ -179,7 +186,9 @@ class LLMProvider(ABC):
             else:
                 text = "\n".join(lines[1:])
             text = text.strip()
-        result = json.loads(text)
+        # Model replies can be several KB of nested JSON; orjson parses
+        # them in native code when available.
+        result = orjson.loads(text) if _HAS_ORJSON else json.loads(text)
         if isinstance(result, dict):
             return result
         # If the model returned a list, wrap it
@@ -487,6 +496,26 @@ class AzureProvider(LLMProvider):
 # Async wrappers (for the agents layer)
 # ══════════════════════════════════════════════════════════════════════════
 
+# One pooled HTTP client shared by every async provider in the process.
+# Concurrent sub-agents then reuse keep-alive connections (and HTTP/2
+# multiplexing when the 'h2' package is installed) instead of paying a
+# TCP+TLS handshake per LLM call.
+_ASYNC_HTTP_CLIENT: Any = None
+
+
+def _shared_async_http_client() -> Any:
+    """Return (and lazily create) the process-wide async HTTP client."""
+    global _ASYNC_HTTP_CLIENT
+    import httpx
+
+    if _ASYNC_HTTP_CLIENT is None or _ASYNC_HTTP_CLIENT.is_closed:
+        limits = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+        try:
+            _ASYNC_HTTP_CLIENT = httpx.AsyncClient(limits=limits, http2=True, timeout=60.0)
+        except ImportError:  # http2 extra ('h2') not installed
+            _ASYNC_HTTP_CLIENT = httpx.AsyncClient(limits=limits, timeout=60.0)
+    return _ASYNC_HTTP_CLIENT
+
 
 class AsyncLLMProvider(ABC):
     """Async base class for providers used in the agents layer."""
@@ -516,6 +545,14 @@ class AsyncLLMProvider(ABC):
     async def chat_json(self, system: str, user: str) -> dict[str, Any]:
         """Async chat completion → parsed JSON dict."""
 
+    async def chat_stream(self, system: str, user: str) -> AsyncIterator[str]:
+        """Async chat completion → stream of text chunks.
+
+        Providers without native streaming support yield the full reply
+        as a single chunk.
+        """
+        yield await self.chat(system, user)
+
     @staticmethod
     def _parse_json(raw: str) -> dict[str, Any]:
         return LLMProvider._parse_json(raw)
@@ -533,7 +570,10 @@ class AsyncOpenAIProvider(AsyncLLMProvider):
         key = self.api_key or os.environ.get("OPENAI_API_KEY", "")
         if not key and not self.base_url:
             raise RuntimeError("No OpenAI API key found. Pass --api-key or set OPENAI_API_KEY.")
-        ctor_kwargs: dict[str, Any] = {"api_key": key or "not-needed"}
+        ctor_kwargs: dict[str, Any] = {
+            "api_key": key or "not-needed",
+            "http_client": _shared_async_http_client(),
+        }
         if self.base_url:
             ctor_kwargs["base_url"] = self.base_url
         self._client = AsyncOpenAI(**ctor_kwargs)
@@ -570,6 +610,22 @@ class AsyncOpenAIProvider(AsyncLLMProvider):
             )
         return self._parse_json(raw)
 
+    async def chat_stream(self, system: str, user: str) -> AsyncIterator[str]:
+        stream = await self._client.chat.completions.create(
+            model=self.model,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+        )
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+
 
 class AsyncAnthropicProvider(AsyncLLMProvider):
     """Async Anthropic (Claude) provider for the agents layer."""
@@ -586,7 +642,10 @@ class AsyncAnthropicProvider(AsyncLLMProvider):
         key = self.api_key or os.environ.get("ANTHROPIC_API_KEY", "")
         if not key:
             raise RuntimeError("No Anthropic API key. Set ANTHROPIC_API_KEY.")
-        ctor_kwargs: dict[str, Any] = {"api_key": key}
+        ctor_kwargs: dict[str, Any] = {
+            "api_key": key,
+            "http_client": _shared_async_http_client(),
+        }
         if self.base_url:
             ctor_kwargs["base_url"] = self.base_url
         self._client = AsyncAnthropic(**ctor_kwargs)
@@ -690,6 +749,7 @@ class AsyncOllamaProvider(AsyncLLMProvider):
         self._client = AsyncOpenAI(
             api_key=self.api_key or "ollama",
             base_url=self.base_url,
+            http_client=_shared_async_http_client(),
         )
 
     async def chat(self, system: str, user: str) -> str:
@@ -746,6 +806,7 @@ class AsyncAzureProvider(AsyncLLMProvider):
             api_key=key,
             azure_endpoint=endpoint,
             api_version=api_version,
+            http_client=_shared_async_http_client(),
         )
 
     async def chat(self, system: str, user: str) -> str:
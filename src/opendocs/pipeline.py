@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from rich.console import Console
@@ -52,6 +55,35 @@ _GENERATORS = {
 }
 
 
+def _generate_one_format(
+    fmt: OutputFormat,
+    *,
+    doc: DocumentModel,
+    theme,
+    kg,
+    image_cache,
+    tvars: TemplateVars,
+    output_path: Path,
+) -> GenerationResult:
+    """Generate a single output format.
+
+    Module-level so it can be dispatched to process-pool workers; the
+    theme is (re-)applied here because the worker process does not
+    inherit the parent's module-global theme state.
+    """
+    apply_theme(theme)
+    try:
+        gen = _GENERATORS[fmt](
+            theme=theme,
+            knowledge_graph=kg,
+            image_cache=image_cache,
+            template_vars=tvars,
+        )
+        return gen.generate(doc, output_path)
+    finally:
+        reset_theme()
+
+
 class Pipeline:
     """End-to-end README → multi-format documentation pipeline.
 
@@ -71,6 +103,12 @@ class Pipeline:
         self.parser = ReadmeParser()
         self.notebook_parser = NotebookParser()
         self.semantic_extractor = SemanticExtractor()
+        # LLM helpers memoized per (provider, model, base_url, api_key):
+        # each holds a provider client with its own HTTP pool and TLS
+        # context, and repeated runs on one Pipeline — watch-mode
+        # regenerations in particular — should reuse that instead of
+        # rebuilding it every cycle.
+        self._llm_helpers: dict[tuple, tuple] = {}
 
     def run(
         self,
@@ -540,43 +578,35 @@ class Pipeline:
                 console.print("[yellow]WARNING: LLM mode requires --api-key; falling back to basic[/]")
             else:
                 try:
-                    from .llm.llm_extractor import LLMExtractor, LLMSummarizer
+                    from .llm.llm_extractor import LLMContentEnhancer, LLMExtractor, LLMSummarizer
+
+                    helper_key = (provider, model, base_url, api_key)
+                    helpers = self._llm_helpers.get(helper_key)
+                    if helpers is None:
+                        kwargs = dict(api_key=api_key, model=model, base_url=base_url, provider=provider)
+                        helpers = (
+                            LLMExtractor(**kwargs),
+                            LLMSummarizer(**kwargs),
+                            LLMContentEnhancer(**kwargs),
+                        )
+                        self._llm_helpers[helper_key] = helpers
+                    llm_extractor, summarizer, enhancer = helpers
 
                     # -- Entity extraction via LLM --
                     console.print(
                         f"[bold blue]Running LLM extraction...[/] [dim](provider={provider}, model={model})[/]"
                     )
-                    llm_extractor = LLMExtractor(
-                        api_key=api_key,
-                        model=model,
-                        base_url=base_url,
-                        provider=provider,
-                    )
                     llm_kg = llm_extractor.extract(doc)
                     kg.merge(llm_kg)
                     console.print(f"[green][OK][/] LLM enriched graph (+{len(llm_kg.entities)} entities)")
 
                     # -- Executive & stakeholder summaries --
                     console.print("[bold blue]Generating LLM summaries...[/]")
-                    summarizer = LLMSummarizer(
-                        api_key=api_key,
-                        model=model,
-                        base_url=base_url,
-                        provider=provider,
-                    )
                     summarizer.enrich(doc, kg)
                     console.print("[green][OK][/] Executive summary + 3 stakeholder views generated")
 
                     # -- LLM content enhancement (blog, FAQ, section rewrites) --
-                    from .llm.llm_extractor import LLMContentEnhancer
-
                     console.print("[bold blue]Running LLM content enhancement...[/]")
-                    enhancer = LLMContentEnhancer(
-                        api_key=api_key,
-                        model=model,
-                        base_url=base_url,
-                        provider=provider,
-                    )
                     enhancer.enrich(doc, kg)
                     parts = []
                     if kg.llm_blog:
@@ -627,22 +657,50 @@ class Pipeline:
         )
 
         # -- Step 5: Generate documents -----------------------------------
-        for fmt in formats:
-            generator_cls = _GENERATORS.get(fmt)
-            if generator_cls is None:
-                continue
-
-            gen = generator_cls(
+        known_formats = [fmt for fmt in formats if fmt in _GENERATORS]
+        fmt_results: list[GenerationResult] = []
+        if len(known_formats) > 1:
+            # Each format writes a distinct file and the rendering work
+            # (docx/PDF/PPTX assembly) is CPU-bound pure Python, so the
+            # formats fan out across a process pool.
+            workers = min(len(known_formats), os.cpu_count() or 1)
+            console.print(f"[bold blue]Generating {len(known_formats)} formats ({workers} workers)...[/]")
+            worker = partial(
+                _generate_one_format,
+                doc=doc,
                 theme=theme,
-                knowledge_graph=kg,
+                kg=kg,
                 image_cache=image_cache,
-                template_vars=tvars,
+                tvars=tvars,
+                output_path=output_path,
             )
-            console.print(f"[bold blue]Generating {fmt.value.upper()}...[/]")
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    fmt_results = list(pool.map(worker, known_formats, chunksize=1))
+            except Exception as exc:
+                console.print(f"[yellow]Parallel generation unavailable ({exc}); running serially[/]")
+                fmt_results = []
+        if not fmt_results:
+            for fmt in known_formats:
+                console.print(f"[bold blue]Generating {fmt.value.upper()}...[/]")
+                fmt_results.append(
+                    _generate_one_format(
+                        fmt,
+                        doc=doc,
+                        theme=theme,
+                        kg=kg,
+                        image_cache=image_cache,
+                        tvars=tvars,
+                        output_path=output_path,
+                    )
+                )
 
-            gen_result: GenerationResult = gen.generate(doc, output_path)
-            result.results.append(gen_result)
+        # The per-format worker resets the theme on its way out; restore
+        # it for the report/graph/wiki steps below.
+        apply_theme(theme)
 
+        for fmt, gen_result in zip(known_formats, fmt_results):
+            result.results.append(gen_result)
             if gen_result.success:
                 console.print(f"[green][OK][/] {gen_result.output_path}")
             else:
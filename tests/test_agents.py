@@ -14,6 +14,9 @@ These tests validate:
 
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
+
 import pytest
 
 # -- Base models --
@@ -21,6 +24,7 @@ from opendocs.agents.base import (
     AgentPlan,
     AgentResult,
     AgentRole,
+    Component,
     PlanStep,
     RepoProfile,
     RepoSignal,
@@ -58,6 +62,7 @@ from opendocs.agents.specialized import (
     InfraAgent,
     MicroservicesAgent,
     MLAgent,
+    run_all_specialized,
 )
 
 # -- Tool contracts --
@@ -248,6 +253,14 @@ class TestBaseModels:
         assert sig.confidence == 1.0
         assert sig.file_path == ""
 
+    def test_repo_profile_file_indexes(self):
+        profile = RepoProfile(
+            file_tree=["main.tf", "modules/vpc/vpc.tf", "charts/app/Chart.yaml", "README.md"],
+        )
+        assert profile.suffix_index[".tf"] == ["main.tf", "modules/vpc/vpc.tf"]
+        assert profile.basename_index["Chart.yaml"] == ["charts/app/Chart.yaml"]
+        assert profile.suffix_index[".yaml"] == ["charts/app/Chart.yaml"]
+
 
 # ===================================================================
 # 2. Evidence registry
@@ -411,13 +424,14 @@ class TestPrivacyGuard:
 class TestToolContracts:
     """Test MCP tool contract registry and parameter validation."""
 
-    def test_registry_has_12_tools(self):
-        assert len(TOOL_REGISTRY) == 12
+    def test_registry_has_13_tools(self):
+        assert len(TOOL_REGISTRY) == 13
 
     def test_expected_tools_registered(self):
         expected = {
             "repo.search",
             "repo.read",
+            "repo.read_batch",
             "repo.diff",
             "repo.summarize",
             "diagram.render",
@@ -449,6 +463,20 @@ class TestToolContracts:
         errors_bad = contract.validate_params({"type": "invalid_type", "spec": "x"})
         assert len(errors_bad) == 1
 
+    def test_compiled_validator_checks_types(self):
+        contract = TOOL_REGISTRY["repo.search"]
+        if contract._compiled is None:
+            pytest.skip("fastjsonschema not installed")
+        errors = contract.validate_params({"query": "x", "max_results": "ten"})
+        assert len(errors) == 1
+        assert "max_results" in errors[0]
+
+    def test_to_json_schema_shape(self):
+        schema = TOOL_REGISTRY["diagram.render"].to_json_schema()
+        assert schema["type"] == "object"
+        assert schema["required"] == ["spec", "type"]
+        assert schema["properties"]["type"]["enum"] == ["mermaid", "plantuml", "graphviz"]
+
 
 # ===================================================================
 # 5. Planner agent
@@ -480,9 +508,13 @@ class TestPlannerAgent:
         )
         assert result.success is True
         assert "plan" in result.artifacts
-        plan_data = result.artifacts["plan"]
-        assert plan_data["goal"]
-        assert len(plan_data["steps"]) >= 3  # search + diagram + sub-agents + refine + critic
+        plan = result.artifacts["plan"]
+        assert isinstance(plan, AgentPlan)  # live model — serialized lazily
+        assert plan.goal
+        assert plan.total_steps >= 3  # search + diagram + sub-agents + refine + critic
+        plan_data = result.to_json_artifacts()["plan"]
+        assert plan_data["goal"] == plan.goal
+        assert len(plan_data["steps"]) == plan.total_steps
 
     @pytest.mark.asyncio
     async def test_planner_activated_agents_in_metadata(self, sample_profile, sample_kg):
@@ -817,7 +849,7 @@ class TestEventDrivenAgent:
         )
         assert result.success is True
         comps = result.artifacts["event_components"]
-        techs = {c["tech"] for c in comps}
+        techs = {c.tech for c in comps}
         assert "kafka" in techs
         assert "sqs" in techs
         assert "event_flow_mermaid" in result.artifacts
@@ -833,7 +865,7 @@ class TestMLAgent:
         )
         assert result.success is True
         comps = result.artifacts["ml_components"]
-        techs = {c["tech"] for c in comps}
+        techs = {c.tech for c in comps}
         assert "pytorch" in techs
         assert "rag" in techs
         assert "model_card_md" in result.artifacts
@@ -850,7 +882,7 @@ class TestDataEngineeringAgent:
         )
         assert result.success is True
         comps = result.artifacts["data_components"]
-        techs = {c["tech"] for c in comps}
+        techs = {c.tech for c in comps}
         assert "airflow" in techs
         assert "dbt" in techs
         assert "data_lineage_mermaid" in result.artifacts
@@ -866,13 +898,95 @@ class TestInfraAgent:
         )
         assert result.success is True
         resources = result.artifacts["infra_resources"]
-        techs = {r["tech"] for r in resources}
+        techs = {r.tech for r in resources}
         assert "terraform" in techs
         assert "helm" in techs
         assert "infra_topology_mermaid" in result.artifacts
         assert "infrastructure_md" in result.artifacts
 
 
+class TestComponentRecords:
+    def test_component_is_slotted_and_frozen(self):
+        from opendocs.agents.base import Component
+
+        comp = Component("broker", "kafka", "Kafka Cluster")
+        assert comp.source is None
+        assert not hasattr(comp, "__dict__")
+        with pytest.raises(AttributeError):
+            comp.name = "other"
+
+    def test_to_json_artifacts_dumps_component_lists(self):
+        from opendocs.agents.base import Component
+
+        result = AgentResult(
+            agent_role=AgentRole.EVENT_DRIVEN,
+            artifacts={"event_components": [Component("broker", "kafka", "Kafka Cluster")]},
+        )
+        dumped = result.to_json_artifacts()
+        assert dumped["event_components"] == [
+            {"type": "broker", "tech": "kafka", "name": "Kafka Cluster", "source": None}
+        ]
+
+
+class TestSignalEarlyExit:
+    @pytest.mark.asyncio
+    async def test_irrelevant_profile_skips_event_agent(self, infra_profile, sample_kg):
+        agent = EventDrivenAgent()
+        result = await agent.run(repo_profile=infra_profile, knowledge_graph=sample_kg)
+        assert result.success is True
+        assert result.artifacts == {}
+        assert result.metadata.get("skipped") is True
+
+    @pytest.mark.asyncio
+    async def test_irrelevant_profile_skips_ml_agent(self, event_driven_profile, sample_kg):
+        agent = MLAgent()
+        result = await agent.run(repo_profile=event_driven_profile, knowledge_graph=sample_kg)
+        assert result.metadata.get("skipped") is True
+
+    @pytest.mark.asyncio
+    async def test_relevant_profile_still_runs(self, ml_profile, sample_kg):
+        agent = MLAgent()
+        result = await agent.run(repo_profile=ml_profile, knowledge_graph=sample_kg)
+        assert "skipped" not in result.metadata
+        assert "ml_components" in result.artifacts
+
+
+class TestRunAllSpecialized:
+    @pytest.mark.asyncio
+    async def test_gathers_every_sub_agent(self, ml_profile, sample_kg):
+        results = await run_all_specialized(
+            repo_profile=ml_profile,
+            knowledge_graph=sample_kg,
+            use_llm=False,
+        )
+        assert len(results) == 5
+        roles = {r.agent_role for r in results}
+        assert roles == {
+            AgentRole.MICROSERVICES,
+            AgentRole.EVENT_DRIVEN,
+            AgentRole.ML,
+            AgentRole.DATA_ENGINEERING,
+            AgentRole.INFRA,
+        }
+        assert all(r.success for r in results)
+
+    @pytest.mark.asyncio
+    async def test_timed_out_agent_becomes_failed_result(self, ml_profile, sample_kg, monkeypatch):
+        async def slow_run(self, **kwargs):
+            await asyncio.sleep(5)
+
+        monkeypatch.setattr(MLAgent, "run", slow_run)
+        results = await run_all_specialized(
+            repo_profile=ml_profile,
+            knowledge_graph=sample_kg,
+            use_llm=False,
+            timeout_seconds=0.05,
+        )
+        ml_result = next(r for r in results if r.agent_role == AgentRole.ML)
+        assert ml_result.success is False
+        assert ml_result.errors
+
+
 # ===================================================================
 # 10. Orchestrator (integration-level)
 # ===================================================================
@@ -922,3 +1036,923 @@ class TestOrchestrator:
             knowledge_graph=sample_kg,
         )
         assert isinstance(result, OrchestrationResult)
+
+
+# ===================================================================
+# 11. Wire-format messages (msgspec fast path)
+# ===================================================================
+
+
+class TestWireMessages:
+    """Decoding LLM JSON replies straight into msgspec structs."""
+
+    def test_agent_plan_msg_decodes_json(self):
+        msgspec = pytest.importorskip("msgspec")
+        from opendocs.agents.base import AgentPlanMsg
+
+        raw = (
+            b'{"goal": "Enhanced docs", "reasoning": "because", "steps": ['
+            b'{"step_number": 1, "description": "search", "agent_role": "executor", '
+            b'"tool_calls": [{"tool_name": "repo.search", "parameters": {"query": "docker"}}], '
+            b'"expected_output": "paths"}]}'
+        )
+        msg = msgspec.json.decode(raw, type=AgentPlanMsg)
+        assert msg.goal == "Enhanced docs"
+        assert len(msg.steps) == 1
+        assert msg.steps[0].agent_role == "executor"
+        assert msg.steps[0].tool_calls[0].tool_name == "repo.search"
+        assert msg.steps[0].tool_calls[0].parameters == {"query": "docker"}
+
+    def test_agent_plan_msg_ignores_unknown_fields(self):
+        msgspec = pytest.importorskip("msgspec")
+        from opendocs.agents.base import AgentPlanMsg
+
+        raw = b'{"goal": "g", "steps": [], "surprise": 42}'
+        msg = msgspec.json.decode(raw, type=AgentPlanMsg)
+        assert msg.goal == "g"
+        assert msg.steps == []
+
+    def test_evidence_pointer_msg_defaults(self):
+        msgspec = pytest.importorskip("msgspec")
+        from opendocs.agents.evidence import EvidencePointerMsg
+
+        msg = msgspec.json.decode(b'{"evidence_type": "code_file", "source_path": "a.py"}', type=EvidencePointerMsg)
+        assert msg.evidence_type == "code_file"
+        assert msg.confidence == 1.0
+        assert msg.line_start is None
+
+
+# ===================================================================
+# 12. Streaming plan parsing
+# ===================================================================
+
+
+class TestStreamingPlan:
+    """Incremental PlanStep extraction from a streamed LLM reply."""
+
+    def test_scan_step_objects_partial_buffer(self):
+        from opendocs.agents.planner import _scan_step_objects
+
+        partial = '{"goal": "g", "steps": [{"step_number": 1, "description": "a"}, {"step_num'
+        objs = _scan_step_objects(partial)
+        assert len(objs) == 1
+        assert '"step_number": 1' in objs[0]
+
+    def test_scan_step_objects_handles_braces_in_strings(self):
+        from opendocs.agents.planner import _scan_step_objects
+
+        buf = '{"steps": [{"description": "uses {braces} and \\"quotes\\""}]}'
+        objs = _scan_step_objects(buf)
+        assert len(objs) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_plan_llm_yields_steps_incrementally(self, sample_profile, sample_kg, monkeypatch):
+        import opendocs.agents.planner as planner_mod
+
+        reply = (
+            '{"goal": "docs", "steps": ['
+            '{"step_number": 1, "description": "search", "agent_role": "executor"}, '
+            '{"step_number": 2, "description": "validate", "agent_role": "critic"}]}'
+        )
+
+        async def fake_stream(**kwargs):
+            # Two chunks split mid-object to exercise incremental parsing
+            yield reply[:60]
+            yield reply[60:]
+
+        monkeypatch.setattr(planner_mod, "chat_stream", fake_stream)
+
+        agent = PlannerAgent()
+        steps = [
+            s
+            async for s in agent.stream_plan_llm(
+                repo_profile=sample_profile,
+                knowledge_graph=sample_kg,
+            )
+        ]
+        assert [s.step_number for s in steps] == [1, 2]
+        assert steps[-1].agent_role == AgentRole.CRITIC
+
+
+# ===================================================================
+# 13. LLM response cache
+# ===================================================================
+
+
+class TestResponseCache:
+    """On-disk response cache for identical LLM prompts."""
+
+    def test_round_trip(self, tmp_path):
+        from opendocs.agents.llm_client import ResponseCache
+
+        cache = ResponseCache(tmp_path, ttl_seconds=60)
+        key = ResponseCache.make_key("sys", "user", "gpt-4o-mini")
+        assert cache.get(key) is None
+        cache.set(key, {"goal": "docs"})
+        assert cache.get(key) == {"goal": "docs"}
+
+    def test_key_is_prompt_sensitive(self):
+        from opendocs.agents.llm_client import ResponseCache
+
+        k1 = ResponseCache.make_key("sys", "user-a", "m")
+        k2 = ResponseCache.make_key("sys", "user-b", "m")
+        assert k1 != k2
+
+    def test_expired_entry_misses(self, tmp_path):
+        import os
+        import time
+
+        from opendocs.agents.llm_client import ResponseCache
+
+        cache = ResponseCache(tmp_path, ttl_seconds=10)
+        key = ResponseCache.make_key("s", "u", "m")
+        cache.set(key, {"x": 1})
+        old = time.time() - 60
+        os.utime(tmp_path / f"{key}.json", (old, old))
+        assert cache.get(key) is None
+
+    def test_strict_privacy_disables_planner_cache(self):
+        orch = AgentOrchestrator(privacy_mode=PrivacyMode.STRICT, llm_cache_ttl_seconds=3600)
+        assert orch._planner._response_cache is None
+        orch2 = AgentOrchestrator(privacy_mode=PrivacyMode.STANDARD, llm_cache_ttl_seconds=3600)
+        assert orch2._planner._response_cache is not None
+
+
+class TestChatTextCache:
+    """Prompt-keyed caching around chat_text."""
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_deduplicates_calls(self, monkeypatch):
+        from opendocs.agents import llm_client
+
+        monkeypatch.setattr(llm_client, "_TEXT_MEM", llm_client.OrderedDict())
+        calls = []
+
+        async def fake_chat_text(**kwargs):
+            calls.append(kwargs["user"])
+            return "reply"
+
+        monkeypatch.setattr(llm_client, "chat_text", fake_chat_text)
+        first = await llm_client.chat_text_cached(system="s", user="u", model="m")
+        second = await llm_client.chat_text_cached(system="s", user="u", model="m")
+        assert first == second == "reply"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_memory_reset(self, tmp_path, monkeypatch):
+        from opendocs.agents import llm_client
+        from opendocs.agents.llm_client import ResponseCache
+
+        monkeypatch.setattr(llm_client, "_TEXT_MEM", llm_client.OrderedDict())
+        calls = []
+
+        async def fake_chat_text(**kwargs):
+            calls.append(1)
+            return "reply"
+
+        monkeypatch.setattr(llm_client, "chat_text", fake_chat_text)
+        cache = ResponseCache(tmp_path, ttl_seconds=60)
+        await llm_client.chat_text_cached(system="s", user="u", model="m", cache=cache)
+        # A fresh process would start with an empty memory tier
+        monkeypatch.setattr(llm_client, "_TEXT_MEM", llm_client.OrderedDict())
+        again = await llm_client.chat_text_cached(system="s", user="u", model="m", cache=cache)
+        assert again == "reply"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_is_bounded(self, monkeypatch):
+        from opendocs.agents import llm_client
+
+        monkeypatch.setattr(llm_client, "_TEXT_MEM", llm_client.OrderedDict())
+        monkeypatch.setattr(llm_client, "_TEXT_MEM_MAX", 4)
+
+        async def fake_chat_text(**kwargs):
+            return kwargs["user"]
+
+        monkeypatch.setattr(llm_client, "chat_text", fake_chat_text)
+        for i in range(10):
+            await llm_client.chat_text_cached(system="s", user=f"u{i}", model="m")
+        assert len(llm_client._TEXT_MEM) == 4
+
+    @pytest.mark.asyncio
+    async def test_sink_receives_streamed_chunks(self, monkeypatch):
+        import io
+
+        from opendocs.agents import llm_client
+
+        monkeypatch.setattr(llm_client, "_TEXT_MEM", llm_client.OrderedDict())
+
+        async def fake_chat_stream(**kwargs):
+            for chunk in ("## Archi", "tecture", "\n\nBody"):
+                yield chunk
+
+        monkeypatch.setattr(llm_client, "chat_stream", fake_chat_stream)
+        sink = io.StringIO()
+        text = await llm_client.chat_text_cached(system="s", user="u", model="m", sink=sink)
+        assert text == "## Architecture\n\nBody"
+        assert sink.getvalue() == text
+        # A cache hit still feeds the sink
+        sink2 = io.StringIO()
+        again = await llm_client.chat_text_cached(system="s", user="u", model="m", sink=sink2)
+        assert again == text
+        assert sink2.getvalue() == text
+
+
+class TestLLMConcurrencyCap:
+    """Process-wide semaphore around outbound provider calls."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_calls_are_bounded(self, monkeypatch):
+        from opendocs.agents import llm_client
+
+        monkeypatch.setattr(llm_client, "_LLM_SEM", asyncio.Semaphore(2))
+        active = 0
+        peak = 0
+
+        class FakeClient:
+            async def chat(self, system, user):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return "ok"
+
+        monkeypatch.setattr(llm_client, "get_client", lambda *a, **k: FakeClient())
+        await asyncio.gather(*(llm_client.chat_text(system="s", user=f"u{i}") for i in range(6)))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_is_retried(self, monkeypatch):
+        from opendocs.agents import llm_client
+
+        monkeypatch.setattr(llm_client, "_RATE_LIMIT_BASE_DELAY", 0.001)
+        attempts = []
+
+        class FakeClient:
+            async def chat(self, system, user):
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise RuntimeError("429 Too Many Requests")
+                return "ok"
+
+        monkeypatch.setattr(llm_client, "get_client", lambda *a, **k: FakeClient())
+        assert await llm_client.chat_text(system="s", user="u") == "ok"
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self, monkeypatch):
+        from opendocs.agents import llm_client
+
+        class FakeClient:
+            async def chat(self, system, user):
+                raise ValueError("bad request")
+
+        monkeypatch.setattr(llm_client, "get_client", lambda *a, **k: FakeClient())
+        with pytest.raises(ValueError):
+            await llm_client.chat_text(system="s", user="u")
+
+class TestCompactUserPrompt:
+    """Token-efficient user prompt construction."""
+
+    def test_empty_and_na_parts_are_dropped(self):
+        from opendocs.agents.llm_client import compact_user_prompt
+
+        prompt = compact_user_prompt(
+            [("Repository", "shop"), ("Description", ""), ("KG entities", "N/A")],
+            closing="Write the docs.",
+        )
+        assert prompt == "Repository: shop\n\nWrite the docs."
+
+    def test_multiline_value_gets_its_own_block(self):
+        from opendocs.agents.llm_client import compact_user_prompt
+
+        prompt = compact_user_prompt(
+            [("Repository", "shop"), ("Discovered services", "- api\n- worker")],
+        )
+        assert prompt == "Repository: shop\nDiscovered services:\n- api\n- worker"
+
+    @pytest.mark.asyncio
+    async def test_entity_list_trimmed_when_no_components(self, event_driven_profile, monkeypatch):
+        import opendocs.agents.specialized.event_driven_agent as mod
+        from opendocs.agents.llm_client import MAX_KG_ENTITIES_SPARSE
+
+        kg = KnowledgeGraph(
+            entities=[
+                Entity(id=f"e{i}", name=f"Entity{i}", entity_type=EntityType.TECHNOLOGY)
+                for i in range(20)
+            ]
+        )
+        captured = {}
+
+        async def fake_chat(**kwargs):
+            captured["user"] = kwargs["user"]
+            return "section"
+
+        monkeypatch.setattr(mod, "chat_text_cached", fake_chat)
+        agent = EventDrivenAgent()
+        await agent._build_event_section_llm(
+            components=[],
+            repo_profile=event_driven_profile,
+            knowledge_graph=kg,
+        )
+
+        assert "Event components" not in captured["user"]
+        assert captured["user"].count("Entity") == MAX_KG_ENTITIES_SPARSE
+
+class TestBatchedSections:
+    """One multi-section JSON call shared by a concurrent sub-agent group."""
+
+    @pytest.mark.asyncio
+    async def test_build_all_sections_llm_filters_envelope(self, sample_profile, sample_kg, monkeypatch):
+        import opendocs.agents.orchestrator as orch_mod
+        from opendocs.agents.orchestrator import build_all_sections_llm
+
+        captured = {}
+
+        async def fake_chat_json(**kwargs):
+            captured["system"] = kwargs["system"]
+            captured["user"] = kwargs["user"]
+            return {
+                "event_driven": "## Events",
+                "infra": "## Infra",
+                "unrelated": "## Bogus",
+                "ml": 42,
+            }
+
+        monkeypatch.setattr(orch_mod, "chat_json", fake_chat_json)
+        sections = await build_all_sections_llm(
+            repo_profile=sample_profile,
+            knowledge_graph=sample_kg,
+            components_by_agent={
+                AgentRole.EVENT_DRIVEN: [Component("broker", "kafka", "Kafka Cluster")],
+                AgentRole.INFRA: [],
+                AgentRole.ML: [],
+            },
+        )
+
+        assert sections == {"event_driven": "## Events", "infra": "## Infra"}
+        assert '"event_driven"' in captured["system"]
+        assert "Kafka Cluster" in captured["user"]
+
+    @pytest.mark.asyncio
+    async def test_precomputed_section_skips_agent_llm_call(self, event_driven_profile, sample_kg, monkeypatch):
+        import opendocs.agents.specialized.event_driven_agent as mod
+
+        async def boom(**kwargs):
+            raise AssertionError("agent should not make its own LLM call")
+
+        monkeypatch.setattr(mod, "chat_text_cached", boom)
+        agent = EventDrivenAgent()
+        result = await agent.run(
+            repo_profile=event_driven_profile,
+            knowledge_graph=sample_kg,
+            use_llm=True,
+            precomputed_sections={"event_driven": "## Precomputed Events"},
+        )
+
+        assert result.success
+        assert result.artifacts["event_architecture_md"] == "## Precomputed Events"
+
+    def test_agents_expose_component_discovery(self, sample_profile):
+        for cls in (MicroservicesAgent, EventDrivenAgent, MLAgent, DataEngineeringAgent, InfraAgent):
+            components = cls().discover_components(sample_profile)
+            assert all(isinstance(c, Component) for c in components)
+
+class TestTimedResult:
+    """Shared run timing / error capture on AgentBase."""
+
+    @pytest.mark.asyncio
+    async def test_exception_becomes_failed_result(self, microservices_profile, sample_kg, monkeypatch):
+        agent = MicroservicesAgent()
+
+        def boom(profile):
+            raise RuntimeError("scan failed")
+
+        monkeypatch.setattr(agent, "_discover_services", boom)
+        result = await agent.run(
+            repo_profile=microservices_profile,
+            knowledge_graph=sample_kg,
+            use_llm=False,
+        )
+
+        assert not result.success
+        assert result.errors == ["RuntimeError: scan failed"]
+        assert result.duration_ms >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_successful_run_records_duration(self, microservices_profile, sample_kg):
+        agent = MicroservicesAgent()
+        result = await agent.run(
+            repo_profile=microservices_profile,
+            knowledge_graph=sample_kg,
+            use_llm=False,
+        )
+
+        assert result.success
+        assert result.duration_ms > 0.0
+        assert result.metadata["service_count"] == len(result.artifacts["discovered_services"])
+
+class TestJsonDumps:
+    """orjson-backed serialization boundary helpers."""
+
+    def test_dumps_handles_models_and_components(self):
+        import json as stdlib_json
+
+        from opendocs.agents.llm_client import json_dumps
+
+        payload = {
+            "plan": AgentPlan(goal="Document"),
+            "components": [Component("broker", "kafka", "Kafka Cluster")],
+            "section": "## Arch",
+        }
+        data = stdlib_json.loads(json_dumps(payload))
+        assert data["plan"]["goal"] == "Document"
+        assert data["components"][0]["tech"] == "kafka"
+        assert data["section"] == "## Arch"
+
+    def test_save_artifacts_round_trips(self, tmp_path):
+        import json as stdlib_json
+
+        result = OrchestrationResult(
+            enhanced_artifacts={
+                "discovered_services": [Component("docker", "docker", "api", "api/Dockerfile")],
+                "architecture_section_md": "## Architecture",
+            }
+        )
+        out = result.save_artifacts(tmp_path / "artifacts.json")
+        data = stdlib_json.loads(out.read_text(encoding="utf-8"))
+        assert data["discovered_services"][0]["source"] == "api/Dockerfile"
+        assert data["architecture_section_md"] == "## Architecture"
+
+class TestCappedDesc:
+    """Bounded component lists in LLM prompts."""
+
+    def test_under_limit_is_unchanged(self):
+        from opendocs.agents.llm_client import capped_desc
+
+        comps = [Component("docker", "docker", f"svc-{i}") for i in range(3)]
+        desc = capped_desc(comps, lambda c: f"- {c.name}")
+        assert desc == "- svc-0\n- svc-1\n- svc-2"
+
+    def test_overflow_is_noted(self):
+        from opendocs.agents.llm_client import MAX_PROMPT_COMPONENTS, capped_desc
+
+        comps = [Component("terraform-file", "terraform", f"{i}.tf") for i in range(60)]
+        desc = capped_desc(comps, lambda c: f"- {c.name}")
+        lines = desc.split("\n")
+        assert len(lines) == MAX_PROMPT_COMPONENTS + 1
+        assert lines[-1] == "- ... and 10 more"
+
+    def test_comma_separated_overflow(self):
+        from opendocs.agents.llm_client import capped_desc
+
+        comps = [Component("broker", "kafka", f"topic-{i}") for i in range(5)]
+        desc = capped_desc(
+            comps,
+            lambda c: c.name,
+            limit=2,
+            sep=", ",
+            overflow="... and {n} more",
+        )
+        assert desc == "topic-0, topic-1, ... and 3 more"
+
+
+class TestConfluencePublishTree:
+    """Concurrent page-tree publishing in ConfluencePublishTool."""
+
+    @pytest.mark.asyncio
+    async def test_children_fan_out_under_their_parent(self, monkeypatch):
+        from opendocs.agents.tools.publish_tools import ConfluencePublishTool
+
+        tool = ConfluencePublishTool(base_url="https://example.atlassian.net")
+        calls: list[tuple[str, str]] = []
+
+        async def fake_create_or_update(page, parent_id, space_key, counts):
+            calls.append((page["title"], parent_id))
+            counts["created"] += 1
+            return f"id-{page['title']}"
+
+        monkeypatch.setattr(tool, "_create_or_update", fake_create_or_update)
+        tree = {
+            "title": "root",
+            "children": [
+                {"title": "a", "children": [{"title": "a1", "children": []}]},
+                {"title": "b", "children": []},
+            ],
+        }
+        result = await tool.execute(
+            {"page_tree_model": tree, "space_key": "DOCS", "parent_page_id": "home"}
+        )
+        assert result["page_id"] == "id-root"
+        assert result["pages_created"] == 4
+        assert dict(calls) == {
+            "root": "home",
+            "a": "id-root",
+            "a1": "id-a",
+            "b": "id-root",
+        }
+
+    @pytest.mark.asyncio
+    async def test_siblings_overlap_within_the_semaphore(self, monkeypatch):
+        from opendocs.agents.tools.publish_tools import ConfluencePublishTool
+
+        tool = ConfluencePublishTool(base_url="https://example.atlassian.net")
+        in_flight = 0
+        peak = 0
+
+        async def fake_create_or_update(page, parent_id, space_key, counts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"id-{page['title']}"
+
+        monkeypatch.setattr(tool, "_create_or_update", fake_create_or_update)
+        tree = {
+            "title": "root",
+            "children": [{"title": f"child-{i}", "children": []} for i in range(12)],
+        }
+        await tool.execute({"page_tree_model": tree, "space_key": "DOCS"})
+        assert 1 < peak <= tool._MAX_CONCURRENT_PAGES
+
+    @pytest.mark.asyncio
+    async def test_page_lookup_is_cached_per_instance(self):
+        from opendocs.agents.tools.publish_tools import ConfluencePublishTool
+
+        tool = ConfluencePublishTool(base_url="https://example.atlassian.net")
+        tool._exists_cache[("DOCS", "Architecture")] = "12345"
+        assert await tool._get_page_by_title("DOCS", "Architecture") == "12345"
+        assert await tool._get_page_by_title("DOCS", "Unknown") == ""
+
+
+class TestContentAddressedOutputs:
+    """Deterministic output names short-circuit repeat renders."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_chart_request_hits_the_file_cache(self, tmp_path):
+        from opendocs.agents.tools.chart_tools import ChartGenerateTool, _content_key
+
+        tool = ChartGenerateTool(output_dir=tmp_path)
+        params = {"data": {"labels": ["a"], "values": [1]}, "chart_type": "bar", "title": "t"}
+        key = _content_key(params["data"], "bar", "t")
+        rendered = tmp_path / f"chart_{key}.png"
+        rendered.write_bytes(b"png")
+        result = await tool.execute(params)
+        assert result["output_path"] == str(rendered)
+        assert result["cached"] is True
+
+    @pytest.mark.asyncio
+    async def test_repeat_image_request_skips_the_provider(self, tmp_path):
+        from opendocs.agents.tools.chart_tools import _content_key
+        from opendocs.agents.tools.image_tools import ImageGenerateTool
+
+        tool = ImageGenerateTool(output_dir=tmp_path, provider="unsupported")
+        key = _content_key("flat-icon style: a gear", "512x512", "unsupported")
+        (tmp_path / f"img_{key}.png").write_bytes(b"png")
+        # Provider is never consulted on a cache hit, so no error dict.
+        result = await tool.execute({"prompt": "a gear"})
+        assert result["cached"] is True
+        assert result["local_path"].endswith(f"img_{key}.png")
+
+    def test_content_key_is_order_insensitive(self):
+        from opendocs.agents.tools.chart_tools import _content_key
+
+        a = _content_key({"x": 1, "y": 2}, "bar", "t")
+        b = _content_key({"y": 2, "x": 1}, "bar", "t")
+        assert a == b
+
+
+class TestFigmaNodeBatching:
+    """Bulk node creation groups specs into bounded concurrent batches."""
+
+    @pytest.mark.asyncio
+    async def test_nodes_are_chunked_and_order_preserved(self, monkeypatch):
+        from opendocs.agents.tools.figma_tools import FigmaAddNodesTool
+
+        tool = FigmaAddNodesTool()
+        sizes: list[int] = []
+
+        async def fake_post(frame_id, chunk):
+            sizes.append(len(chunk))
+            return [n["id"] for n in chunk]
+
+        monkeypatch.setattr(tool, "_post_node_batch", fake_post)
+        nodes = [{"id": f"n{i}"} for i in range(150)]
+        result = await tool.execute({"frame_id": "f1", "nodes": nodes})
+        assert sorted(sizes, reverse=True) == [64, 64, 22]
+        assert result["node_ids"] == [f"n{i}" for i in range(150)]
+
+
+class TestDiagramPipeRendering:
+    """Graphviz/PlantUML render via stdin pipe with no temp files."""
+
+    @pytest.mark.asyncio
+    async def test_pipe_through_writes_content_addressed_output(self, tmp_path):
+        from opendocs.agents.tools.diagram_tools import DiagramRenderTool
+
+        tool = DiagramRenderTool(output_dir=tmp_path)
+        # `cat` stands in for a renderer CLI: stdin in, "image" out.
+        result = await tool._pipe_through(["cat"], "graphviz", "digraph { a -> b }", "svg")
+        out = Path(result["output_path"])
+        assert out.read_text() == "digraph { a -> b }"
+        assert out.name.startswith("diagram_") and out.suffix == ".svg"
+        # Second render of the same spec reuses the file.
+        again = await tool._pipe_through(["cat"], "graphviz", "digraph { a -> b }", "svg")
+        assert again["output_path"] == result["output_path"]
+
+    @pytest.mark.asyncio
+    async def test_missing_cli_reports_an_error(self, tmp_path):
+        from opendocs.agents.tools.diagram_tools import DiagramRenderTool
+
+        tool = DiagramRenderTool(output_dir=tmp_path)
+        result = await tool._pipe_through(["definitely-not-a-binary"], "graphviz", "x", "svg")
+        assert result["output_path"] == ""
+        assert "not found" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_repeat_image_request_memoizes_in_process(self, tmp_path):
+        from opendocs.agents.tools.chart_tools import _content_key
+        from opendocs.agents.tools.image_tools import ImageGenerateTool
+
+        tool = ImageGenerateTool(output_dir=tmp_path, provider="unsupported")
+        key = _content_key("flat-icon style: a gear", "512x512", "unsupported")
+        (tmp_path / f"img_{key}.png").write_bytes(b"png")
+        first = await tool.execute({"prompt": "a gear"})
+        second = await tool.execute({"prompt": "a gear"})
+        assert second is first  # memo hit, not a rebuilt dict
+
+
+class TestRepoSearchTool:
+    """repo.search over a scratch repo tree."""
+
+    @pytest.mark.asyncio
+    async def test_search_finds_matches_with_evidence(self, tmp_path):
+        from opendocs.agents.tools.repo_tools import RepoSearchTool
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("import fastapi\napp = fastapi.FastAPI()\n")
+        (tmp_path / "README.md").write_text("A FastAPI service\n")
+        tool = RepoSearchTool(tmp_path)
+        result = await tool.execute({"query": "fastapi", "file_pattern": "**/*.py"})
+        assert result["total"] == 2
+        assert result["matches"][0]["path"] == str(Path("src") / "app.py")
+        assert result["matches"][0]["line"] == 1
+        assert result["evidence_pointers"][0]["snippet"] == "import fastapi"
+
+    @pytest.mark.asyncio
+    async def test_max_results_caps_the_scan(self, tmp_path):
+        from opendocs.agents.tools.repo_tools import RepoSearchTool
+
+        (tmp_path / "many.txt").write_text("hit\n" * 50)
+        tool = RepoSearchTool(tmp_path)
+        result = await tool.execute({"query": "hit", "max_results": 5})
+        assert result["total"] == 5
+
+    def test_required_literal_picks_the_longest_safe_token(self):
+        from opendocs.agents.tools.repo_tools import RepoSearchTool
+
+        assert RepoSearchTool._required_literal(r"def \w+_handler") == "_handler"
+        assert RepoSearchTool._required_literal(r"colou?r") == "colo"
+        # Alternation and groups can make any token optional.
+        assert RepoSearchTool._required_literal(r"foo|bar") == ""
+        assert RepoSearchTool._required_literal(r"(foo)bar") == ""
+
+
+class TestRepoDiffTool:
+    """repo.diff against a scratch git repo."""
+
+    @pytest.fixture
+    def scratch_repo(self, tmp_path):
+        import subprocess
+
+        def git(*args):
+            subprocess.run(
+                ["git", *args],
+                cwd=tmp_path,
+                check=True,
+                capture_output=True,
+                env={
+                    "GIT_AUTHOR_NAME": "t",
+                    "GIT_AUTHOR_EMAIL": "t@t",
+                    "GIT_COMMITTER_NAME": "t",
+                    "GIT_COMMITTER_EMAIL": "t@t",
+                    "PATH": "/usr/bin:/bin",
+                },
+            )
+
+        git("init", "-q")
+        (tmp_path / "a.py").write_text("one\n")
+        git("add", "a.py")
+        git("commit", "-q", "-m", "first")
+        (tmp_path / "a.py").write_text("one\ntwo\nthree\n")
+        git("add", "a.py")
+        git("commit", "-q", "-m", "second")
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_diff_reports_per_file_counts(self, scratch_repo):
+        from opendocs.agents.tools.repo_tools import RepoDiffTool
+
+        tool = RepoDiffTool(scratch_repo)
+        result = await tool.execute({"ref1": "HEAD~1", "ref2": "HEAD"})
+        assert result["files_changed"] == [{"path": "a.py", "additions": 2, "deletions": 0}]
+        assert result["additions"] == 2
+        assert "a.py" in result["summary"]
+
+    @pytest.mark.asyncio
+    async def test_bad_ref_surfaces_an_error(self, scratch_repo):
+        from opendocs.agents.tools.repo_tools import RepoDiffTool
+
+        tool = RepoDiffTool(scratch_repo)
+        result = await tool.execute({"ref1": "no-such-ref"})
+        assert result["files_changed"] == []
+        assert result["error"]
+
+    @pytest.mark.asyncio
+    async def test_repeat_diff_is_served_from_cache(self, scratch_repo, monkeypatch):
+        from opendocs.agents.tools.repo_tools import RepoDiffTool
+
+        tool = RepoDiffTool(scratch_repo)
+        first = await tool.execute({"ref1": "HEAD~1", "ref2": "HEAD"})
+        git_calls: list[tuple] = []
+        real_git = tool._git
+
+        async def counting_git(*args, **kwargs):
+            git_calls.append(args)
+            return await real_git(*args, **kwargs)
+
+        monkeypatch.setattr(tool, "_git", counting_git)
+        second = await tool.execute({"ref1": "HEAD~1", "ref2": "HEAD"})
+        assert second is first
+        # Only the HEAD resolution runs on a hit — no diff subprocesses.
+        assert git_calls == [("rev-parse", "HEAD")]
+
+
+class TestRepoReadTool:
+    """repo.read line-range slicing."""
+
+    @pytest.mark.asyncio
+    async def test_range_matches_whole_file_slicing(self, tmp_path):
+        from opendocs.agents.tools.repo_tools import RepoReadTool
+
+        text = "\n".join(f"line {i}" for i in range(1, 21)) + "\n"
+        (tmp_path / "f.py").write_text(text)
+        tool = RepoReadTool(tmp_path)
+        result = await tool.execute({"path": "f.py", "start_line": 3, "end_line": 7})
+        assert result["content"] == "\n".join(text.splitlines()[2:7])
+        assert result["evidence_pointer"]["line_start"] == 3
+
+    @pytest.mark.asyncio
+    async def test_range_past_eof_is_empty(self, tmp_path):
+        from opendocs.agents.tools.repo_tools import RepoReadTool
+
+        (tmp_path / "f.py").write_text("only\n")
+        tool = RepoReadTool(tmp_path)
+        result = await tool.execute({"path": "f.py", "start_line": 5, "end_line": 9})
+        assert result["content"] == ""
+
+    @pytest.mark.asyncio
+    async def test_line_index_is_reused_across_reads(self, tmp_path, monkeypatch):
+        from opendocs.agents.tools.repo_tools import RepoReadTool
+
+        (tmp_path / "f.py").write_text("a\nb\nc\nd\n")
+        tool = RepoReadTool(tmp_path)
+        await tool.execute({"path": "f.py", "start_line": 1, "end_line": 2})
+        assert len(tool._line_index) == 1
+
+        def boom(mm):
+            raise AssertionError("rescan on a warm index")
+
+        monkeypatch.setattr(tool, "_index_lines", boom)
+        result = await tool.execute({"path": "f.py", "start_line": 2, "end_line": 3})
+        assert result["content"] == "b\nc"
+
+    @pytest.mark.asyncio
+    async def test_repeat_read_is_served_from_cache(self, tmp_path, monkeypatch):
+        from opendocs.agents.tools.repo_tools import RepoReadTool
+
+        (tmp_path / "f.py").write_text("a\nb\nc\n")
+        tool = RepoReadTool(tmp_path)
+        await tool.execute({"path": "f.py", "start_line": 1, "end_line": 2})
+
+        def boom(*args, **kwargs):
+            raise AssertionError("reopened on a warm cache")
+
+        monkeypatch.setattr(tool, "_read_range", boom)
+        result = await tool.execute({"path": "f.py", "start_line": 1, "end_line": 2})
+        assert result["content"] == "a\nb"
+
+    @pytest.mark.asyncio
+    async def test_edited_file_misses_the_cache(self, tmp_path):
+        from opendocs.agents.tools.repo_tools import RepoReadTool
+
+        f = tmp_path / "f.py"
+        f.write_text("old\n")
+        tool = RepoReadTool(tmp_path)
+        assert (await tool.execute({"path": "f.py"}))["content"] == "old\n"
+        f.write_text("new!\n")
+        assert (await tool.execute({"path": "f.py"}))["content"] == "new!\n"
+
+
+class TestRepoSummarizeTool:
+    """Bounded scandir walk behind repo.summarize's directory mode."""
+
+    @pytest.mark.asyncio
+    async def test_directory_listing_skips_vendored_dirs(self, tmp_path):
+        from opendocs.agents.tools.repo_tools import RepoSummarizeTool
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("x")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("y")
+
+        tool = RepoSummarizeTool(tmp_path)
+        result = await tool.execute({"path": "."})
+        assert "a.py" in result["summary"]
+        assert "HEAD" not in result["summary"]
+        assert "dep.js" not in result["summary"]
+        assert result["evidence_pointer"]["source_path"] == "."
+
+    def test_walk_stops_at_the_entry_bound(self, tmp_path):
+        from opendocs.agents.tools.repo_tools import RepoSummarizeTool
+
+        for i in range(20):
+            (tmp_path / f"f{i}.txt").write_text("x")
+        entries = list(RepoSummarizeTool._walk_dir(tmp_path, max_entries=5))
+        assert len(entries) == 5
+
+
+class TestRepoReadBatchTool:
+    """repo.read_batch — N reads per dispatch, shared reader caches."""
+
+    @pytest.mark.asyncio
+    async def test_batch_returns_results_in_request_order(self, tmp_path):
+        from opendocs.agents.tools.repo_tools import RepoReadBatchTool
+
+        (tmp_path / "a.py").write_text("one\ntwo\n")
+        (tmp_path / "b.py").write_text("three\n")
+        tool = RepoReadBatchTool(tmp_path)
+        result = await tool.execute(
+            {
+                "reads": [
+                    {"path": "a.py", "start_line": 1, "end_line": 1},
+                    {"path": "b.py"},
+                    {"path": "missing.py"},
+                ]
+            }
+        )
+        assert result["total"] == 3
+        assert result["results"][0]["content"] == "one"
+        assert result["results"][1]["content"] == "three\n"
+        assert "error" in result["results"][2]
+        # The missing file contributes no pointer.
+        assert len(result["evidence_pointers"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_shares_the_reader_cache(self, tmp_path):
+        from opendocs.agents.tools.repo_tools import RepoReadBatchTool
+
+        (tmp_path / "a.py").write_text("x\n")
+        tool = RepoReadBatchTool(tmp_path)
+        await tool.execute({"reads": [{"path": "a.py"}]})
+        assert len(tool._reader._content_cache) == 1
+
+    def test_contract_is_registered(self):
+        from opendocs.agents.tools.contracts import TOOL_REGISTRY
+
+        assert "repo.read_batch" in TOOL_REGISTRY
+        assert TOOL_REGISTRY["repo.read_batch"].param_names == ("reads",)
+
+
+class TestRepoReadGuards:
+    """Binary sniff and content cap on repo.read."""
+
+    @pytest.mark.asyncio
+    async def test_binary_file_is_rejected_without_decoding(self, tmp_path):
+        from opendocs.agents.tools.repo_tools import RepoReadTool
+
+        (tmp_path / "blob.bin").write_bytes(b"\x89PNG\x00\x00" + b"\xff" * 64)
+        tool = RepoReadTool(tmp_path)
+        result = await tool.execute({"path": "blob.bin"})
+        assert result["error"] == "Binary file: blob.bin"
+        ranged = await tool.execute({"path": "blob.bin", "start_line": 1, "end_line": 1})
+        assert "Binary file" in ranged["error"]
+
+    @pytest.mark.asyncio
+    async def test_oversized_content_is_capped(self, tmp_path, monkeypatch):
+        from opendocs.agents.tools.repo_tools import RepoReadTool
+
+        monkeypatch.setenv("OPENDOCS_REPO_READ_MAX_CHARS", "10")
+        (tmp_path / "big.txt").write_text("x" * 100)
+        tool = RepoReadTool(tmp_path)
+        result = await tool.execute({"path": "big.txt"})
+        assert result["content"] == "x" * 10
+        assert result["truncated"] is True
+
+        (tmp_path / "small.txt").write_text("ok\n")
+        result = await tool.execute({"path": "small.txt"})
+        assert result["truncated"] is False
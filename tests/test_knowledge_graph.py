@@ -154,3 +154,10 @@ class TestKnowledgeGraph:
         assert len(sample_kg.entities) == 5
         assert len(sample_kg.relations) == 4
         assert sample_kg.get_entity("tech-docker") is not None
+
+    def test_from_trusted_round_trip(self, sample_kg: KnowledgeGraph):
+        restored = KnowledgeGraph.from_trusted(sample_kg.model_dump(mode="json"))
+        assert len(restored.entities) == 4
+        assert restored.entities[0].entity_type == EntityType.PROJECT
+        assert restored.get_entity("tech-python") is not None
+        assert len(restored.relations_from("proj-1")) == 3